@@ -1,14 +1,21 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 import pandas as pd
 
-from src.backtest.simulation_engine import run_simulation
+from src.backtest.data_plane import create_data_plane, destroy_data_plane, publish_dataframe, attach_dataframe
+from src.backtest.result_cache import create_result_cache
+from src.indicators.feature_store import create_feature_store
+from src.backtest.simulation_engine import run_simulation, run_simulation_batch, run_simulation_risk_grid
+from src.commons.constants.constants import SimulationEngine
 from src.market_data.historical_data import fetch_and_store_historical
-from src.utils.backtest_util import construct_strategy_param_grid, construct_strategy_hyperparam_str
-from src.utils.file_util import read_config, get_next_simulation_dir, save_df_to_csv, get_plots_dir
+from src.utils.backtest_util import construct_strategy_param_grid, construct_strategy_hyperparam_str, \
+    construct_risk_param_grid
+from src.utils.file_util import read_config, get_next_simulation_dir, save_df_to_csv, get_plots_dir, \
+    BACKTEST_CACHE_DIR, FEATURE_STORE_DIR
 from src.utils.kite_client_util import normalize_interval
-from src.utils.logger_util import log_backtest_run_header
+from src.utils.logger_util import log_backtest_run_header, log_backtest_batch_header
 from src.utils.visualization_util import plot_equity_curve, plot_drawdown, plot_daily_returns, plot_monthly_returns, \
     plot_heatmap_metrics, plot_histogram_returns, plot_rolling_sharpe
 
@@ -16,9 +23,13 @@ CONFIG_PATH = "config/config.yaml"
 BACKTEST_CONFIG_PATH = "config/backtest-config.yaml"
 
 
+def get_historical_data_path(trading_symbol, interval_key):
+    return f"data/historical/{trading_symbol}_{interval_key}.csv"
+
+
 def load_or_fetch_data(trading_symbol, interval_key, from_date, to_date):
     print(f"\n=====================================================================================")
-    filename = f"data/historical/{trading_symbol}_{interval_key}.csv"
+    filename = get_historical_data_path(trading_symbol, interval_key)
     df = pd.DataFrame()
 
     if os.path.exists(filename):
@@ -55,58 +66,140 @@ def main():
     to_date = data_cfg['to_date']
 
     train_split = simulation_params.get('train_split', 1.0)
-    initial_capital = simulation_params.get('initial_capital', 1000000)
-    stop_loss_pct = simulation_params.get('stop_loss_pct', 0.02)
-    trailing_stop_loss_pct = simulation_params.get('trailing_stop_loss_pct', 0.02)
-    target_profit_pct = simulation_params.get('target_profit_pct', 0.04)
-    hold_min_bars = simulation_params.get('hold_min_bars', 2)
-    hold_max_bars = simulation_params.get('hold_max_bars', 120)
-    contract_size = simulation_params.get('contract_size', 1)
-    fill_rate = simulation_params.get('fill_rate', 1.0)
-    slippage_pct = simulation_params.get('slippage_pct', 0.001)
-    intraday_only = simulation_params.get('intraday_only', True)
-
     brokerage_cfg = config['brokerage']
-    segment = brokerage_cfg.get('segment')
-    exchange = brokerage_cfg.get('exchange')
+    simulation_kwargs = dict(
+        initial_capital=simulation_params.get('initial_capital', 1000000),
+        stop_loss_pct=simulation_params.get('stop_loss_pct', 0.02),
+        trailing_stop_loss_pct=simulation_params.get('trailing_stop_loss_pct', 0.02),
+        target_profit_pct=simulation_params.get('target_profit_pct', 0.04),
+        contract_size=simulation_params.get('contract_size', 1),
+        hold_min_bars=simulation_params.get('hold_min_bars', 2),
+        hold_max_bars=simulation_params.get('hold_max_bars', 120),
+        fill_rate=simulation_params.get('fill_rate', 1.0),
+        slippage_pct=simulation_params.get('slippage_pct', 0.001),
+        segment=brokerage_cfg.get('segment'),
+        exchange=brokerage_cfg.get('exchange'),
+        train_split=train_split,
+        intraday_only=simulation_params.get('intraday_only', True),
+        debug_logs_flag=debug_logs_flag,
+        save_results=True,
+        engine=simulation_params.get('engine', SimulationEngine.PANDAS.value),
+    )
+    batch_grid = simulation_params.get('batch_grid', False)
+
+    # Risk-grid mode: any risk param given as <key>_list is swept, reusing each strategy combo's signals
+    risk_param_grid = construct_risk_param_grid(simulation_params, simulation_kwargs)
+    if risk_param_grid:
+        print(f"🎚️ Sweeping {len(risk_param_grid)} risk param sets per strategy param set")
+
+    # Results of (data, params) combos already simulated by an earlier run are loaded instead of recomputed
+    result_cache_cfg = backtest_cfg.get('result_cache', {})
+    result_cache_enabled = result_cache_cfg.get('enabled', False)
+    result_cache_dir = result_cache_cfg.get('dir', BACKTEST_CACHE_DIR)
+    # Signals are kept once in the feature store; sim dirs get references to them instead of feature CSV copies
+    feature_store_cfg = backtest_cfg.get('feature_store', {})
+    feature_store_enabled = feature_store_cfg.get('enabled', False)
+    feature_store_dir = feature_store_cfg.get('dir', FEATURE_STORE_DIR)
+
+    parallel_cfg = backtest_cfg.get('parallel', {})
+    executor = None
+    data_plane_dir = None
+    if parallel_cfg.get('enabled', False):
+        max_workers = parallel_cfg.get('workers') or os.cpu_count()
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        data_plane_dir = create_data_plane()
+        print(f"🧵 Running grid jobs in parallel on {max_workers} worker processes")
 
     sim_dir = get_next_simulation_dir()
     print(f"📁 Saving simulation results to: {sim_dir}")
+    simulation_kwargs['sim_dir'] = sim_dir
 
     summary_metrics = []
+    pending_jobs = []  # (trading_symbol, interval_key, future) in serial loop order
+
+    try:
+        for trading_symbol in trading_symbols:
+            for interval in intervals:
+                interval_key = normalize_interval(interval)
+                df = load_or_fetch_data(trading_symbol, interval_key, from_date, to_date)
+
+                if df.empty:
+                    continue
+
+                df.sort_values('date', inplace=True)
+                df.reset_index(drop=True, inplace=True)
+                # Workers attach to one shared copy of the series instead of each receiving a pickled DataFrame
+                data_handle = None
+                if data_plane_dir is not None:
+                    data_handle = publish_dataframe(df, data_plane_dir, f"{trading_symbol}_{interval_key}")
+                result_cache = create_result_cache(df, result_cache_dir) if result_cache_enabled else None
+                feature_store = None
+                if feature_store_enabled:
+                    feature_store = create_feature_store(df, feature_store_dir,
+                                                         get_historical_data_path(trading_symbol, interval_key))
 
-    for trading_symbol in trading_symbols:
-        for interval in intervals:
-            interval_key = normalize_interval(interval)
-            df = load_or_fetch_data(trading_symbol, interval_key, from_date, to_date)
+                # NOTE: The strategy engine is designed to work only on a single strategy each time for a particular df.
+                # With batch_grid all param sets of that strategy's grid are simulated together in one job.
+                for strategy in strategies:
+                    strategy_param_grid = construct_strategy_param_grid(strategy)
+                    if batch_grid:
+                        if not strategy_param_grid:
+                            continue
+                        if executor is not None:
+                            future = executor.submit(run_backtest_batch_job, data_handle, trading_symbol, interval,
+                                                     interval_key, strategy_param_grid, simulation_kwargs,
+                                                     risk_param_grid, result_cache, feature_store)
+                            pending_jobs.append((trading_symbol, interval_key, future))
+                            continue
 
-            if df.empty:
-                continue
+                        log_backtest_batch_header(trading_symbol, interval, strategy_param_grid[0]['name'],
+                                                  len(strategy_param_grid))
+                        for trades, metrics, equity_curve in run_simulation_batch(
+                                df, strategy_param_grid, trading_symbol=trading_symbol, interval=interval_key,
+                                risk_param_grid=risk_param_grid, result_cache=result_cache,
+                                feature_store=feature_store, **batch_simulation_kwargs(simulation_kwargs)
+                        ):
+                            add_summary_metrics(summary_metrics, metrics, trading_symbol, interval_key)
+                        continue
 
-            df.sort_values('date', inplace=True)
-            df.reset_index(drop=True, inplace=True)
+                    for strategy_params in strategy_param_grid:
+                        if executor is not None:
+                            future = executor.submit(run_backtest_job, data_handle, trading_symbol, interval,
+                                                     interval_key, strategy_params, simulation_kwargs, risk_param_grid,
+                                                     result_cache, feature_store)
+                            pending_jobs.append((trading_symbol, interval_key, future))
+                            continue
 
-            # NOTE: The strategy engine is designed to work only on a single strategy each time for a particular df.
-            for strategy in strategies:
-                for strategy_params in construct_strategy_param_grid(strategy):
-                    log_backtest_run_header(trading_symbol, interval, strategy_params)
+                        log_backtest_run_header(trading_symbol, interval, strategy_params)
 
-                    trades, metrics, equity_curve = run_simulation(
-                        df, strategy_params, initial_capital, stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
-                        contract_size, hold_min_bars, hold_max_bars, fill_rate, slippage_pct, segment, exchange,
-                        train_split, intraday_only, debug_logs_flag=debug_logs_flag, save_results=True,
-                        trading_symbol=trading_symbol, interval=interval_key, sim_dir=sim_dir
-                    )
+                        if risk_param_grid:
+                            for trades, metrics, equity_curve in run_simulation_risk_grid(
+                                    df, strategy_params, risk_param_grid, trading_symbol=trading_symbol,
+                                    interval=interval_key, result_cache=result_cache, feature_store=feature_store,
+                                    **simulation_kwargs
+                            ):
+                                add_summary_metrics(summary_metrics, metrics, trading_symbol, interval_key)
+                            continue
 
-                    # Save summary metrics for all splits (ALL/TRAIN/TEST)
-                    for metric in metrics:
-                        metric.update(dict(token=trading_symbol, interval=interval_key))
-                        summary_metrics.append(metric)
+                        trades, metrics, equity_curve = run_simulation(
+                            df, strategy_params, trading_symbol=trading_symbol, interval=interval_key,
+                            result_cache=result_cache, feature_store=feature_store, **simulation_kwargs
+                        )
+                        add_summary_metrics(summary_metrics, metrics, trading_symbol, interval_key)
 
-                    # TODO - Generate visualization plots (temporarily commented out)
-                    # if equity_curve:
-                    #     add_visualizations(trading_symbol, interval, sim_dir, strategy_params, equity_curve,
-                    #                        trades=trades, df=df)
+                        # TODO - Generate visualization plots (temporarily commented out)
+                        # if equity_curve:
+                        #     add_visualizations(trading_symbol, interval, sim_dir, strategy_params, equity_curve,
+                        #                        trades=trades, df=df)
+
+        if executor is not None:
+            # Collect in submission order so metrics_summary.csv matches a serial run row for row
+            for trading_symbol, interval_key, future in pending_jobs:
+                add_summary_metrics(summary_metrics, future.result(), trading_symbol, interval_key)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+            destroy_data_plane(data_plane_dir)
 
     # Save all metrics summary
     if summary_metrics:
@@ -132,7 +225,50 @@ def main():
     print(f"=====================================================================================\n")
 
 
+def run_backtest_job(data_handle, trading_symbol, interval, interval_key, strategy_params, simulation_kwargs,
+                     risk_param_grid=None, result_cache=None, feature_store=None):
+    """Runs a single (symbol, interval, strategy_params) grid point in a worker process. Only metrics are sent back."""
+    df = attach_dataframe(data_handle)
+    log_backtest_run_header(trading_symbol, interval, strategy_params)
+    if risk_param_grid:
+        results = run_simulation_risk_grid(
+            df, strategy_params, risk_param_grid, trading_symbol=trading_symbol, interval=interval_key,
+            result_cache=result_cache, feature_store=feature_store, **simulation_kwargs
+        )
+        return [metric for _, metrics, _ in results for metric in metrics]
+    _, metrics, _ = run_simulation(
+        df, strategy_params, trading_symbol=trading_symbol, interval=interval_key, result_cache=result_cache,
+        feature_store=feature_store, **simulation_kwargs
+    )
+    return metrics
+
+
+def run_backtest_batch_job(data_handle, trading_symbol, interval, interval_key, strategy_param_grid,
+                           simulation_kwargs, risk_param_grid=None, result_cache=None, feature_store=None):
+    """Runs one strategy's whole grid through the batch engine in a worker process. Returns all metrics, grid order."""
+    df = attach_dataframe(data_handle)
+    log_backtest_batch_header(trading_symbol, interval, strategy_param_grid[0]['name'], len(strategy_param_grid))
+    results = run_simulation_batch(
+        df, strategy_param_grid, trading_symbol=trading_symbol, interval=interval_key,
+        risk_param_grid=risk_param_grid, result_cache=result_cache, feature_store=feature_store,
+        **batch_simulation_kwargs(simulation_kwargs)
+    )
+    return [metric for _, metrics, _ in results for metric in metrics]
+
+
+def batch_simulation_kwargs(simulation_kwargs):
+    return {key: value for key, value in simulation_kwargs.items() if key != 'engine'}
+
+
+def add_summary_metrics(summary_metrics, metrics, trading_symbol, interval_key):
+    # Save summary metrics for all splits (ALL/TRAIN/TEST)
+    for metric in metrics:
+        metric.update(dict(token=trading_symbol, interval=interval_key))
+        summary_metrics.append(metric)
+
+
 def add_visualizations(trading_symbol, interval, sim_dir, strategy_params, equity_curve, trades, df):
+    equity_curve = equity_curve.to_frame()
     plot_dir = get_plots_dir(sim_dir)
     hyperparam_str = construct_strategy_hyperparam_str(strategy_params)
     prefix = f"{trading_symbol}_{interval}_{strategy_params['name']}_{hyperparam_str}"
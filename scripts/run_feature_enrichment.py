@@ -1,8 +1,17 @@
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
 
+import numpy as np
 import pandas as pd
-from src.indicators.feature_enricher import apply_indicators
-from src.utils.file_util import save_df_to_csv, HISTORICAL_DATA_DIR, FEATURE_DATA_DIR
+from src.indicators.feature_enricher import apply_indicators, apply_indicators_from, INDICATOR_CONFIG_PATH
+from src.utils.file_util import save_df_to_csv_atomic, append_df_to_csv_atomic, HISTORICAL_DATA_DIR, FEATURE_DATA_DIR, \
+    read_config, read_json, write_json_atomic, compute_file_hash, compute_config_hash, read_csv_tail
+
+ENRICHMENT_MANIFEST_PATH = os.path.join(FEATURE_DATA_DIR, "enrichment_manifest.json")
+OVERLAP_BARS = 50  # stored feature rows recomputed and compared before appending
+OVERLAP_RTOL = 1e-6
+OVERLAP_ATOL = 1e-6
 
 
 def perform_file_enrichment(filename):
@@ -18,12 +27,83 @@ def perform_file_enrichment(filename):
     df.reset_index(drop=True, inplace=True)
 
     # Save feature enriched file
-    name, ext = os.path.splitext(filename)
-    feature_filename = f"{name}_feat{ext}"
-    enriched_output_path = os.path.join(FEATURE_DATA_DIR, feature_filename)
-    save_df_to_csv(df, enriched_output_path)
+    enriched_output_path = get_enriched_output_path(filename)
+    save_df_to_csv_atomic(df, enriched_output_path)
 
     print(f"Saved enriched features to: {enriched_output_path}")
+    return enriched_output_path
+
+
+def perform_incremental_file_enrichment(filename, overlap_bars=OVERLAP_BARS, rtol=OVERLAP_RTOL, atol=OVERLAP_ATOL):
+    """
+    Appends the features of candles added to a historical file since its last enrichment, recomputing only the
+    indicator warm-up bars, the last overlap_bars stored rows and the new bars. The recomputed overlap rows must match
+    the stored ones (within rtol/atol), otherwise the whole file is recomputed with perform_file_enrichment.
+    """
+    file_path = os.path.join(HISTORICAL_DATA_DIR, filename)
+    enriched_output_path = get_enriched_output_path(filename)
+    df = pd.read_csv(file_path)
+    print(f"Incrementally processing historical data file: {file_path}")
+
+    try:
+        stored = read_csv_tail(enriched_output_path, overlap_bars)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Cannot read the stored features of {filename} ({e}), recomputing the full history")
+        return perform_file_enrichment(filename)
+
+    # Positions of the stored overlap rows in the history, matched by candle date
+    dates = pd.Index(df['date'].astype(str))
+    positions = None
+    if len(stored) and 'date' in stored.columns and dates.is_unique:
+        positions = dates.get_indexer(stored['date'].astype(str))
+    if positions is None or (positions < 0).any():
+        print(f"⚠️ Stored features of {filename} do not line up with its history, recomputing the full history")
+        return perform_file_enrichment(filename)
+
+    last_stored = positions[-1]
+    new_bars = len(df) - 1 - last_stored
+    if new_bars == 0:
+        print(f"Features already up to date: {enriched_output_path}")
+        return enriched_output_path
+
+    # Feature enrichment of the overlap and the new bars
+    enriched = apply_indicators_from(df, positions[0])
+
+    # Dataframe cleanup
+    enriched = enriched.dropna()
+
+    with open(enriched_output_path, "r") as file:
+        stored_header = file.readline()
+    overlap = enriched.loc[:last_stored]
+    # Compare headers as written: read_csv renames duplicated column names (e.g. EMA_FAST of EMA_CROSS and MACD)
+    if enriched.iloc[:0].to_csv(index=False) != stored_header or not overlap_matches(overlap, stored, rtol, atol):
+        print(f"⚠️ Recomputed overlap of {filename} differs from the stored features, recomputing the full history")
+        return perform_file_enrichment(filename)
+
+    appended = enriched.loc[last_stored + 1:]
+    append_df_to_csv_atomic(appended, enriched_output_path)
+    print(f"Appended {len(appended)} rows for {new_bars} new bars to: {enriched_output_path}")
+    return enriched_output_path
+
+
+def overlap_matches(recomputed, stored, rtol, atol):
+    """Column by column (by position), numbers within rtol/atol and everything else as equal text."""
+    if recomputed.shape != stored.shape:
+        return False
+    for position in range(stored.shape[1]):
+        expected = stored.iloc[:, position].to_numpy()
+        actual = recomputed.iloc[:, position].to_numpy()
+        if expected.dtype.kind in 'biuf' and actual.dtype.kind in 'biuf':
+            if not np.allclose(actual.astype(np.float64), expected.astype(np.float64), rtol=rtol, atol=atol):
+                return False
+        elif not (actual.astype(str) == expected.astype(str)).all():
+            return False
+    return True
+
+
+def get_enriched_output_path(filename):
+    name, ext = os.path.splitext(filename)
+    return os.path.join(FEATURE_DATA_DIR, f"{name}_feat{ext}")
 
 
 def single_file_enrichment():
@@ -36,6 +116,79 @@ def multi_files_enrichment():
         perform_file_enrichment(filename)
 
 
+def parallel_files_enrichment(max_workers=None, force=False):
+    """
+    Enriches every historical CSV on a process pool. A file is skipped when its content hash and the indicator config
+    hash both match the manifest entry of its last successful enrichment and its output still exists. With
+    `incremental` enabled, a file that was only appended to since then (its first input_size bytes still hash to
+    input_hash) gets only its new bars enriched by perform_incremental_file_enrichment.
+    The manifest is only written by this (parent) process, after each file finishes.
+    """
+    start_time = datetime.now()
+    indicator_config = read_config(INDICATOR_CONFIG_PATH)
+    pipeline_cfg = indicator_config.get('enrichment_pipeline', {})
+    max_workers = max_workers or pipeline_cfg.get('workers') or os.cpu_count()
+    skip_unchanged = pipeline_cfg.get('skip_unchanged', True) and not force
+    incremental = pipeline_cfg.get('incremental', False) and not force
+    overlap_args = (pipeline_cfg.get('overlap_bars', OVERLAP_BARS), pipeline_cfg.get('overlap_rtol', OVERLAP_RTOL),
+                    pipeline_cfg.get('overlap_atol', OVERLAP_ATOL))
+
+    # Pool and logging settings do not change the features, so they do not invalidate earlier outputs
+    config_hash = compute_config_hash({key: value for key, value in indicator_config.items()
+                                       if key not in ('enrichment_pipeline', 'debug_logs')})
+    manifest = read_json(ENRICHMENT_MANIFEST_PATH, default={})
+
+    pending = {}  # filename -> (input hash, input size)
+    appended = set()
+    skipped = 0
+    for filename in sorted(os.listdir(HISTORICAL_DATA_DIR)):
+        if not filename.endswith(".csv"):
+            continue
+        input_path = os.path.join(HISTORICAL_DATA_DIR, filename)
+        input_size = os.path.getsize(input_path)
+        input_hash = compute_file_hash(input_path)
+        entry = manifest.get(filename, {})
+        output_exists = os.path.exists(get_enriched_output_path(filename))
+        if (skip_unchanged and entry.get('input_hash') == input_hash and entry.get('config_hash') == config_hash
+                and output_exists):
+            skipped += 1
+            continue
+        if (incremental and entry.get('config_hash') == config_hash and output_exists
+                and 0 < entry.get('input_size', 0) < input_size
+                and compute_file_hash(input_path, size=entry['input_size']) == entry.get('input_hash')):
+            appended.add(filename)
+        pending[filename] = (input_hash, input_size)
+
+    print(f"🧵 Enriching {len(pending)} files on {max_workers} worker processes ({len(appended)} incrementally, "
+          f"{skipped} unchanged, skipped)")
+    failed = 0
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for filename in pending:
+            if filename in appended:
+                future = executor.submit(perform_incremental_file_enrichment, filename, *overlap_args)
+            else:
+                future = executor.submit(perform_file_enrichment, filename)
+            futures[future] = filename
+        for future in as_completed(futures):
+            filename = futures[future]
+            try:
+                output_path = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"❌ Enrichment failed for {filename}: {e}")
+                continue
+            input_hash, input_size = pending[filename]
+            manifest[filename] = dict(input_hash=input_hash, input_size=input_size, config_hash=config_hash,
+                                      output=output_path, enriched_at=datetime.now().isoformat(timespec='seconds'))
+            write_json_atomic(manifest, ENRICHMENT_MANIFEST_PATH)
+
+    duration = datetime.now() - start_time
+    print(f"✅ Enriched {len(pending) - failed} files, {skipped} skipped, {failed} failed "
+          f"in {str(duration).split('.')[0]} (hh:mm:ss)")
+
+
 if __name__ == "__main__":
     single_file_enrichment() # We can use this function for simple testing
     # multi_files_enrichment()
+    # parallel_files_enrichment()
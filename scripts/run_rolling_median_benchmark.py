@@ -0,0 +1,46 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.indicators.kernels import RollingMedian, rolling_median_kernel
+
+N_BARS = 250_000  # about 2.5 years of minute bars
+WINDOWS = [7, 14, 30, 60]
+
+
+def time_call(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def benchmark_rolling_median(n_bars=N_BARS, windows=WINDOWS, seed=42):
+    """
+    Compares the pandas rolling median with the streaming two-heap RollingMedian, in batch over a random-walk series
+    and per live bar, and checks that both give identical results.
+    """
+    values = 100 + np.random.default_rng(seed).normal(size=n_bars).cumsum()
+    series = pd.Series(values)
+    values_list = values.tolist()
+
+    print(f"\n📏 Rolling median over {n_bars} bars")
+    print(f"{'window':>8} | {'pandas batch':>13} | {'heaps batch':>12} | {'heaps per bar':>14} | identical")
+    for window in windows:
+        expected, pandas_sec = time_call(lambda: series.rolling(window=window, min_periods=window).median())
+        streamed, heaps_sec = time_call(lambda: rolling_median_kernel(values_list, window))
+        identical = np.array_equal(expected.to_numpy(), np.array(streamed), equal_nan=True)
+
+        # Live mode: one update per bar on a median that is already warm
+        rolling_median = RollingMedian(window)
+        for value in values_list[:window]:
+            rolling_median.update(value)
+        _, live_sec = time_call(lambda: [rolling_median.update(value) for value in values_list[window:]])
+        per_bar_us = live_sec / max(1, n_bars - window) * 1e6
+
+        print(f"{window:>8} | {pandas_sec * 1000:>10.1f} ms | {heaps_sec * 1000:>9.1f} ms | "
+              f"{per_bar_us:>11.2f} µs | {'✅' if identical else '❌'}")
+
+
+if __name__ == "__main__":
+    benchmark_rolling_median()
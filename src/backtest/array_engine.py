@@ -0,0 +1,225 @@
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+from src.backtest.exit_resolver import resolve_exit
+from src.backtest.position_rules import open_long_position, open_short_position, resolve_long_exit, \
+    resolve_short_exit, settle_trade, reset_state
+from src.backtest.trade_log import EquityCurve
+from src.commons.constants.constants import OrderPosition, TradeEvent
+from src.utils.logger_util import log_backtest_trade
+
+
+def extract_simulation_arrays(df, long_signal_col, short_signal_col):
+    """
+    Pulls everything the simulation reads per bar out of the DataFrame once, so the kernel never touches pandas.
+    A missing signal column behaves like `row.get(col, 0)` did, i.e. a column of zeros.
+    """
+    n = len(df)
+    arrays = extract_bar_arrays(df)
+    arrays.update(
+        long_signal=df[long_signal_col].to_numpy() if long_signal_col in df.columns else np.zeros(n, dtype=np.int64),
+        short_signal=df[short_signal_col].to_numpy() if short_signal_col in df.columns else np.zeros(n,
+                                                                                                   dtype=np.int64),
+    )
+    return arrays
+
+
+def extract_bar_arrays(df):
+    """
+    The price, date and session arrays of extract_simulation_arrays, without any signal columns. Dates stay the df's
+    own array; only the bars a trade opens or closes on get boxed into Timestamps.
+    """
+    dates = df['date']
+    return dict(
+        date=dates.array,
+        open=df['open'].to_numpy(dtype=np.float64),
+        high=df['high'].to_numpy(dtype=np.float64),
+        low=df['low'].to_numpy(dtype=np.float64),
+        close=df['close'].to_numpy(dtype=np.float64),
+        session_id=pd.factorize(dates.dt.normalize())[0],
+    )
+
+
+def compute_eod_flags(session_id, intraday_only):
+    """True on the last bar of every session (and on the very last bar) when trading intraday only."""
+    n = len(session_id)
+    eod = np.zeros(n, dtype=bool)
+    if intraday_only and n:
+        eod[:-1] = session_id[1:] != session_id[:-1]
+        eod[-1] = True
+    return eod
+
+
+def simulate_strategy_arrays(
+        arrays, initial_capital,
+        stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
+        contract_size, hold_min_bars, hold_max_bars, fill_rate,
+        slippage_pct, segment, exchange, intraday_only, debug_logs_flag
+):
+    """
+    Same bar-by-bar state machine as simulate_strategy, but driven by the arrays from extract_simulation_arrays.
+    Produces identical trades and equity curve.
+    """
+    dates = arrays['date']
+    high = arrays['high'].tolist()
+    low = arrays['low'].tolist()
+    close = arrays['close'].tolist()
+    long_signal = arrays['long_signal'].tolist()
+    short_signal = arrays['short_signal'].tolist()
+    eod_flags = compute_eod_flags(arrays['session_id'], intraday_only).tolist()
+
+    capital = initial_capital
+    equity = np.empty(len(dates))
+    position = None
+    entry_price = 0
+    qty = 0
+    stop_price = None
+    target_price = None
+    trail_high = None
+    trail_low = None
+    trades = []
+    bars_held = 0
+    last_signal = 0  # 1=long, -1=short, 0=none
+    trade = None
+
+    for i in range(len(dates)):
+        signal_long = long_signal[i]
+        signal_short = short_signal[i]
+
+        # ENTRY LOGIC
+        if position is None:
+            if signal_long == 1 and (last_signal != 1):
+                trade, entry_price, qty, stop_price, target_price, trail_high = open_long_position(
+                    close[i], dates[i], capital, fill_rate, contract_size, slippage_pct, stop_loss_pct,
+                    target_profit_pct
+                )
+                if trade is not None:
+                    position = OrderPosition.LONG.name
+                    bars_held = 0
+                    if debug_logs_flag:
+                        log_backtest_trade(TradeEvent.ENTRY.name, trade, i)
+            elif signal_short == 1 and (last_signal != -1):
+                trade, entry_price, qty, stop_price, target_price, trail_low = open_short_position(
+                    close[i], dates[i], capital, fill_rate, contract_size, slippage_pct, stop_loss_pct,
+                    target_profit_pct
+                )
+                if trade is not None:
+                    position = OrderPosition.SHORT.name
+                    bars_held = 0
+                    if debug_logs_flag:
+                        log_backtest_trade(TradeEvent.ENTRY.name, trade, i)
+        else:
+            bars_held += 1
+            exit_price = None
+            reason = None
+            if position == OrderPosition.LONG.name:
+                exit_price, reason, stop_price, trail_high = resolve_long_exit(
+                    high[i], low[i], close[i], signal_long, bars_held, hold_min_bars, hold_max_bars,
+                    trailing_stop_loss_pct, stop_price, trail_high, target_price, slippage_pct, eod_flags[i]
+                )
+            elif position == OrderPosition.SHORT.name:
+                exit_price, reason, stop_price, trail_low = resolve_short_exit(
+                    high[i], low[i], close[i], signal_short, bars_held, hold_min_bars, hold_max_bars,
+                    trailing_stop_loss_pct, stop_price, trail_low, target_price, slippage_pct, eod_flags[i]
+                )
+            if exit_price is not None and trade is not None:
+                capital += settle_trade(trade, position, dates[i], exit_price, reason, entry_price, qty,
+                                        segment, exchange)
+                trades.append(trade)
+                if debug_logs_flag:
+                    log_backtest_trade(TradeEvent.EXIT.name, trade, i)
+                position, bars_held, entry_price, qty, stop_price, target_price, trail_high, trail_low = reset_state()
+        last_signal = 1 if signal_long == 1 else (-1 if signal_short == 1 else 0)
+        equity[i] = capital
+
+    return trades, EquityCurve(dates, equity, capital)
+
+
+def compute_entry_candidates(long_signal, short_signal):
+    """
+    Bars on which a flat book would attempt an entry, mirroring the `last_signal` checks of the bar loop.
+    Returns the candidate bar indices and, per candidate, whether the attempt is on the long side.
+    """
+    state = np.where(long_signal == 1, 1, np.where(short_signal == 1, -1, 0))
+    prev_state = np.zeros_like(state)
+    prev_state[1:] = state[:-1]
+    long_entry = (long_signal == 1) & (prev_state != 1)
+    short_entry = (short_signal == 1) & (prev_state != -1) & ~long_entry
+    candidate_idx = np.flatnonzero(long_entry | short_entry)
+    return candidate_idx, long_entry[candidate_idx]
+
+
+def simulate_strategy_events(
+        arrays, initial_capital,
+        stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
+        contract_size, hold_min_bars, hold_max_bars, fill_rate,
+        slippage_pct, segment, exchange, intraday_only, debug_logs_flag
+):
+    """
+    Event-driven variant of simulate_strategy_arrays. While flat it jumps straight to the next entry candidate, and
+    once in a position it resolves the exit bar with one vectorized first-passage search; the equity curve between
+    events is filled in bulk. Produces identical trades and equity curve.
+    """
+    dates = arrays['date']
+    n = len(dates)
+    high = arrays['high']
+    low = arrays['low']
+    close = arrays['close']
+    eod_flags = compute_eod_flags(arrays['session_id'], intraday_only)
+    eod_idx = np.flatnonzero(eod_flags)
+    candidate_idx, candidate_is_long = compute_entry_candidates(arrays['long_signal'], arrays['short_signal'])
+    candidate_idx = candidate_idx.tolist()
+    candidate_is_long = candidate_is_long.tolist()
+
+    capital = initial_capital
+    equity = np.empty(n)
+    trades = []
+    i = 0  # first bar not yet written to the equity curve
+    next_candidate = 0
+
+    while i < n:
+        # Skip candidates that fell inside the previous holding period
+        next_candidate = bisect_left(candidate_idx, i, next_candidate)
+        if next_candidate == len(candidate_idx):
+            equity[i:] = capital
+            break
+
+        entry_idx = candidate_idx[next_candidate]
+        is_long = candidate_is_long[next_candidate]
+        next_candidate += 1
+        equity[i:entry_idx + 1] = capital
+        i = entry_idx + 1
+
+        open_position = open_long_position if is_long else open_short_position
+        trade, entry_price, qty, stop_price, target_price, trail = open_position(
+            close[entry_idx].item(), dates[entry_idx], capital, fill_rate, contract_size, slippage_pct,
+            stop_loss_pct, target_profit_pct
+        )
+        if trade is None:
+            continue
+        position = OrderPosition.LONG.name if is_long else OrderPosition.SHORT.name
+        if debug_logs_flag:
+            log_backtest_trade(TradeEvent.ENTRY.name, trade, entry_idx)
+
+        exit_idx, exit_price, reason = resolve_exit(
+            high, low, close, arrays['long_signal'] if is_long else arrays['short_signal'], eod_flags, eod_idx,
+            entry_idx, is_long, stop_price, trail, target_price, trailing_stop_loss_pct, hold_min_bars,
+            hold_max_bars, slippage_pct
+        )
+        if exit_idx is None:
+            # Still open on the last bar: nothing is booked, same as the bar loop
+            equity[i:] = capital
+            break
+
+        equity[i:exit_idx] = capital
+        capital += settle_trade(trade, position, dates[exit_idx], exit_price, reason, entry_price, qty,
+                                segment, exchange)
+        trades.append(trade)
+        if debug_logs_flag:
+            log_backtest_trade(TradeEvent.EXIT.name, trade, exit_idx)
+        equity[exit_idx] = capital
+        i = exit_idx + 1
+
+    return trades, EquityCurve(dates, equity, capital)
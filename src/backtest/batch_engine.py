@@ -0,0 +1,36 @@
+import numpy as np
+
+from src.backtest.array_engine import simulate_strategy_events
+
+BAR_ARRAY_KEYS = ('date', 'high', 'low', 'close', 'session_id')
+
+
+def simulate_strategy_batch(
+        arrays, long_signals, short_signals, valid, initial_capital,
+        stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
+        contract_size, hold_min_bars, hold_max_bars, fill_rate,
+        slippage_pct, segment, exchange, intraday_only, debug_logs_flag
+):
+    """
+    Runs N signal columns (one per grid combo) over the same bars. long_signals/short_signals/valid are (bars x N)
+    matrices. Each column is compacted to the rows its dropna would keep and walked by simulate_strategy_events:
+    entry candidates and EOD flags are computed column-wise up front and every exit is found with exit_resolver's
+    first-passage search, so no combo is stepped bar by bar. A column costs one event-engine run, so the simulation
+    scales with N x trades; what the grid shares is the bar arrays and the signal matrices.
+    Returns (trades, equity): N trade lists and a (bars x N) equity matrix that is NaN outside each combo's rows.
+    """
+    n, n_combos = long_signals.shape
+    trades = []
+    equity = np.full((n, n_combos), np.nan)
+    for j in range(n_combos):
+        rows = np.flatnonzero(valid[:, j])
+        column_arrays = {key: arrays[key][rows] for key in BAR_ARRAY_KEYS}
+        column_arrays.update(long_signal=long_signals[rows, j], short_signal=short_signals[rows, j])
+        combo_trades, equity_curve = simulate_strategy_events(
+            column_arrays, initial_capital, stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
+            contract_size, hold_min_bars, hold_max_bars, fill_rate,
+            slippage_pct, segment, exchange, intraday_only, debug_logs_flag
+        )
+        trades.append(combo_trades)
+        equity[rows, j] = equity_curve.equity
+    return trades, equity
@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+DATA_PLANE_DIR_PREFIX = "backtest_data_plane_"
+SHARED_MEMORY_ROOT = "/dev/shm"  # tmpfs on Linux; falls back to the default temp dir elsewhere
+
+# Worker-side attachment. Grid jobs are submitted dataset by dataset, so a worker only keeps the dataset it is
+# currently running on mapped and drops the previous one when the next (symbol, interval) arrives.
+_attached_dataset = {}
+
+
+def create_data_plane():
+    """Creates the directory that holds the memory-mapped column files for one backtest run."""
+    root = SHARED_MEMORY_ROOT if os.path.isdir(SHARED_MEMORY_ROOT) else None
+    return tempfile.mkdtemp(prefix=DATA_PLANE_DIR_PREFIX, dir=root)
+
+
+def destroy_data_plane(data_plane_dir):
+    """Removes every published dataset. Workers that still have a column mapped keep it until they drop it."""
+    shutil.rmtree(data_plane_dir, ignore_errors=True)
+
+
+def publish_dataframe(df, data_plane_dir, dataset_name):
+    """
+    Writes the columns of an OHLCV DataFrame once into memory-mapped .npy files and returns a small picklable handle
+    that worker processes pass to attach_dataframe instead of receiving a pickled copy of the frame.
+    The date column is stored as int64 ticks plus its unit and tz so it rebuilds with the exact original dtype.
+    """
+    dataset_dir = os.path.join(data_plane_dir, dataset_name)
+    os.makedirs(dataset_dir, exist_ok=True)
+    columns = []
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(series.dtype):
+            values = series.array.asi8
+            meta = dict(kind='datetime', unit=series.dt.unit, tz=series.dt.tz)
+        elif pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_extension_array_dtype(series.dtype):
+            values = series.to_numpy()
+            meta = dict(kind='numeric')
+        else:
+            raise ValueError(f"Column '{col}' of dtype {series.dtype} cannot be published to the data plane")
+
+        path = os.path.join(dataset_dir, f"{len(columns)}.npy")
+        column_file = np.lib.format.open_memmap(path, mode='w+', dtype=values.dtype, shape=values.shape)
+        column_file[:] = values
+        column_file.flush()
+        del column_file
+        columns.append(dict(name=col, path=path, **meta))
+
+    return dict(name=dataset_name, n_rows=len(df), columns=columns)
+
+
+def attach_dataframe(handle):
+    """
+    Rebuilds the published DataFrame in a worker on top of read-only memory maps of the column files, so every
+    worker shares the same physical pages. Repeated jobs on the same dataset reuse the attached frame.
+    """
+    df = _attached_dataset.get(handle['name'])
+    if df is not None:
+        return df
+
+    data = {}
+    for column in handle['columns']:
+        values = np.load(column['path'], mmap_mode='r')
+        if column['kind'] == 'datetime':
+            dates = pd.DatetimeIndex(values.view(f"M8[{column['unit']}]"))
+            if column['tz'] is not None:
+                dates = dates.tz_localize('UTC').tz_convert(column['tz'])
+            data[column['name']] = pd.Series(dates)
+        else:
+            data[column['name']] = values
+    df = pd.DataFrame(data, copy=False)
+
+    _attached_dataset.clear()
+    _attached_dataset[handle['name']] = df
+    return df
@@ -0,0 +1,116 @@
+import numpy as np
+
+from src.backtest.position_rules import resolve_long_exit, resolve_short_exit
+
+EXIT_SCALAR_PREFIX_BARS = 16  # most trades exit within a few bars; numpy call overhead only pays off beyond this
+EXIT_SCAN_BLOCK_BARS = 64  # first vectorized window, grown 4x per block when max-hold/EOD do not bound the trade
+
+
+def exit_window_end(n, entry_idx, eod_idx, hold_max_bars):
+    """Exclusive upper bound of the bars an entry at entry_idx can still be open on: max-hold bar or session end."""
+    end = n
+    if hold_max_bars:
+        end = min(end, entry_idx + hold_max_bars + 1)
+    eod_pos = np.searchsorted(eod_idx, entry_idx + 1)
+    if eod_pos < len(eod_idx):
+        end = min(end, int(eod_idx[eod_pos]) + 1)
+    return end
+
+
+def find_exit_bar(
+        high, low, signal, eod_flags, start, end, entry_idx, is_long,
+        stop_price, trail, target_price, trailing_stop_loss_pct, hold_min_bars, hold_max_bars
+):
+    """
+    First-passage search for the bar in [start, end) on which an open position exits, evaluated in vectorized passes
+    over the forward window instead of one Python iteration per bar.
+
+    The trailing stop is rebuilt from cumulative high/low extremes, so the stop level on every bar equals what the
+    bar loop would have ratcheted to. Returns (exit_idx, stop_price, trail) where stop_price/trail are the values
+    carried *into* exit_idx, or (None, stop_price, trail) if no exit fires before `end`.
+    """
+    block_bars = EXIT_SCAN_BLOCK_BARS
+    while start < end:
+        stop = min(end, start + block_bars)
+        window = slice(start, stop)
+        bars_held = np.arange(start - entry_idx, stop - entry_idx)
+
+        if trailing_stop_loss_pct:
+            if is_long:
+                trails = np.maximum.accumulate(np.maximum(high[window], trail))
+                stops = np.maximum.accumulate(trails * (1 - trailing_stop_loss_pct))
+                if stop_price is not None:
+                    stops = np.maximum(stops, stop_price)
+            else:
+                trails = np.minimum.accumulate(np.minimum(low[window], trail))
+                stops = np.minimum.accumulate(trails * (1 + trailing_stop_loss_pct))
+                if stop_price is not None:
+                    stops = np.minimum(stops, stop_price)
+        else:
+            trails = None
+            stops = None if stop_price is None else np.full(stop - start, stop_price)
+
+        hit = (signal[window] == 0) & (bars_held >= hold_min_bars)
+        hit |= eod_flags[window]
+        if hold_max_bars:
+            hit |= bars_held >= hold_max_bars
+        if stops is not None:
+            hit |= (low[window] <= stops) if is_long else (high[window] >= stops)
+        if target_price is not None:
+            hit |= (high[window] >= target_price) if is_long else (low[window] <= target_price)
+
+        if hit.any():
+            k = int(hit.argmax())
+            if k > 0:
+                if trails is not None:
+                    trail = trails[k - 1].item()
+                if stops is not None:
+                    stop_price = stops[k - 1].item()
+            return start + k, stop_price, trail
+
+        if trails is not None:
+            trail = trails[-1].item()
+        if stops is not None:
+            stop_price = stops[-1].item()
+        start = stop
+        block_bars *= 4
+    return None, stop_price, trail
+
+
+def resolve_exit(
+        high, low, close, signal, eod_flags, eod_idx, entry_idx, is_long,
+        stop_price, trail, target_price, trailing_stop_loss_pct, hold_min_bars, hold_max_bars, slippage_pct
+):
+    """
+    Resolves the exit of a position opened on entry_idx. The first EXIT_SCALAR_PREFIX_BARS bars are stepped with the
+    scalar exit rules; anything still open after that is handed to find_exit_bar. The exit bar is always priced with
+    the scalar rules, so the reason follows the usual STOP_LOSS > TARGET > CROSS > MAX_HOLD > EOD priority.
+    Returns (exit_idx, exit_price, reason), all None if the position is still open on the last bar.
+    """
+    resolve = resolve_long_exit if is_long else resolve_short_exit
+    start = entry_idx + 1
+    end = exit_window_end(len(high), entry_idx, eod_idx, hold_max_bars)
+    prefix_end = min(end, start + EXIT_SCALAR_PREFIX_BARS)
+    window = slice(start, prefix_end)
+    for i, (bar_high, bar_low, bar_close, bar_signal, bar_eod) in enumerate(zip(
+            high[window].tolist(), low[window].tolist(), close[window].tolist(), signal[window].tolist(),
+            eod_flags[window].tolist()), start=start):
+        exit_price, reason, stop_price, trail = resolve(
+            bar_high, bar_low, bar_close, bar_signal, i - entry_idx, hold_min_bars, hold_max_bars,
+            trailing_stop_loss_pct, stop_price, trail, target_price, slippage_pct, bar_eod
+        )
+        if exit_price is not None:
+            return i, exit_price, reason
+
+    exit_idx, stop_price, trail = find_exit_bar(
+        high, low, signal, eod_flags, prefix_end, end, entry_idx, is_long,
+        stop_price, trail, target_price, trailing_stop_loss_pct, hold_min_bars, hold_max_bars
+    )
+    if exit_idx is None:
+        return None, None, None
+    exit_price, reason, _, _ = resolve(
+        high[exit_idx].item(), low[exit_idx].item(), close[exit_idx].item(), signal[exit_idx].item(),
+        exit_idx - entry_idx, hold_min_bars, hold_max_bars, trailing_stop_loss_pct, stop_price, trail, target_price,
+        slippage_pct, eod_flags[exit_idx].item()
+    )
+    return exit_idx, exit_price, reason
@@ -0,0 +1,111 @@
+from src.backtest.trade_log import Trade
+from src.commons.constants.constants import OrderPosition, OrderSide, TradeExitReason
+from src.utils.brokerage_util import get_fee_schedule
+
+
+def open_long_position(price, date, capital, fill_rate, contract_size, slippage_pct, stop_loss_pct,
+                       target_profit_pct):
+    entry_price = price * (1 + slippage_pct)
+    qty = int((capital * fill_rate) // (entry_price * contract_size)) * contract_size
+    if qty == 0:
+        return None, None, None, None, None, None
+    stop_price = entry_price * (1 - stop_loss_pct) if stop_loss_pct else None
+    trail_high = entry_price
+    target_price = entry_price * (1 + target_profit_pct) if target_profit_pct else None
+    trade = Trade(OrderPosition.LONG.name, date, entry_price, qty)
+    return trade, entry_price, qty, stop_price, target_price, trail_high
+
+
+def open_short_position(price, date, capital, fill_rate, contract_size, slippage_pct, stop_loss_pct,
+                        target_profit_pct):
+    entry_price = price * (1 - slippage_pct)
+    qty = int((capital * fill_rate) // (entry_price * contract_size)) * contract_size
+    if qty == 0:
+        return None, None, None, None, None, None
+    stop_price = entry_price * (1 + stop_loss_pct) if stop_loss_pct else None
+    trail_low = entry_price
+    target_price = entry_price * (1 - target_profit_pct) if target_profit_pct else None
+    trade = Trade(OrderPosition.SHORT.name, date, entry_price, qty)
+    return trade, entry_price, qty, stop_price, target_price, trail_low
+
+
+def resolve_long_exit(high, low, price, signal, bars_held, hold_min_bars, hold_max_bars, trailing_stop_loss_pct,
+                      stop_price, trail_high, target_price, slippage_pct, eod_exit):
+    reason, exit_price = None, None
+    if trailing_stop_loss_pct:
+        if trail_high is not None and high > trail_high:
+            trail_high = high
+        new_stop = trail_high * (1 - trailing_stop_loss_pct) if trail_high is not None else None
+        if stop_price is None or (new_stop is not None and new_stop > stop_price):
+            stop_price = new_stop
+    if stop_price is not None and low <= stop_price:
+        exit_price = stop_price * (1 - slippage_pct)
+        reason = TradeExitReason.STOP_LOSS.name
+    elif target_price is not None and high >= target_price:
+        exit_price = target_price * (1 - slippage_pct)
+        reason = TradeExitReason.TARGET.name
+    elif signal == 0 and (bars_held >= hold_min_bars):
+        exit_price = price * (1 - slippage_pct)
+        reason = TradeExitReason.CROSS_DOWN.name
+    elif hold_max_bars and bars_held >= hold_max_bars:
+        exit_price = price * (1 - slippage_pct)
+        reason = TradeExitReason.MAX_HOLD.name
+    if not exit_price and eod_exit:
+        exit_price = price * (1 - slippage_pct)
+        reason = TradeExitReason.EOD.name
+    return exit_price, reason, stop_price, trail_high
+
+
+def resolve_short_exit(high, low, price, signal, bars_held, hold_min_bars, hold_max_bars, trailing_stop_loss_pct,
+                       stop_price, trail_low, target_price, slippage_pct, eod_exit):
+    reason, exit_price = None, None
+    if trailing_stop_loss_pct:
+        if trail_low is not None and low < trail_low:
+            trail_low = low
+        new_stop = trail_low * (1 + trailing_stop_loss_pct) if trail_low is not None else None
+        if stop_price is None or (new_stop is not None and new_stop < stop_price):
+            stop_price = new_stop
+    if stop_price is not None and high >= stop_price:
+        exit_price = stop_price * (1 + slippage_pct)
+        reason = TradeExitReason.STOP_LOSS.name
+    elif target_price is not None and low <= target_price:
+        exit_price = target_price * (1 + slippage_pct)
+        reason = TradeExitReason.TARGET.name
+    elif signal == 0 and (bars_held >= hold_min_bars):
+        exit_price = price * (1 + slippage_pct)
+        reason = TradeExitReason.CROSS_UP.name
+    elif hold_max_bars and bars_held >= hold_max_bars:
+        exit_price = price * (1 + slippage_pct)
+        reason = TradeExitReason.MAX_HOLD.name
+    if not exit_price and eod_exit:
+        exit_price = price * (1 + slippage_pct)
+        reason = TradeExitReason.EOD.name
+    return exit_price, reason, stop_price, trail_low
+
+
+def settle_trade(trade, position, exit_time, exit_price, reason, entry_price, qty, segment, exchange):
+    """Books fees and P&L on the open Trade and returns the net P&L to add to capital."""
+    fee_schedule = get_fee_schedule(segment, exchange)
+    if position == OrderPosition.LONG.name:
+        cost_buy = fee_schedule.total(OrderSide.BUY.name, entry_price, qty)
+        cost_sell = fee_schedule.total(OrderSide.SELL.name, exit_price, qty)
+        gross_pnl = (exit_price - entry_price) * qty
+    else:
+        cost_sell = fee_schedule.total(OrderSide.SELL.name, entry_price, qty)
+        cost_buy = fee_schedule.total(OrderSide.BUY.name, exit_price, qty)
+        gross_pnl = (entry_price - exit_price) * qty
+    total_fee = cost_buy + cost_sell
+    pnl = gross_pnl - total_fee
+    trade.exit_time = exit_time
+    trade.exit_price = exit_price
+    trade.exit_reason = reason
+    trade.pnl = pnl
+    trade.gross_pnl = gross_pnl
+    trade.fee_buy = cost_buy
+    trade.fee_sell = cost_sell
+    trade.total_fee = total_fee
+    return pnl
+
+
+def reset_state():
+    return None, 0, None, 0, None, None, None, None
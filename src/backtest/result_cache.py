@@ -0,0 +1,67 @@
+"""
+Persistent, content-addressed cache of backtest results. A result is keyed by a hash of everything that decides it:
+the input data, the strategy params, the simulation params, the brokerage config and the source of the code that
+computes results (RESULT_CODE_PATHS), so rerunning an unchanged (dataset, combo) loads its trades and metrics instead of
+recomputing signals and simulating again, while any code edit starts a fresh cache. Bump RESULT_CACHE_VERSION when the
+stored format changes.
+"""
+import os
+import pickle
+
+from src.utils.brokerage_util import BROKERAGE_CFG
+from src.utils.file_util import read_config, compute_config_hash, compute_dataframe_digest, \
+    compute_source_fingerprint, BACKTEST_CACHE_DIR
+
+RESULT_CACHE_VERSION = 2
+# Everything that turns (data, params) into trades and metrics: indicators, engines, position rules, fees, metrics
+RESULT_CODE_PATHS = ("src/backtest", "src/indicators", "src/commons", "src/utils/brokerage_util.py",
+                     "src/utils/metrics_util.py")
+
+
+def create_result_cache(df, cache_dir=BACKTEST_CACHE_DIR):
+    """Picklable handle for one dataset: where its results are stored and the digests they are keyed on."""
+    return dict(cache_dir=cache_dir, data_digest=compute_dataframe_digest(df),
+                brokerage_hash=compute_config_hash(read_config(BROKERAGE_CFG)),
+                code_fingerprint=compute_source_fingerprint(*RESULT_CODE_PATHS))
+
+
+def compute_result_key(result_cache, strategy_params, simulation_params, risk_params=None):
+    return compute_config_hash(dict(
+        version=RESULT_CACHE_VERSION, data_digest=result_cache['data_digest'],
+        brokerage_hash=result_cache['brokerage_hash'], code_fingerprint=result_cache['code_fingerprint'],
+        strategy_params=strategy_params, simulation_params=simulation_params, risk_params=risk_params
+    ))
+
+
+def get_result_path(result_cache, key):
+    return os.path.join(result_cache['cache_dir'], key[:2], f"{key}.pkl")
+
+
+def load_cached_result(result_cache, key):
+    """(trades, metrics) stored under key, or None if there is none (or it cannot be read)."""
+    path = get_result_path(result_cache, key)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as file:
+            return pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def store_cached_result(result_cache, key, trades, metrics):
+    """
+    Pickles (trades, metrics) next to its destination and renames it into place, so readers never see a partial entry.
+    Pickle keeps the exact value types (Timestamps, ints vs floats), so a hit returns identical metrics.
+    """
+    path = get_result_path(result_cache, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            pickle.dump((trades, metrics), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
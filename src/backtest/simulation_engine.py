@@ -1,11 +1,19 @@
 import os
 
+import numpy as np
 import pandas as pd
 
-from src.commons.constants.constants import OrderPosition, TradeEvent, OrderSide, TradeExitReason, DataframeSplit
-from src.indicators.registry import enrich_df
-from src.utils.backtest_util import construct_strategy_hyperparam_str
-from src.utils.brokerage_util import calculate_brokerage
+from src.backtest.array_engine import extract_simulation_arrays, simulate_strategy_arrays, simulate_strategy_events, \
+    extract_bar_arrays
+from src.backtest.batch_engine import simulate_strategy_batch
+from src.backtest.result_cache import compute_result_key, load_cached_result, store_cached_result
+from src.backtest.position_rules import open_long_position, open_short_position, resolve_long_exit, \
+    resolve_short_exit, settle_trade, reset_state
+from src.backtest.trade_log import EquityCurve, trades_to_frame
+from src.commons.constants.constants import OrderPosition, TradeEvent, DataframeSplit, SimulationEngine
+from src.indicators.registry import enrich_df, add_signals
+from src.utils.backtest_util import construct_strategy_hyperparam_str, construct_risk_filename
+from src.indicators.feature_store import write_feature_reference
 from src.utils.file_util import save_df_to_csv, get_trades_dir, get_features_dir
 from src.utils.logger_util import log_backtest_trade
 from src.utils.metrics_util import generate_simulation_results
@@ -16,8 +24,127 @@ def run_simulation(
         stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
         contract_size, hold_min_bars, hold_max_bars, fill_rate,
         slippage_pct, segment, exchange, train_split=1.0, intraday_only=True,
-        debug_logs_flag=True, save_results=True, trading_symbol="", interval="", sim_dir=None
+        debug_logs_flag=True, save_results=True, trading_symbol="", interval="", sim_dir=None,
+        engine=SimulationEngine.PANDAS.value, result_cache=None, feature_store=None
 ):
+    """
+    Simulates one strategy_params on df. With a result_cache (see create_result_cache), a result stored by an earlier
+    identical run is returned instead, as (trades, metrics, None): equity curves are not cached. With a feature_store
+    (see create_feature_store) the signals come from / go to the store and the sim dir gets a reference to them.
+    """
+    if result_cache is not None:
+        key = compute_result_key(result_cache, strategy_params, construct_result_params(
+            initial_capital, stop_loss_pct, trailing_stop_loss_pct, target_profit_pct, contract_size, hold_min_bars,
+            hold_max_bars, fill_rate, slippage_pct, segment, exchange, train_split, intraday_only, trading_symbol,
+            interval
+        ))
+        cached = load_cached_result(result_cache, key)
+        if cached is not None:
+            trades, metrics = cached
+            save_cached_trades(trades, construct_strategy_filename(strategy_params, trading_symbol, interval),
+                               save_results, sim_dir)
+            return trades, metrics, None
+
+    df_per_strategy, filename = prepare_strategy_frame(df, strategy_params, trading_symbol, interval, sim_dir,
+                                                       feature_store)
+    result = simulate_strategy_frame(
+        df_per_strategy, strategy_params, filename, initial_capital, stop_loss_pct, trailing_stop_loss_pct,
+        target_profit_pct, contract_size, hold_min_bars, hold_max_bars, fill_rate, slippage_pct, segment, exchange,
+        train_split, intraday_only, debug_logs_flag, save_results, trading_symbol, interval, sim_dir, engine
+    )
+    if result_cache is not None:
+        store_cached_result(result_cache, key, result[0], result[1])
+    return result
+
+
+def run_simulation_risk_grid(
+        df, strategy_params, risk_param_grid, initial_capital,
+        stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
+        contract_size, hold_min_bars, hold_max_bars, fill_rate,
+        slippage_pct, segment, exchange, train_split=1.0, intraday_only=True,
+        debug_logs_flag=True, save_results=True, trading_symbol="", interval="", sim_dir=None,
+        engine=SimulationEngine.PANDAS.value, result_cache=None, feature_store=None
+):
+    """
+    run_simulation for one strategy_params against every risk_params of risk_param_grid (see
+    construct_risk_param_grid). The signals are computed and saved once; each risk combo gets its own trades file
+    and metrics, with its risk params as extra columns. Returns [(trades, metrics, equity_curve)] in grid order.
+    With a result_cache only the risk combos without a stored result are simulated.
+    """
+    if result_cache is not None:
+        simulation_params = construct_result_params(
+            initial_capital, stop_loss_pct, trailing_stop_loss_pct, target_profit_pct, contract_size, hold_min_bars,
+            hold_max_bars, fill_rate, slippage_pct, segment, exchange, train_split, intraday_only, trading_symbol,
+            interval
+        )
+        filename = construct_strategy_filename(strategy_params, trading_symbol, interval)
+        keys = [compute_result_key(result_cache, strategy_params, simulation_params, risk_params)
+                for risk_params in risk_param_grid]
+        results = []
+        for key, risk_params in zip(keys, risk_param_grid):
+            cached = load_cached_result(result_cache, key)
+            if cached is not None:
+                save_cached_trades(cached[0], construct_risk_filename(filename, risk_params), save_results, sim_dir)
+                cached = (cached[0], cached[1], None)
+            results.append(cached)
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            computed = run_simulation_risk_grid(
+                df, strategy_params, [risk_param_grid[i] for i in missing], initial_capital, stop_loss_pct,
+                trailing_stop_loss_pct, target_profit_pct, contract_size, hold_min_bars, hold_max_bars, fill_rate,
+                slippage_pct, segment, exchange, train_split, intraday_only, debug_logs_flag, save_results,
+                trading_symbol, interval, sim_dir, engine, feature_store=feature_store
+            )
+            for i, result in zip(missing, computed):
+                store_cached_result(result_cache, keys[i], result[0], result[1])
+                results[i] = result
+        return results
+
+    df_per_strategy, filename = prepare_strategy_frame(df, strategy_params, trading_symbol, interval, sim_dir,
+                                                       feature_store)
+    base_risk_params = dict(stop_loss_pct=stop_loss_pct, trailing_stop_loss_pct=trailing_stop_loss_pct,
+                            target_profit_pct=target_profit_pct, hold_min_bars=hold_min_bars,
+                            hold_max_bars=hold_max_bars, slippage_pct=slippage_pct)
+    results = []
+    for risk_params in risk_param_grid:
+        params = dict(base_risk_params, **risk_params)
+        results.append(simulate_strategy_frame(
+            df_per_strategy, dict(strategy_params, **risk_params), construct_risk_filename(filename, risk_params),
+            initial_capital, params['stop_loss_pct'], params['trailing_stop_loss_pct'], params['target_profit_pct'],
+            contract_size, params['hold_min_bars'], params['hold_max_bars'], fill_rate, params['slippage_pct'],
+            segment, exchange, train_split, intraday_only, debug_logs_flag, save_results, trading_symbol, interval,
+            sim_dir, engine
+        ))
+    return results
+
+
+def construct_result_params(
+        initial_capital, stop_loss_pct, trailing_stop_loss_pct, target_profit_pct, contract_size, hold_min_bars,
+        hold_max_bars, fill_rate, slippage_pct, segment, exchange, train_split, intraday_only, trading_symbol,
+        interval
+):
+    """The run_simulation arguments a result depends on, for its result cache key. All engines agree, so not engine."""
+    return dict(initial_capital=initial_capital, stop_loss_pct=stop_loss_pct,
+                trailing_stop_loss_pct=trailing_stop_loss_pct, target_profit_pct=target_profit_pct,
+                contract_size=contract_size, hold_min_bars=hold_min_bars, hold_max_bars=hold_max_bars,
+                fill_rate=fill_rate, slippage_pct=slippage_pct, segment=segment, exchange=exchange,
+                train_split=train_split, intraday_only=intraday_only, trading_symbol=trading_symbol, interval=interval)
+
+
+def construct_strategy_filename(strategy_params, trading_symbol, interval):
+    strategy_hyperparam_str = construct_strategy_hyperparam_str(strategy_params)
+    return f"{trading_symbol}_{interval}_{strategy_params['name']}_{strategy_hyperparam_str}.csv"
+
+
+def save_cached_trades(trades, filename, save_results, sim_dir):
+    """Writes the trades file of a result loaded from the cache, as the simulation would have."""
+    if save_results and len(trades) > 0:
+        save_df_to_csv(trades_to_frame(trades), os.path.join(get_trades_dir(sim_dir), filename))
+
+
+def prepare_strategy_frame(df, strategy_params, trading_symbol, interval, sim_dir, feature_store=None):
+    """Adds the strategy's signals to a copy of df, drops incomplete rows and saves the feature file."""
     # Always re-add signals per param set
     df_per_strategy = df.copy()
 
@@ -25,19 +152,41 @@ def run_simulation(
     df_per_strategy = enrich_df(df_per_strategy, strategy_name,
                                 {hyperparam_key: hyperparam_value for hyperparam_key, hyperparam_value in
                                  strategy_params.items() if hyperparam_key != 'name'},
-                                None)
+                                None, feature_store=feature_store)
 
-    strategy_hyperparam_str = construct_strategy_hyperparam_str(strategy_params)
-    filename = f"{trading_symbol}_{interval}_{strategy_params['name']}_{strategy_hyperparam_str}.csv"
+    filename = construct_strategy_filename(strategy_params, trading_symbol, interval)
 
     # Dataframe cleanup
     df_per_strategy.dropna(inplace=True)
     df_per_strategy.reset_index(drop=True, inplace=True)
 
     # Save feature file
-    save_df_to_csv(df_per_strategy, os.path.join(get_features_dir(sim_dir), filename))
-
-    long_signal_col, short_signal_col = get_signal_column_names(strategy_name)
+    if not save_feature_reference(strategy_params, filename, sim_dir, feature_store):
+        save_df_to_csv(df_per_strategy, os.path.join(get_features_dir(sim_dir), filename))
+    return df_per_strategy, filename
+
+
+def save_feature_reference(strategy_params, filename, sim_dir, feature_store):
+    """
+    With a feature_store, saves a JSON reference to the stored signals in place of the feature CSV (see
+    write_feature_reference). Returns False if the caller has to save the CSV.
+    """
+    if feature_store is None:
+        return False
+    reference_path = os.path.join(get_features_dir(sim_dir), f"{os.path.splitext(filename)[0]}.json")
+    return write_feature_reference(feature_store, reference_path, strategy_params['name'],
+                                   {hyperparam_key: hyperparam_value for hyperparam_key, hyperparam_value in
+                                    strategy_params.items() if hyperparam_key != 'name'})
+
+
+def simulate_strategy_frame(
+        df_per_strategy, strategy_params, filename, initial_capital,
+        stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
+        contract_size, hold_min_bars, hold_max_bars, fill_rate,
+        slippage_pct, segment, exchange, train_split, intraday_only,
+        debug_logs_flag, save_results, trading_symbol, interval, sim_dir, engine
+):
+    long_signal_col, short_signal_col = get_signal_column_names(strategy_params['name'])
 
     # TODO - Only focusing on full df now. Later when ML is integrated, we can use splits (temporarily commented out)
     split_idx = int(len(df_per_strategy) * train_split)
@@ -51,8 +200,8 @@ def run_simulation(
     all_metrics = []
     equity_curve_for_all = None
     for split_name, split_df in filter(None, splits):
-        trades, equity_curve = simulate_strategy(
-            split_df, initial_capital, stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
+        trades, equity_curve = run_engine(
+            engine, split_df, initial_capital, stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
             contract_size, hold_min_bars, hold_max_bars, fill_rate,
             slippage_pct, segment, exchange, intraday_only, debug_logs_flag,
             long_signal_col, short_signal_col
@@ -71,7 +220,7 @@ def run_simulation(
 
         # Save trade details
         if save_results and split_name == DataframeSplit.ALL.name and len(trades) > 0:
-            trades_df = pd.DataFrame(trades)
+            trades_df = trades_to_frame(trades)
             save_df_to_csv(trades_df, os.path.join(get_trades_dir(sim_dir), filename))
 
         all_trades.extend(trades)
@@ -79,6 +228,160 @@ def run_simulation(
     return all_trades, all_metrics, equity_curve_for_all
 
 
+def run_simulation_batch(
+        df, strategy_param_grid, initial_capital,
+        stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
+        contract_size, hold_min_bars, hold_max_bars, fill_rate,
+        slippage_pct, segment, exchange, train_split=1.0, intraday_only=True,
+        debug_logs_flag=True, save_results=True, trading_symbol="", interval="", sim_dir=None, risk_param_grid=None,
+        result_cache=None, feature_store=None
+):
+    """
+    run_simulation for every strategy_params of one strategy's grid, with the signals of all combos stacked into
+    (bars x N) matrices and simulated together by simulate_strategy_batch. Each combo still gets its own feature
+    file, trades file and metrics, identical to a run_simulation call. With a risk_param_grid the same signal
+    matrices are simulated once per risk combo, as run_simulation_risk_grid does for a single combo.
+    Returns [(trades, metrics, equity_curve)] ordered by strategy combo, then risk combo. With a result_cache only the
+    strategy combos missing a stored result for some risk combo are simulated.
+    """
+    if result_cache is not None:
+        simulation_params = construct_result_params(
+            initial_capital, stop_loss_pct, trailing_stop_loss_pct, target_profit_pct, contract_size, hold_min_bars,
+            hold_max_bars, fill_rate, slippage_pct, segment, exchange, train_split, intraday_only, trading_symbol,
+            interval
+        )
+        risk_grid = risk_param_grid or [{}]
+        keys = [[compute_result_key(result_cache, strategy_params, simulation_params, risk_params or None)
+                 for risk_params in risk_grid] for strategy_params in strategy_param_grid]
+        cached = [[load_cached_result(result_cache, key) for key in combo_keys] for combo_keys in keys]
+        missing = [j for j, combo_cached in enumerate(cached) if any(result is None for result in combo_cached)]
+        computed = []
+        if missing:
+            computed = run_simulation_batch(
+                df, [strategy_param_grid[j] for j in missing], initial_capital, stop_loss_pct, trailing_stop_loss_pct,
+                target_profit_pct, contract_size, hold_min_bars, hold_max_bars, fill_rate, slippage_pct, segment,
+                exchange, train_split, intraday_only, debug_logs_flag, save_results, trading_symbol, interval, sim_dir,
+                risk_param_grid, feature_store=feature_store
+            )
+
+        computed_offsets = {j: k * len(risk_grid) for k, j in enumerate(missing)}
+        results = []
+        for j, strategy_params in enumerate(strategy_param_grid):
+            if j in computed_offsets:
+                k = computed_offsets[j]
+                combo_results = computed[k:k + len(risk_grid)]
+                for key, result in zip(keys[j], combo_results):
+                    store_cached_result(result_cache, key, result[0], result[1])
+            else:
+                filename = construct_strategy_filename(strategy_params, trading_symbol, interval)
+                combo_results = []
+                for (trades, metrics), risk_params in zip(cached[j], risk_grid):
+                    save_cached_trades(trades, construct_risk_filename(filename, risk_params), save_results, sim_dir)
+                    combo_results.append((trades, metrics, None))
+            results.extend(combo_results)
+        return results
+
+    n_combos = len(strategy_param_grid)
+    long_signals = np.zeros((len(df), n_combos), dtype=np.int64)
+    short_signals = np.zeros((len(df), n_combos), dtype=np.int64)
+    valid = np.zeros((len(df), n_combos), dtype=bool)
+    df_valid = df.notna().all(axis=1).to_numpy()
+    filenames = []
+    for j, strategy_params in enumerate(strategy_param_grid):
+        strategy_name = strategy_params['name']
+        new_columns = add_signals(df, strategy_name,
+                                  {hyperparam_key: hyperparam_value for hyperparam_key, hyperparam_value in
+                                   strategy_params.items() if hyperparam_key != 'name'},
+                                  feature_store=feature_store)
+        features = pd.DataFrame(new_columns, index=df.index)
+
+        # Rows the per-combo dropna keeps
+        rows = df_valid & features.notna().all(axis=1).to_numpy()
+        valid[:, j] = rows
+        long_signal_col, short_signal_col = get_signal_column_names(strategy_name)
+        if long_signal_col in features.columns:
+            long_signals[rows, j] = features[long_signal_col].to_numpy()[rows]
+        if short_signal_col in features.columns:
+            short_signals[rows, j] = features[short_signal_col].to_numpy()[rows]
+
+        filename = construct_strategy_filename(strategy_params, trading_symbol, interval)
+        filenames.append(filename)
+
+        # Save feature file
+        if not save_feature_reference(strategy_params, filename, sim_dir, feature_store):
+            df_per_strategy = pd.concat([df, features], axis=1)[rows].reset_index(drop=True)
+            save_df_to_csv(df_per_strategy, os.path.join(get_features_dir(sim_dir), filename))
+
+    bar_arrays = extract_bar_arrays(df)
+    split_dfs = [df[valid[:, j]].reset_index(drop=True) for j in range(n_combos)]
+    base_risk_params = dict(stop_loss_pct=stop_loss_pct, trailing_stop_loss_pct=trailing_stop_loss_pct,
+                            target_profit_pct=target_profit_pct, hold_min_bars=hold_min_bars,
+                            hold_max_bars=hold_max_bars, slippage_pct=slippage_pct)
+    results = [[] for _ in range(n_combos)]
+    for risk_params in risk_param_grid or [{}]:
+        params = dict(base_risk_params, **risk_params)
+        trades_per_combo, equity = simulate_strategy_batch(
+            bar_arrays, long_signals, short_signals, valid, initial_capital, params['stop_loss_pct'],
+            params['trailing_stop_loss_pct'], params['target_profit_pct'], contract_size, params['hold_min_bars'],
+            params['hold_max_bars'], fill_rate, params['slippage_pct'], segment, exchange, intraday_only,
+            debug_logs_flag
+        )
+
+        for j, strategy_params in enumerate(strategy_param_grid):
+            trades = trades_per_combo[j]
+            split_df = split_dfs[j]
+            equity_curve = batch_equity_curve(split_df['date'].array, equity[valid[:, j], j], initial_capital)
+
+            # Generate Metrics (Simulation Results)
+            metrics = generate_simulation_results(equity_curve, initial_capital, interval, split_df,
+                                                  DataframeSplit.ALL.name, dict(strategy_params, **risk_params),
+                                                  trades, trading_symbol, debug_logs_flag)
+
+            # Save trade details
+            if save_results and len(trades) > 0:
+                trades_df = trades_to_frame(trades)
+                save_df_to_csv(trades_df, os.path.join(get_trades_dir(sim_dir),
+                                                       construct_risk_filename(filenames[j], risk_params)))
+
+            results[j].append((trades, [metrics], equity_curve))
+    return [result for combo_results in results for result in combo_results]
+
+
+def batch_equity_curve(dates, equity_values, initial_capital):
+    """
+    One combo's column of the batch equity matrix as the EquityCurve the other engines return. Until the first trade
+    is booked the final equity is initial_capital itself, as in the bar loop.
+    """
+    touched = (equity_values != initial_capital).any()
+    return EquityCurve(dates, equity_values, equity_values[-1].item() if touched else initial_capital)
+
+
+def run_engine(
+        engine, df, initial_capital,
+        stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
+        contract_size, hold_min_bars, hold_max_bars, fill_rate,
+        slippage_pct, segment, exchange, intraday_only, debug_logs_flag,
+        long_signal_col, short_signal_col
+):
+    """Dispatches to the selected simulation engine. All engines produce identical trades and equity curves."""
+    if engine == SimulationEngine.PANDAS.value:
+        return simulate_strategy(
+            df, initial_capital, stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
+            contract_size, hold_min_bars, hold_max_bars, fill_rate,
+            slippage_pct, segment, exchange, intraday_only, debug_logs_flag,
+            long_signal_col, short_signal_col
+        )
+    if engine in (SimulationEngine.ARRAY.value, SimulationEngine.EVENT.value):
+        arrays = extract_simulation_arrays(df, long_signal_col, short_signal_col)
+        simulate = simulate_strategy_arrays if engine == SimulationEngine.ARRAY.value else simulate_strategy_events
+        return simulate(
+            arrays, initial_capital, stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
+            contract_size, hold_min_bars, hold_max_bars, fill_rate,
+            slippage_pct, segment, exchange, intraday_only, debug_logs_flag
+        )
+    raise ValueError(f"Unknown simulation engine '{engine}'. Allowed: {[e.value for e in SimulationEngine]}")
+
+
 def simulate_strategy(
         df, initial_capital,
         stop_loss_pct, trailing_stop_loss_pct, target_profit_pct,
@@ -87,7 +390,7 @@ def simulate_strategy(
         long_signal_col, short_signal_col
 ):
     capital = initial_capital
-    equity_curve = []
+    equity = np.empty(len(df))
     position = None
     entry_price = 0
     qty = 0
@@ -137,163 +440,48 @@ def simulate_strategy(
                     stop_price, trail_high, target_price, slippage_pct, eod_exit,
                     long_signal_col=long_signal_col
                 )
-                if exit_price is not None and trade is not None:
-                    cost_buy = calculate_brokerage(segment, OrderSide.BUY.name, entry_price, qty, exchange)['total']
-                    cost_sell = calculate_brokerage(segment, OrderSide.SELL.name, exit_price, qty, exchange)['total']
-                    gross_pnl = (exit_price - entry_price) * qty
-                    total_fee = cost_buy + cost_sell
-                    pnl = gross_pnl - total_fee
-                    trade.update(dict(
-                        exit_time=row['date'],
-                        exit_price=exit_price,
-                        exit_reason=reason,
-                        pnl=pnl,
-                        gross_pnl=gross_pnl,
-                        fee_buy=cost_buy,
-                        fee_sell=cost_sell,
-                        total_fee=total_fee
-                    ))
-                    trades.append(trade)
-                    capital += pnl
-                    if debug_logs_flag:
-                        log_backtest_trade(TradeEvent.EXIT.name, trade, i)
-                    position, bars_held, entry_price, qty, stop_price, target_price, trail_high, trail_low = reset_state()
             elif position == OrderPosition.SHORT.name:
                 exit_price, reason, stop_price, trail_low = manage_short_exit(
                     row, bars_held, hold_min_bars, hold_max_bars, trailing_stop_loss_pct,
                     stop_price, trail_low, target_price, slippage_pct, eod_exit,
                     short_signal_col=short_signal_col
                 )
-                if exit_price is not None and trade is not None:
-                    cost_sell = calculate_brokerage(segment, OrderSide.SELL.name, entry_price, qty, exchange)['total']
-                    cost_buy = calculate_brokerage(segment, OrderSide.BUY.name, exit_price, qty, exchange)['total']
-                    gross_pnl = (entry_price - exit_price) * qty
-                    total_fee = cost_buy + cost_sell
-                    pnl = gross_pnl - total_fee
-                    trade.update(dict(
-                        exit_time=row['date'],
-                        exit_price=exit_price,
-                        exit_reason=reason,
-                        pnl=pnl,
-                        gross_pnl=gross_pnl,
-                        fee_buy=cost_buy,
-                        fee_sell=cost_sell,
-                        total_fee=total_fee
-                    ))
-                    trades.append(trade)
-                    capital += pnl
-                    if debug_logs_flag:
-                        log_backtest_trade(TradeEvent.EXIT.name, trade, i)
-                    position, bars_held, entry_price, qty, stop_price, target_price, trail_high, trail_low = reset_state()
+            if exit_price is not None and trade is not None:
+                capital += settle_trade(trade, position, row['date'], exit_price, reason, entry_price, qty,
+                                        segment, exchange)
+                trades.append(trade)
+                if debug_logs_flag:
+                    log_backtest_trade(TradeEvent.EXIT.name, trade, i)
+                position, bars_held, entry_price, qty, stop_price, target_price, trail_high, trail_low = reset_state()
         last_signal = 1 if signal_long == 1 else (-1 if signal_short == 1 else 0)
-        equity_curve.append(dict(date=row['date'], equity=capital))
-    return trades, equity_curve
+        equity[i] = capital
+    return trades, EquityCurve(df['date'].array, equity, capital)
 
 
 def try_long_entry(row, capital, fill_rate, contract_size, slippage_pct, stop_loss_pct, target_profit_pct):
-    price = row['close']
-    entry_price = price * (1 + slippage_pct)
-    qty = int((capital * fill_rate) // (entry_price * contract_size)) * contract_size
-    if qty == 0:
-        return None, None, None, None, None, None
-    stop_price = entry_price * (1 - stop_loss_pct) if stop_loss_pct else None
-    trail_high = entry_price
-    target_price = entry_price * (1 + target_profit_pct) if target_profit_pct else None
-    trade = dict(
-        direction=OrderPosition.LONG.name,
-        entry_time=row['date'],
-        entry_price=entry_price,
-        qty=qty,
-        exit_time=None,
-        exit_price=None,
-        exit_reason=None,
-        pnl=0.0,
-    )
-    return trade, entry_price, qty, stop_price, target_price, trail_high
+    return open_long_position(row['close'], row['date'], capital, fill_rate, contract_size, slippage_pct,
+                              stop_loss_pct, target_profit_pct)
 
 
 def try_short_entry(row, capital, fill_rate, contract_size, slippage_pct, stop_loss_pct, target_profit_pct):
-    price = row['close']
-    entry_price = price * (1 - slippage_pct)
-    qty = int((capital * fill_rate) // (entry_price * contract_size)) * contract_size
-    if qty == 0:
-        return None, None, None, None, None, None
-    stop_price = entry_price * (1 + stop_loss_pct) if stop_loss_pct else None
-    trail_low = entry_price
-    target_price = entry_price * (1 - target_profit_pct) if target_profit_pct else None
-    trade = dict(
-        direction=OrderPosition.SHORT.name,
-        entry_time=row['date'],
-        entry_price=entry_price,
-        qty=qty,
-        exit_time=None,
-        exit_price=None,
-        exit_reason=None,
-        pnl=0.0,
-    )
-    return trade, entry_price, qty, stop_price, target_price, trail_low
+    return open_short_position(row['close'], row['date'], capital, fill_rate, contract_size, slippage_pct,
+                               stop_loss_pct, target_profit_pct)
 
 
 def manage_long_exit(row, bars_held, hold_min_bars, hold_max_bars, trailing_stop_loss_pct,
                      stop_price, trail_high, target_price, slippage_pct, eod_exit,
                      long_signal_col='LONG_SIGNAL'):
-    high, low, price = row['high'], row['low'], row['close']
-    reason, exit_price = None, None
-    if trailing_stop_loss_pct:
-        if trail_high is not None and high > trail_high:
-            trail_high = high
-        new_stop = trail_high * (1 - trailing_stop_loss_pct) if trail_high is not None else None
-        if stop_price is None or (new_stop is not None and new_stop > stop_price):
-            stop_price = new_stop
-    if stop_price is not None and low <= stop_price:
-        exit_price = stop_price * (1 - slippage_pct)
-        reason = TradeExitReason.STOP_LOSS.name
-    elif target_price is not None and high >= target_price:
-        exit_price = target_price * (1 - slippage_pct)
-        reason = TradeExitReason.TARGET.name
-    elif row[long_signal_col] == 0 and (bars_held >= hold_min_bars):
-        exit_price = price * (1 - slippage_pct)
-        reason = TradeExitReason.CROSS_DOWN.name
-    elif hold_max_bars and bars_held >= hold_max_bars:
-        exit_price = price * (1 - slippage_pct)
-        reason = TradeExitReason.MAX_HOLD.name
-    if not exit_price and eod_exit:
-        exit_price = price * (1 - slippage_pct)
-        reason = TradeExitReason.EOD.name
-    return exit_price, reason, stop_price, trail_high
+    return resolve_long_exit(row['high'], row['low'], row['close'], row[long_signal_col], bars_held, hold_min_bars,
+                             hold_max_bars, trailing_stop_loss_pct, stop_price, trail_high, target_price,
+                             slippage_pct, eod_exit)
 
 
 def manage_short_exit(row, bars_held, hold_min_bars, hold_max_bars, trailing_stop_loss_pct,
                       stop_price, trail_low, target_price, slippage_pct, eod_exit,
                       short_signal_col='SHORT_SIGNAL'):
-    high, low, price = row['high'], row['low'], row['close']
-    reason, exit_price = None, None
-    if trailing_stop_loss_pct:
-        if trail_low is not None and low < trail_low:
-            trail_low = low
-        new_stop = trail_low * (1 + trailing_stop_loss_pct) if trail_low is not None else None
-        if stop_price is None or (new_stop is not None and new_stop < stop_price):
-            stop_price = new_stop
-    if stop_price is not None and high >= stop_price:
-        exit_price = stop_price * (1 + slippage_pct)
-        reason = TradeExitReason.STOP_LOSS.name
-    elif target_price is not None and low <= target_price:
-        exit_price = target_price * (1 + slippage_pct)
-        reason = TradeExitReason.TARGET.name
-    elif row[short_signal_col] == 0 and (bars_held >= hold_min_bars):
-        exit_price = price * (1 + slippage_pct)
-        reason = TradeExitReason.CROSS_UP.name
-    elif hold_max_bars and bars_held >= hold_max_bars:
-        exit_price = price * (1 + slippage_pct)
-        reason = TradeExitReason.MAX_HOLD.name
-    if not exit_price and eod_exit:
-        exit_price = price * (1 + slippage_pct)
-        reason = TradeExitReason.EOD.name
-    return exit_price, reason, stop_price, trail_low
-
-
-def reset_state():
-    return None, 0, None, 0, None, None, None, None
+    return resolve_short_exit(row['high'], row['low'], row['close'], row[short_signal_col], bars_held, hold_min_bars,
+                              hold_max_bars, trailing_stop_loss_pct, stop_price, trail_low, target_price,
+                              slippage_pct, eod_exit)
 
 
 def get_signal_column_names(strategy_name):
@@ -0,0 +1,61 @@
+"""
+Compact results of a simulation run. A trade is a __slots__ record instead of a dict, and the equity curve is two
+parallel arrays (the df's own date array and float64 equity) instead of one dict per bar, so a run over N bars holds
+two arrays rather than N small dicts with their boxed dates. Conversion to dicts / DataFrames happens only at the I/O
+boundary: trades_to_frame for the trades CSV, EquityCurve.to_frame for plots.
+"""
+import pandas as pd
+
+
+class Trade:
+    """One trade; the slots are the trades CSV columns, in order. Exit and fee fields stay None until settled."""
+    __slots__ = ('direction', 'entry_time', 'entry_price', 'qty', 'exit_time', 'exit_price', 'exit_reason', 'pnl',
+                 'gross_pnl', 'fee_buy', 'fee_sell', 'total_fee')
+
+    def __init__(self, direction, entry_time, entry_price, qty):
+        self.direction = direction
+        self.entry_time = entry_time
+        self.entry_price = entry_price
+        self.qty = qty
+        self.exit_time = None
+        self.exit_price = None
+        self.exit_reason = None
+        self.pnl = 0.0
+        self.gross_pnl = None
+        self.fee_buy = None
+        self.fee_sell = None
+        self.total_fee = None
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __eq__(self, other):
+        return isinstance(other, Trade) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"Trade({self.to_dict()})"
+
+
+def trades_to_frame(trades):
+    """Settled trades as the trades CSV DataFrame, one column per Trade slot."""
+    return pd.DataFrame({field: [getattr(trade, field) for trade in trades] for field in Trade.__slots__})
+
+
+class EquityCurve:
+    """
+    Equity after every bar. dates is the simulated df's date array (shared, not copied) and equity a float64 array.
+    final_equity is the capital exactly as the engine last held it: initial_capital itself (e.g. an int) until a
+    trade is booked, so metrics report it with the same type as before.
+    """
+    __slots__ = ('dates', 'equity', 'final_equity')
+
+    def __init__(self, dates, equity, final_equity):
+        self.dates = dates
+        self.equity = equity
+        self.final_equity = final_equity
+
+    def __len__(self):
+        return len(self.equity)
+
+    def to_frame(self):
+        return pd.DataFrame(dict(date=self.dates, equity=self.equity))
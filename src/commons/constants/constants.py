@@ -85,3 +85,14 @@ class DataframeSplit(Enum):
     ALL = "ALL"
     TRAIN = "TRAIN"
     TEST = "TEST"
+
+
+class SimulationEngine(Enum):
+    PANDAS = "pandas"
+    ARRAY = "array"
+    EVENT = "event"
+
+
+class EnrichmentMode(Enum):
+    CONCAT = "concat"
+    COLUMNAR = "columnar"
@@ -1,3 +1,13 @@
+from src.indicators.streaming import iter_bars
+
+EMA_WARMUP_SPANS = 10  # an adjust=False EMA seeded k spans late differs by ~exp(-2k) of the seed gap
+
+
+def ema_warmup_bars(span):
+    """Bars an EMA needs before a later-seeded one agrees with the full-history one (to ~1e-9 of the seed gap)."""
+    return EMA_WARMUP_SPANS * span
+
+
 class BaseIndicatorStrategy:
     def __init__(self, name):
         self.name = name
@@ -18,5 +28,44 @@ class BaseIndicatorStrategy:
         """
         return combos
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        """
+        Returns the primitive_graph nodes compute_signals builds on for these params, so apply_indicators can plan
+        them once across all indicators. By default, nothing is declared.
+        """
+        return []
+
+    @classmethod
+    def warmup_bars(cls, params):
+        """
+        Number of preceding bars a row's columns depend on (up to float rounding) for these params, so incremental
+        enrichment can recompute only a tail of the history. None means the indicator depends on the whole history
+        (running totals, path-dependent recursions) and is always computed from the first bar; that is the default.
+        """
+        return None
+
     def compute_signals(self, df, params, df_col_suffix=None):
         raise NotImplementedError("Each indicator must implement its own compute_signals method.")
+
+    def create_stream(self, params, df_col_suffix=None):
+        """
+        Returns update(bar) -> {column: value} for these params: the same columns and values as the last row of
+        compute_signals over every bar fed so far, at a per-bar cost independent of the history length.
+        bar maps 'open'/'high'/'low'/'close'/'volume' to the candle's values.
+        """
+        raise NotImplementedError(f"{self.name} does not implement streaming updates.")
+
+    def start_stream(self, params, warmup_df=None, df_col_suffix=None):
+        """Starts a live stream by replaying the warm-up bars of warmup_df. Returns the latest output (None if none)."""
+        self.stream_update = self.create_stream(params, df_col_suffix=df_col_suffix)
+        self.latest = None
+        if warmup_df is not None:
+            for bar in iter_bars(warmup_df):
+                self.latest = self.stream_update(bar)
+        return self.latest
+
+    def update(self, bar):
+        """Feeds one new bar into the stream started by start_stream and returns its columns."""
+        self.latest = self.stream_update(bar)
+        return self.latest
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# pandas >= 3 is always Copy-on-Write: concat and positional column selection share the buffers instead of copying
+PANDAS_COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3
+
+
+class ColumnarFrameBuilder:
+    """
+    Collects the new columns of many enrich runs into preallocated 2-D buffers, one per dtype, and materializes the
+    enriched frame once. Compared to one pd.concat per run, this never copies the growing frame; each column is
+    written into its buffer exactly once and the final frame is built on views of the buffers.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.n_rows = len(df)
+        self.buffers = {}  # dtype -> [2-D buffer (capacity x n_rows), used columns, names]
+        self.extra_frames = []  # single-column frames for non-numpy (extension) dtypes
+        self.layout = []  # (dtype or None, slot) per new column, in insertion order
+        self.indicator_column_counts = {}
+        self.peak_buffer_bytes = 0
+
+    def reserve(self, new_columns, times):
+        """Grows the buffers ahead of `times` more runs shaped like new_columns, so they fill without regrowing."""
+        needed = {}
+        for series in new_columns.values():
+            if isinstance(series.dtype, np.dtype):
+                needed[series.dtype] = needed.get(series.dtype, 0) + times
+        for dtype, count in needed.items():
+            self._ensure_capacity(dtype, count, exact=True)
+
+    def add_columns(self, indicator_name, new_columns):
+        for name, series in new_columns.items():
+            if isinstance(series.dtype, np.dtype):
+                self._ensure_capacity(series.dtype, 1)
+                buffer = self.buffers[series.dtype]
+                slot = buffer[1]
+                buffer[0][slot] = series.to_numpy()
+                buffer[1] += 1
+                buffer[2].append(name)
+                self.layout.append((series.dtype, slot))
+            else:
+                self.extra_frames.append(pd.DataFrame({name: series}, index=self.df.index))
+                self.layout.append((None, len(self.extra_frames) - 1))
+        self.indicator_column_counts[indicator_name] = (
+                self.indicator_column_counts.get(indicator_name, 0) + len(new_columns))
+
+    def build(self):
+        """
+        Returns df with every added column appended in insertion order (duplicate names are kept, as concat did).
+        One concat of df and a frame per dtype buffer, then a positional reorder. Neither copies under Copy-on-Write:
+        the reorder keeps one block per dtype and only re-places its columns. Older pandas would copy in both steps,
+        so concat is told not to and the data is copied only once, by the reorder.
+        """
+        frames = [self.df]
+        offsets = {}
+        position = len(self.df.columns)
+        for dtype, (buffer, used, names) in self.buffers.items():
+            if PANDAS_COPY_ON_WRITE and used < 0.75 * len(buffer):
+                buffer = buffer[:used].copy()  # The frame shares the buffer: don't let it pin a doubled buffer's slack
+            frames.append(pd.DataFrame(buffer[:used].T, index=self.df.index, columns=names, copy=False))
+            offsets[dtype] = position
+            position += used
+        offsets[None] = position
+        frames.extend(self.extra_frames)
+
+        order = list(range(len(self.df.columns)))
+        order.extend(offsets[dtype] + slot for dtype, slot in self.layout)
+        concat_kwargs = {} if PANDAS_COPY_ON_WRITE else dict(copy=False)
+        return pd.concat(frames, axis=1, **concat_kwargs).iloc[:, order]
+
+    def report(self):
+        print(f"📊 Columnar enrichment: {len(self.layout)} new columns over {self.n_rows} rows")
+        for indicator_name, count in self.indicator_column_counts.items():
+            print(f"   - {indicator_name:<14}: {count} columns")
+        print(f"   Peak column buffers: {self.peak_buffer_bytes / 1024 ** 2:.1f} MB")
+        if resource is not None:
+            # ru_maxrss is KB on Linux
+            print(f"   Peak process RSS  : {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+
+    def _ensure_capacity(self, dtype, count, exact=False):
+        buffer = self.buffers.get(dtype)
+        if buffer is None:
+            buffer = self.buffers[dtype] = [np.empty((0, self.n_rows), dtype=dtype), 0, []]
+        capacity = len(buffer[0])
+        if buffer[1] + count <= capacity:
+            return
+        new_capacity = buffer[1] + count if exact else max(buffer[1] + count, 2 * capacity)
+        grown = np.empty((new_capacity, self.n_rows), dtype=dtype)
+        grown[:buffer[1]] = buffer[0][:buffer[1]]
+        buffer[0] = grown
+        self.peak_buffer_bytes = max(self.peak_buffer_bytes, sum(b[0].nbytes for b in self.buffers.values()))
@@ -1,6 +1,9 @@
 import itertools
 
-from src.indicators.registry import get_indicator, enrich_df
+from src.commons.constants.constants import EnrichmentMode
+from src.indicators.columnar_builder import ColumnarFrameBuilder
+from src.indicators.primitive_graph import plan_primitives, evaluate_plan
+from src.indicators.registry import get_indicator, enrich_df, add_signals
 from src.utils.file_util import read_config
 
 INDICATOR_CONFIG_PATH = "config/indicator-config.yaml"
@@ -8,15 +11,69 @@ INDICATOR_CONFIG_PATH = "config/indicator-config.yaml"
 
 def apply_indicators(df):
     indicator_config = read_config(INDICATOR_CONFIG_PATH)
+    runs = build_enrichment_runs(indicator_config)
+    return enrich_runs(df, runs, indicator_config.get("enrichment_mode", EnrichmentMode.CONCAT.value),
+                       indicator_config.get("debug_logs", False))
 
+
+def apply_indicators_from(df, first_row):
+    """
+    Same columns as apply_indicators(df), for the rows from position first_row on. Indicators with a bounded
+    warm-up (warmup_bars) only see the bars they need before first_row; the others are computed over all of df.
+    Values agree with a full enrichment up to float rounding and the EMA warm-up error (see ema_warmup_bars).
+    """
+    indicator_config = read_config(INDICATOR_CONFIG_PATH)
+    runs = build_enrichment_runs(indicator_config)
+    debug_logs_flag = indicator_config.get("debug_logs", False)
+
+    windowed_runs, full_history_runs = [], []
+    full_history = set()  # positions in runs
+    lookback = 0
+    for position, run in enumerate(runs):
+        indicator_name, params, _ = run
+        try:
+            warmup = get_indicator(indicator_name).warmup_bars(params)
+        except KeyError:
+            warmup = None  # compute_signals reports the missing hyperparams
+        if warmup is None:
+            full_history.add(position)
+            full_history_runs.append(run)
+        else:
+            windowed_runs.append(run)
+            lookback = max(lookback, warmup)
+
+    tail_start = max(0, first_row - lookback)
+    tail = df.iloc[tail_start:]
+    print(f"⏩ Recomputing {len(tail)} of {len(df)} bars ({lookback} warm-up) for {len(windowed_runs)} indicator "
+          f"runs, full history for {len(full_history_runs)}")
+    evaluate_shared_primitives(tail, windowed_runs, debug_logs_flag)
+    if full_history_runs:
+        evaluate_shared_primitives(df, full_history_runs, debug_logs_flag)
+
+    builder = ColumnarFrameBuilder(tail)
+    for position, (indicator_name, params, df_col_suffix) in enumerate(runs):
+        log_enrichment_run(indicator_name, params, df_col_suffix)
+        if position in full_history:
+            new_columns = add_signals(df, indicator_name, params, df_col_suffix=df_col_suffix)
+            new_columns = {name: series.iloc[tail_start:] for name, series in new_columns.items()}
+        else:
+            new_columns = add_signals(tail, indicator_name, params, df_col_suffix=df_col_suffix)
+        if new_columns:
+            builder.add_columns(indicator_name, new_columns)
+    return builder.build().iloc[first_row - tail_start:]
+
+
+def build_enrichment_runs(indicator_config):
+    """(indicator_name, params, df_col_suffix) of every run the indicator config asks for, in enrichment order."""
     grid_search_enabled = indicator_config.get("grid_search_enabled", False)
     active = indicator_config["active_indicators"]  # Picks up active indicators
     base_strategy_configs = indicator_config["default_hyperparam_values"]  # Picks up default hyperparam values
 
+    runs = []
     if grid_search_enabled:
         for indicator_name in active:
             indicator_class = get_indicator(indicator_name)
-            default_params = base_strategy_configs.get(indicator_name, {})
+            default_params = dict(base_strategy_configs.get(indicator_name, {}))
 
             grid = indicator_class.grid_ranges(default_params)
             param_names = list(grid.keys())
@@ -31,14 +88,80 @@ def apply_indicators(df):
 
             for combo in valid_combos:
                 df_col_suffix = "_" + "_".join(f"{key}{value}" for key, value in combo.items())
-                print(f"Enriching with params: {combo} -> suffix: {df_col_suffix}")
-                df = enrich_df(df, indicator_name, combo, df_col_suffix)
+                runs.append((indicator_name, combo, df_col_suffix))
     else:
         for indicator_name in active:
-            params = base_strategy_configs.get(indicator_name, {})
-            print(f"Enriching {indicator_name} with default params: {params}")
-            df = enrich_df(df, indicator_name, params, None)
+            params = dict(base_strategy_configs.get(indicator_name, {}))
+            runs.append((indicator_name, params, None))
+    return runs
+
+
+def enrich_runs(df, runs, enrichment_mode, debug_logs_flag=False):
+    evaluate_shared_primitives(df, runs, debug_logs_flag)
+
+    if enrichment_mode == EnrichmentMode.COLUMNAR.value:
+        return enrich_columnar(df, runs, debug_logs_flag)
+
+    for indicator_name, params, df_col_suffix in runs:
+        log_enrichment_run(indicator_name, params, df_col_suffix)
+        df = enrich_df(df, indicator_name, params, df_col_suffix)
 
     # Defragment before cleanup and save!
     df = df.copy()
     return df
+
+
+def evaluate_shared_primitives(df, runs, debug_logs_flag=False):
+    """
+    Plans the primitives declared by every (indicator, params) run and evaluates each distinct one once up front,
+    so the compute_signals calls that follow read true range, rolling extremes, EMA chains, ... from the cache.
+    """
+    requested = []
+    for indicator_name, params, _ in runs:
+        try:
+            requested.extend(get_indicator(indicator_name).primitive_nodes(params))
+        except KeyError:
+            continue  # compute_signals reports the missing hyperparams
+    plan = plan_primitives(requested)
+    if debug_logs_flag:
+        log_primitive_plan(plan, runs)
+    evaluate_plan(df, plan)
+
+
+def enrich_columnar(df, runs, debug_logs_flag=False):
+    """
+    Same columns as the enrich_df loop, but collected into a ColumnarFrameBuilder and materialized in one pass,
+    so grid sweeps stay linear in the number of combos instead of re-copying the growing frame on every run.
+    """
+    runs_per_indicator = {}
+    for indicator_name, _, _ in runs:
+        runs_per_indicator[indicator_name] = runs_per_indicator.get(indicator_name, 0) + 1
+
+    builder = ColumnarFrameBuilder(df)
+    seen_indicators = set()
+    for indicator_name, params, df_col_suffix in runs:
+        log_enrichment_run(indicator_name, params, df_col_suffix)
+        new_columns = add_signals(df, indicator_name, params, df_col_suffix=df_col_suffix)
+        if not new_columns:
+            continue
+        if indicator_name not in seen_indicators:
+            # Every combo of an indicator yields the same columns: size the buffers for all of them up front
+            seen_indicators.add(indicator_name)
+            builder.reserve(new_columns, runs_per_indicator[indicator_name])
+        builder.add_columns(indicator_name, new_columns)
+
+    df = builder.build()
+    if debug_logs_flag:
+        builder.report()
+    return df
+
+
+def log_enrichment_run(indicator_name, params, df_col_suffix):
+    if df_col_suffix is None:
+        print(f"Enriching {indicator_name} with default params: {params}")
+    else:
+        print(f"Enriching with params: {params} -> suffix: {df_col_suffix}")
+
+
+def log_primitive_plan(plan, runs):
+    print(f"🧮 Planned {len(plan)} distinct primitives for {len(runs)} indicator runs")
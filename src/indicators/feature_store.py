@@ -0,0 +1,108 @@
+"""
+Persistent store of computed signal columns, keyed by (dataset digest, indicator, params, column suffix). An entry is
+an uncompressed .npz of the columns as plain NumPy arrays, so a hit is one file read instead of an indicator run, and
+each signal set is kept on disk once however many simulation runs use it: their feature dirs only hold references
+(see write_feature_reference). Keys include a fingerprint of the indicator sources (FEATURE_CODE_PATHS), so an
+indicator edit never serves old signals; bump FEATURE_STORE_VERSION when the stored format changes.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.utils.file_util import compute_config_hash, compute_dataframe_digest, compute_source_fingerprint, read_json, \
+    write_json_atomic, FEATURE_STORE_DIR
+
+FEATURE_STORE_VERSION = 1
+FEATURE_CODE_PATHS = ("src/indicators", "src/commons")
+
+
+def create_feature_store(df, store_dir=FEATURE_STORE_DIR, source_path=None):
+    """
+    Picklable handle for one dataset: where its signals are stored and the digest they are keyed on. Only pass it
+    along with this exact df. source_path is the CSV df was read from (read_csv with parse_dates=['date'], then sorted
+    by date); without it features are still cached but sim dirs get full feature CSVs instead of references.
+    """
+    return dict(store_dir=store_dir, data_digest=compute_dataframe_digest(df), n_rows=len(df), source_path=source_path,
+                code_fingerprint=compute_source_fingerprint(*FEATURE_CODE_PATHS))
+
+
+def compute_feature_key(feature_store, indicator_name, params, df_col_suffix=None):
+    return compute_config_hash(dict(
+        version=FEATURE_STORE_VERSION, data_digest=feature_store['data_digest'],
+        code_fingerprint=feature_store['code_fingerprint'], indicator=indicator_name, params=params,
+        df_col_suffix=df_col_suffix
+    ))
+
+
+def get_feature_path(feature_store, key):
+    return os.path.join(feature_store['store_dir'], key[:2], f"{key}.npz")
+
+
+def load_signal_columns(feature_store, key, index):
+    """The {column: Series} stored under key, on the given index, or None if there is no entry."""
+    path = get_feature_path(feature_store, key)
+    if not os.path.exists(path):
+        return None
+    return read_signal_columns(path, index)
+
+
+def read_signal_columns(path, index):
+    with np.load(path, allow_pickle=False) as entry:
+        names = entry['columns'].tolist()
+        return {name: pd.Series(entry[f"arr_{i}"], index=index) for i, name in enumerate(names)}
+
+
+def store_signal_columns(feature_store, key, new_columns):
+    """
+    Saves the columns compute_signals returned under key. Columns that are not plain NumPy numeric/bool arrays are
+    not stored (the entry is skipped), so a later load always rebuilds exactly what was computed.
+    """
+    arrays = [np.asarray(values) for values in new_columns.values()]
+    if any(array.dtype.kind not in 'biuf' for array in arrays):
+        return False
+    path = get_feature_path(feature_store, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+    try:
+        np.savez(tmp_path, *arrays, columns=np.array(list(new_columns), dtype=str))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return True
+
+
+def write_feature_reference(feature_store, path, indicator_name, params, df_col_suffix=None):
+    """
+    Writes a small JSON reference to the stored signals of (indicator_name, params) in place of a feature CSV: the
+    source data file, how many of its rows were used, their digest and the feature entry. load_feature_reference
+    rebuilds the same frame the CSV held (source data plus signals, incomplete rows dropped), also after new candles
+    are appended to the source. Returns False, writing nothing, if there is no source path or no stored entry.
+    """
+    feature_path = get_feature_path(feature_store, compute_feature_key(feature_store, indicator_name, params,
+                                                                       df_col_suffix))
+    if feature_store['source_path'] is None or not os.path.exists(feature_path):
+        return False
+    write_json_atomic(dict(source_path=feature_store['source_path'], n_rows=feature_store['n_rows'],
+                           data_digest=feature_store['data_digest'], feature_path=feature_path, dropna=True), path)
+    return True
+
+
+def load_feature_reference(path):
+    reference = read_json(path)
+    df = pd.read_csv(reference['source_path'], parse_dates=['date'])
+    df.sort_values('date', inplace=True)
+    df.reset_index(drop=True, inplace=True)
+    # Candles appended to the source since sort after the referenced rows, so only that prefix has to match
+    df = df.iloc[:reference.get('n_rows')]
+    if compute_dataframe_digest(df) != reference['data_digest']:
+        raise ValueError(f"Source data {reference['source_path']} changed since {path} was written")
+
+    df = pd.concat([df, pd.DataFrame(read_signal_columns(reference['feature_path'], df.index), index=df.index)],
+                   axis=1)
+    if reference['dropna']:
+        df.dropna(inplace=True)
+        df.reset_index(drop=True, inplace=True)
+    return df
@@ -0,0 +1,195 @@
+"""
+Recursive indicator kernels over plain Python lists. Bar-by-bar recursions cannot be vectorized, and stepping them
+with Series.iloc costs microseconds per access; the same loop over lists of floats is orders of magnitude faster.
+Each kernel mirrors the arithmetic and comparison order of the loop it replaced (including the builtin min/max
+behaviour around NaN), so the output is identical.
+"""
+import heapq
+import math
+from collections import deque
+
+
+def supertrend_kernel(close, basic_ub, basic_lb, start):
+    """
+    SuperTrend final-band and trend-state recursion. close/basic_ub/basic_lb are equal-length lists; the trend line is
+    only defined from bar `start` (the ATR period) on and NaN before it. Returns the SuperTrend line as a list.
+    """
+    n = len(close)
+    final_ub = list(basic_ub)
+    final_lb = list(basic_lb)
+    for i in range(1, n):
+        if not close[i - 1] > final_ub[i - 1]:
+            final_ub[i] = min(basic_ub[i], final_ub[i - 1])
+        if not close[i - 1] < final_lb[i - 1]:
+            final_lb[i] = max(basic_lb[i], final_lb[i - 1])
+
+    super_trend = [math.nan] * n
+    in_uptrend = True
+    for i in range(start, n):
+        if in_uptrend:
+            if close[i] < final_ub[i]:
+                in_uptrend = False
+        else:
+            if close[i] > final_lb[i]:
+                in_uptrend = True
+        super_trend[i] = final_lb[i] if in_uptrend else final_ub[i]
+    return super_trend
+
+
+def psar_kernel(high, low, af, max_af):
+    """
+    Parabolic SAR recursion over lists of highs and lows, written into a preallocated list. Starts in an uptrend with
+    SAR at the first low and the extreme point at the first high, exactly like the original append loop.
+    """
+    n = len(high)
+    psar = [0.0] * n
+    psar[0] = prev_psar = low[0]
+    uptrend = True
+    ep = high[0]
+    curr_af = af
+    for i in range(1, n):
+        psar_i = prev_psar + curr_af * (ep - prev_psar)
+        if uptrend:
+            # Check for reversal
+            if low[i] < psar_i:
+                uptrend = False
+                psar_i = ep
+                ep = low[i]
+                curr_af = af
+            elif high[i] > ep:
+                ep = high[i]
+                curr_af = min(curr_af + af, max_af)
+        else:
+            if high[i] > psar_i:
+                uptrend = True
+                psar_i = ep
+                ep = high[i]
+                curr_af = af
+            elif low[i] < ep:
+                ep = low[i]
+                curr_af = min(curr_af + af, max_af)
+        psar[i] = prev_psar = psar_i
+    return psar
+
+
+def rolling_arg_extreme(values, window, is_max):
+    """
+    Monotonic-deque rolling arg-max (is_max) / arg-min over full windows of `window` bars, O(n) overall.
+    Returns (bars_since, extremes): bars since the window extreme (ties resolve to the most recent bar, like
+    argmax over the reversed window) and the extreme value itself. Both are NaN until the window is full and for
+    every window containing a NaN or inf, matching rolling(window) with its default min_periods.
+    """
+    n = len(values)
+    bars_since = [math.nan] * n
+    extremes = [math.nan] * n
+    candidates = deque()  # indices whose values strictly decrease (max) / increase (min) from the front
+    last_nan = -window
+    for i in range(n):
+        value = values[i]
+        if not -math.inf < value < math.inf:  # rolling() treats +/-inf as missing, like NaN
+            last_nan = i
+            candidates.clear()
+            continue
+        if is_max:
+            while candidates and values[candidates[-1]] <= value:
+                candidates.pop()
+        else:
+            while candidates and values[candidates[-1]] >= value:
+                candidates.pop()
+        candidates.append(i)
+        if candidates[0] <= i - window:
+            candidates.popleft()
+        if i >= window - 1 and i - last_nan >= window:
+            bars_since[i] = i - candidates[0]
+            extremes[i] = values[candidates[0]]
+    return bars_since, extremes
+
+
+class RollingMedian:
+    """
+    Streaming median of the last `window` values in O(log window) per update: a max-heap (negated) holds the lower
+    half and a min-heap the upper half, and values leaving the window are deleted lazily once they reach a heap top.
+    update() returns the median of the full window, or NaN while it fills or holds a NaN/inf, like
+    rolling(window).median(). An even window averages its two middle values the same way pandas does.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self.values = deque()
+        self.low = []  # negated, max-heap of the lower half
+        self.high = []  # min-heap of the upper half
+        self.low_size = 0  # live (not lazily deleted) entries per heap
+        self.high_size = 0
+        self.delayed = {}  # value -> copies deleted but still inside a heap
+
+    def update(self, value):
+        if not -math.inf < value < math.inf:  # rolling() treats +/-inf as missing, like NaN
+            self.reset()
+            return math.nan
+        if len(self.values) == self.window:
+            self._remove(self.values.popleft())
+        self.values.append(value)
+        self._insert(value)
+        if len(self.values) < self.window:
+            return math.nan
+        return self.median()
+
+    def median(self):
+        if self.low_size > self.high_size:
+            return -self.low[0]
+        return (self.high[0] + -self.low[0]) / 2
+
+    def _insert(self, value):
+        if not self.low or value <= -self.low[0]:
+            heapq.heappush(self.low, -value)
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, value)
+            self.high_size += 1
+        self._rebalance()
+
+    def _remove(self, value):
+        self.delayed[value] = self.delayed.get(value, 0) + 1
+        if value <= -self.low[0]:
+            self.low_size -= 1
+            if value == -self.low[0]:
+                self._prune(self.low, -1)
+        else:
+            self.high_size -= 1
+            if value == self.high[0]:
+                self._prune(self.high, 1)
+        self._rebalance()
+
+    def _prune(self, heap, sign):
+        while heap:
+            value = sign * heap[0]
+            count = self.delayed.get(value)
+            if not count:
+                return
+            if count == 1:
+                del self.delayed[value]
+            else:
+                self.delayed[value] = count - 1
+            heapq.heappop(heap)
+
+    def _rebalance(self):
+        # Keep low_size == high_size or high_size + 1
+        if self.low_size > self.high_size + 1:
+            heapq.heappush(self.high, -heapq.heappop(self.low))
+            self.low_size -= 1
+            self.high_size += 1
+            self._prune(self.low, -1)
+        elif self.low_size < self.high_size:
+            heapq.heappush(self.low, -heapq.heappop(self.high))
+            self.low_size += 1
+            self.high_size -= 1
+            self._prune(self.high, 1)
+
+
+def rolling_median_kernel(values, window):
+    """Batch rolling median over a list by streaming it through RollingMedian."""
+    rolling_median = RollingMedian(window)
+    return [rolling_median.update(value) for value in values]
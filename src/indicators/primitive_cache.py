@@ -0,0 +1,100 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+PRIMITIVE_CACHE_BUDGET_MB = 512
+
+
+class PrimitiveCache:
+    """
+    LRU cache of intermediate indicator series keyed by (primitive, input digests, params), bounded by the bytes
+    held rather than by entry count. Hits hand back shallow copies, so a caller writing into its result (copy on
+    write) can never corrupt the cached series.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.entries = OrderedDict()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key, compute):
+        series = self.get(key)
+        if series is not None:
+            return series
+
+        self.misses += 1
+        series = compute()
+        size = series.memory_usage(index=False, deep=False)
+        if size <= self.budget_bytes:
+            self.entries[key] = series
+            self.used_bytes += size
+            while self.used_bytes > self.budget_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.used_bytes -= evicted.memory_usage(index=False, deep=False)
+        return series.copy(deep=False)
+
+    def get(self, key):
+        """Shallow copy of the cached series for key, or None."""
+        series = self.entries.get(key)
+        if series is None:
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return series.copy(deep=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.used_bytes = 0
+
+    def stats(self):
+        return dict(entries=len(self.entries), used_mb=round(self.used_bytes / 1024 ** 2, 2),
+                    hits=self.hits, misses=self.misses)
+
+
+_primitive_cache = PrimitiveCache(PRIMITIVE_CACHE_BUDGET_MB * 1024 ** 2)
+
+
+def get_primitive_cache():
+    return _primitive_cache
+
+
+def array_digest(values):
+    """
+    Content digest of a numpy array. Hashed on every lookup (a few ms per million bytes) rather than memoized per
+    buffer: a column written in place keeps its buffer, and a stale digest would serve primitives of the old values.
+    """
+    values = np.asarray(values)
+    digest = hashlib.blake2b(np.ascontiguousarray(values).data, digest_size=16)
+    digest.update(f"{values.dtype.str}{values.shape}".encode())
+    return digest.hexdigest()
+
+
+def series_digest(series):
+    """Digest of a Series' values, index and name: equal digests give identical primitive results."""
+    index = series.index
+    if isinstance(index, pd.RangeIndex):
+        index_key = (index.start, index.stop, index.step)
+    else:
+        index_key = array_digest(index.to_numpy())
+    return array_digest(series.to_numpy()), index_key, series.name
+
+
+def memoize_primitive(primitive, inputs, params, compute):
+    """
+    Returns compute() for primitive(inputs, params), computed at most once per distinct input content so a grid
+    sweep over one dataset shares every EMA/SMA/ATR/... it has already built.
+    """
+    return _primitive_cache.get_or_compute(primitive_key(primitive, inputs, params), compute)
+
+
+def lookup_primitive(primitive, inputs, params):
+    """The cached result of primitive(inputs, params), or None if it has not been computed yet."""
+    return _primitive_cache.get(primitive_key(primitive, inputs, params))
+
+
+def primitive_key(primitive, inputs, params):
+    return primitive, tuple(series_digest(series) for series in inputs), params
@@ -0,0 +1,163 @@
+"""
+Declarative graph of the primitives in src/indicators/primitives.py. Strategies describe the series they build on as
+PrimitiveNodes; structurally equal nodes hash equal, so planning the nodes of every active indicator collapses shared
+sub-expressions (true range, rolling extremes, EMA chains, ...) into one evaluation each.
+"""
+from collections import namedtuple
+
+from src.indicators import primitives
+
+
+PrimitiveNode = namedtuple('PrimitiveNode', ['op', 'inputs', 'params'])
+
+# op -> primitive called with the input series followed by the params
+PRIMITIVE_OPS = {
+    'ema': primitives.ema,
+    'sma': primitives.sma,
+    'rolling_sum': primitives.rolling_sum,
+    'rolling_median': primitives.rolling_median,
+    'rolling_std': primitives.rolling_std,
+    'rolling_max': primitives.rolling_max,
+    'rolling_min': primitives.rolling_min,
+    'bars_since_max': primitives.bars_since_max,
+    'bars_since_min': primitives.bars_since_min,
+    'rolling_mad': primitives.rolling_mean_abs_deviation,
+    'up_moves': primitives.up_moves,
+    'down_moves': primitives.down_moves,
+    'up_flow': primitives.up_flow,
+    'down_flow': primitives.down_flow,
+    'signed_flow': primitives.signed_flow,
+    'cumulative_signed_flow': primitives.cumulative_signed_flow,
+    'true_range': primitives.true_range,
+    'price_range': primitives.price_range,
+}
+
+# op -> batched primitive taking the input series and a list of params, for nodes that differ only in their param
+BATCHED_OPS = {
+    'ema': primitives.emas,
+    'sma': primitives.smas,
+}
+
+
+def column(name):
+    return PrimitiveNode('column', (), (name,))
+
+
+def ema(node, span):
+    return PrimitiveNode('ema', (node,), (span,))
+
+
+def sma(node, window):
+    return PrimitiveNode('sma', (node,), (window,))
+
+
+def rolling_std(node, window):
+    return PrimitiveNode('rolling_std', (node,), (window,))
+
+
+def rolling_sum(node, window):
+    return PrimitiveNode('rolling_sum', (node,), (window,))
+
+
+def rolling_median(node, window):
+    return PrimitiveNode('rolling_median', (node,), (window,))
+
+
+def rolling_max(node, window):
+    return PrimitiveNode('rolling_max', (node,), (window,))
+
+
+def rolling_min(node, window):
+    return PrimitiveNode('rolling_min', (node,), (window,))
+
+
+def bars_since_max(node, window):
+    return PrimitiveNode('bars_since_max', (node,), (window,))
+
+
+def bars_since_min(node, window):
+    return PrimitiveNode('bars_since_min', (node,), (window,))
+
+
+def rolling_mean_abs_deviation(node, window):
+    return PrimitiveNode('rolling_mad', (node,), (window,))
+
+
+def up_moves(node):
+    return PrimitiveNode('up_moves', (node,), ())
+
+
+def down_moves(node):
+    return PrimitiveNode('down_moves', (node,), ())
+
+
+def up_flow(node, flow):
+    return PrimitiveNode('up_flow', (node, flow), ())
+
+
+def down_flow(node, flow):
+    return PrimitiveNode('down_flow', (node, flow), ())
+
+
+def signed_flow(node, flow):
+    return PrimitiveNode('signed_flow', (node, flow), ())
+
+
+def cumulative_signed_flow(node, flow):
+    return PrimitiveNode('cumulative_signed_flow', (node, flow), ())
+
+
+def true_range(high=None, low=None, close=None):
+    return PrimitiveNode('true_range', (high or column('high'), low or column('low'), close or column('close')), ())
+
+
+def price_range(high=None, low=None):
+    return PrimitiveNode('price_range', (high or column('high'), low or column('low')), ())
+
+
+def average_true_range(period):
+    return sma(true_range(), period)
+
+
+def plan_primitives(nodes):
+    """Unique nodes reachable from `nodes`, every node listed after all of its inputs."""
+    order = []
+    seen = set()
+
+    def visit(node):
+        if node in seen:
+            return
+        seen.add(node)
+        for input_node in node.inputs:
+            visit(input_node)
+        order.append(node)
+
+    for node in nodes:
+        visit(node)
+    return order
+
+
+def evaluate_plan(df, plan):
+    """
+    Evaluates each planned node once against df. Results land in the primitive cache that compute_signals reads.
+    EMA/SMA nodes over the same input are evaluated together, so a grid sweep computes all its spans in one block.
+    """
+    batches = {}
+    for node in plan:
+        if node.op in BATCHED_OPS:
+            batches.setdefault((node.op, node.inputs), []).append(node)
+
+    values = {}
+    for node in plan:
+        if node in values:
+            continue
+        if node.op == 'column':
+            values[node] = df[node.params[0]]
+        elif node.op in BATCHED_OPS:
+            batch = batches[(node.op, node.inputs)]
+            results = BATCHED_OPS[node.op](values[node.inputs[0]], [batch_node.params[0] for batch_node in batch])
+            for batch_node in batch:
+                values[batch_node] = results[batch_node.params[0]]
+        else:
+            values[node] = PRIMITIVE_OPS[node.op](*[values[input_node] for input_node in node.inputs], *node.params)
+    return values
@@ -0,0 +1,214 @@
+"""
+Building blocks shared by several indicators. Each one is memoized on the content of its inputs, so e.g. EMA(21) of
+a close series is computed once however many EMA_CROSS/MACD/KELTNER param sets ask for it. The formulas are exactly
+the ones the indicators used inline, so results are unchanged.
+"""
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.indicators.kernels import rolling_arg_extreme
+from src.indicators.primitive_cache import lookup_primitive, memoize_primitive
+
+MAD_BLOCK_BYTES = 16 * 1024 ** 2  # size of one materialized block of windows
+
+
+def ema(series, span):
+    return memoize_primitive('ema', (series,), (span,),
+                             lambda: series.ewm(span=span, adjust=False, min_periods=span).mean())
+
+
+def sma(series, window):
+    return memoize_primitive('sma', (series,), (window,),
+                             lambda: series.rolling(window=window, min_periods=window).mean())
+
+
+def rolling_std(series, window):
+    return memoize_primitive('rolling_std', (series,), (window,),
+                             lambda: series.rolling(window=window, min_periods=window).std())
+
+
+def ema_matrix(series, spans, out=None):
+    """
+    EMAs of one series for several spans as a (bars x spans) float64 array, written column by column into `out`
+    (a preallocated array of that shape) or a new Fortran-ordered one. Each column is the same C ewm pass the ema
+    primitive runs; a per-bar recursion vectorized across spans is several times slower in numpy and not
+    bit-identical.
+    """
+    out = _matrix_out(len(series), len(spans), out)
+    for j, span in enumerate(spans):
+        out[:, j] = series.ewm(span=span, adjust=False, min_periods=span).mean().to_numpy()
+    return out
+
+
+def sma_matrix(series, windows, out=None):
+    """Same as ema_matrix for simple moving averages, one column per window."""
+    out = _matrix_out(len(series), len(windows), out)
+    for j, window in enumerate(windows):
+        out[:, j] = series.rolling(window=window, min_periods=window).mean().to_numpy()
+    return out
+
+
+def emas(series, spans):
+    """{span: ema(series, span)}, with every span not cached yet computed into one shared ema_matrix block."""
+    return _moving_averages('ema', ema_matrix, series, spans)
+
+
+def smas(series, windows):
+    """{window: sma(series, window)}, with every window not cached yet computed into one shared sma_matrix block."""
+    return _moving_averages('sma', sma_matrix, series, windows)
+
+
+def _moving_averages(primitive, matrix, series, params):
+    results = {}
+    for param in params:
+        cached = lookup_primitive(primitive, (series,), (param,))
+        if cached is not None:
+            results[param] = cached
+    missing = [param for param in dict.fromkeys(params) if param not in results]
+    if missing:
+        block = matrix(series, missing)
+        for j, param in enumerate(missing):
+            column = pd.Series(block[:, j], index=series.index, name=series.name, copy=False)
+            results[param] = memoize_primitive(primitive, (series,), (param,), lambda: column)
+    return results
+
+
+def _matrix_out(n_rows, n_cols, out):
+    if out is None:
+        return np.empty((n_rows, n_cols), dtype=np.float64, order='F')
+    if out.shape != (n_rows, n_cols):
+        raise ValueError(f"out has shape {out.shape}, expected {(n_rows, n_cols)}")
+    return out
+
+
+def rolling_sum(series, window):
+    return memoize_primitive('rolling_sum', (series,), (window,),
+                             lambda: series.rolling(window=window, min_periods=window).sum())
+
+
+def rolling_median(series, window):
+    """
+    Batch rolling median. pandas' skiplist runs in C and beats streaming kernels.RollingMedian over a whole series
+    (see scripts/run_rolling_median_benchmark.py), so batch mode stays on pandas; RollingMedian serves live bars.
+    """
+    return memoize_primitive('rolling_median', (series,), (window,),
+                             lambda: series.rolling(window=window, min_periods=window).median())
+
+
+def rolling_max(series, window):
+    return memoize_primitive('rolling_max', (series,), (window,),
+                             lambda: series.rolling(window=window, min_periods=window).max())
+
+
+def rolling_min(series, window):
+    return memoize_primitive('rolling_min', (series,), (window,),
+                             lambda: series.rolling(window=window, min_periods=window).min())
+
+
+def bars_since_max(series, window):
+    """Bars since the highest value of each full `window`-bar window (0 = this bar; ties pick the latest bar)."""
+    return memoize_primitive('bars_since_max', (series,), (window,),
+                             lambda: pd.Series(rolling_arg_extreme(series.tolist(), window, True)[0],
+                                               index=series.index, dtype="float64", name=series.name))
+
+
+def bars_since_min(series, window):
+    """Bars since the lowest value of each full `window`-bar window (0 = this bar; ties pick the latest bar)."""
+    return memoize_primitive('bars_since_min', (series,), (window,),
+                             lambda: pd.Series(rolling_arg_extreme(series.tolist(), window, False)[0],
+                                               index=series.index, dtype="float64", name=series.name))
+
+
+def rolling_mean_abs_deviation(series, window):
+    """
+    Rolling mean absolute deviation around the window mean, equal to
+    rolling(window).apply(lambda x: np.mean(np.abs(x - np.mean(x)))) but vectorized over blocks of windows.
+    """
+    return memoize_primitive('rolling_mad', (series,), (window,),
+                             lambda: rolling_mean_abs_deviations(series, [window])[window])
+
+
+def rolling_mean_abs_deviations(series, windows, block_bytes=MAD_BLOCK_BYTES):
+    """
+    Rolling mean absolute deviation for several windows over one series: {window: Series}. Windows are laid out with
+    sliding_window_view and reduced row by row in blocks of at most block_bytes, so memory stays bounded. Row sums
+    use the same pairwise summation as the per-window np.mean, so results are bit-identical to the apply lambda.
+    Windows with a NaN/inf, or shorter than `window`, are NaN as with rolling().
+    """
+    values = series.to_numpy(dtype=np.float64)
+    n = len(values)
+    finite = np.isfinite(values)
+    missing_before = np.concatenate(([0], np.cumsum(~finite)))
+    results = {}
+    for window in windows:
+        mad = np.full(n, np.nan)
+        if window <= n:
+            windows_view = sliding_window_view(values, window)
+            block_rows = max(1, block_bytes // (8 * window))
+            with np.errstate(invalid='ignore'):  # inf windows are masked to NaN below
+                for start in range(0, len(windows_view), block_rows):
+                    block = np.ascontiguousarray(windows_view[start:start + block_rows])
+                    means = block.sum(axis=1) / window
+                    mad[start + window - 1:start + window - 1 + len(block)] = (
+                            np.abs(block - means[:, None]).sum(axis=1) / window)
+            incomplete = (missing_before[window:] - missing_before[:-window]) > 0
+            mad[window - 1:][incomplete] = np.nan
+        results[window] = pd.Series(mad, index=series.index, name=series.name)
+    return results
+
+
+def up_moves(series):
+    """Bar-to-bar rises of series, 0 on falls (the RSI gains)."""
+    return memoize_primitive('up_moves', (series,), (), lambda: series.diff().clip(lower=0))
+
+
+def down_moves(series):
+    """Bar-to-bar falls of series as negative values, 0 on rises (the RSI losses before negation)."""
+    return memoize_primitive('down_moves', (series,), (), lambda: series.diff().clip(upper=0))
+
+
+def up_flow(series, flow):
+    """flow on bars where series rose from the previous bar, 0 elsewhere (the positive money flow of MFI)."""
+    return memoize_primitive('up_flow', (series, flow), (),
+                             lambda: pd.Series(np.where(series > series.shift(1), flow, 0), index=series.index))
+
+
+def down_flow(series, flow):
+    """flow on bars where series fell from the previous bar, 0 elsewhere (the negative money flow of MFI)."""
+    return memoize_primitive('down_flow', (series, flow), (),
+                             lambda: pd.Series(np.where(series < series.shift(1), flow, 0), index=series.index))
+
+
+def signed_flow(series, flow):
+    """+flow on up bars, -flow on down bars and 0 on unchanged bars (and the first bar)."""
+    return memoize_primitive('signed_flow', (series, flow), (),
+                             lambda: up_flow(series, flow) - down_flow(series, flow))
+
+
+def cumulative_signed_flow(series, flow):
+    """
+    Running total of signed_flow starting at 0, e.g. OBV for (close, volume). Accumulated with np.cumsum, which adds
+    left to right like the bar loop did, so the totals are identical and an integer flow keeps its integer dtype.
+    """
+    return memoize_primitive('cumulative_signed_flow', (series, flow), (),
+                             lambda: pd.Series(np.cumsum(signed_flow(series, flow).to_numpy()), index=series.index))
+
+
+def true_range(high, low, close):
+    def compute():
+        tr1 = high - low
+        tr2 = (high - close.shift()).abs()
+        tr3 = (low - close.shift()).abs()
+        return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+
+    return memoize_primitive('true_range', (high, low, close), (), compute)
+
+
+def price_range(high, low):
+    return memoize_primitive('price_range', (high, low), (), lambda: high - low)
+
+
+def average_true_range(high, low, close, period):
+    """Simple-average ATR, as used by ATR, ADX and SUPER_TREND."""
+    return sma(true_range(high, low, close), period)
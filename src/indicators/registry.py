@@ -1,6 +1,7 @@
 import pandas as pd
 
 from src.commons.constants.constants import IndicatorName
+from src.indicators.feature_store import compute_feature_key, load_signal_columns, store_signal_columns
 from src.indicators.strategy.adx import ADX
 from src.indicators.strategy.aroon import Aroon
 from src.indicators.strategy.atr import ATR
@@ -73,15 +74,27 @@ def get_indicator(strategy_name):
     return strategy_class
 
 
-def add_signals(df, strategy_name, strategy_params, df_col_suffix=None):
+def add_signals(df, strategy_name, strategy_params, df_col_suffix=None, feature_store=None):
+    """
+    The strategy's signal columns for df. With a feature_store (see create_feature_store) they are loaded from it when
+    this (dataset, strategy, params) was computed before, and stored into it otherwise.
+    """
     strategy_enum = IndicatorName(strategy_name) if not isinstance(strategy_name, IndicatorName) else strategy_name
+    if feature_store is not None:
+        feature_key = compute_feature_key(feature_store, strategy_enum.value, strategy_params, df_col_suffix)
+        new_columns = load_signal_columns(feature_store, feature_key, df.index)
+        if new_columns is not None:
+            return new_columns
+
     indicator_strategy_class = get_indicator(strategy_enum.value)
     new_columns = indicator_strategy_class().compute_signals(df, strategy_params, df_col_suffix=df_col_suffix)
+    if feature_store is not None:
+        store_signal_columns(feature_store, feature_key, new_columns)
     return new_columns
 
 
-def enrich_df(df, indicator_name, combo, df_col_suffix):
-    new_columns = add_signals(df, indicator_name, combo, df_col_suffix=df_col_suffix)
+def enrich_df(df, indicator_name, combo, df_col_suffix, feature_store=None):
+    new_columns = add_signals(df, indicator_name, combo, df_col_suffix=df_col_suffix, feature_store=feature_store)
     if new_columns:
         df_new = pd.DataFrame(new_columns, index=df.index)
         df = pd.concat([df, df_new], axis=1)
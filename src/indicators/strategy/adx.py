@@ -1,6 +1,9 @@
 import pandas as pd
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import average_true_range
+from src.indicators.streaming import Lag, RollingMean, RollingSum, SignalLag, TrueRange, divide
 
 
 class ADX(BaseIndicatorStrategy):
@@ -48,6 +51,14 @@ class ADX(BaseIndicatorStrategy):
                and combo['exit_threshold'] >= 0
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.average_true_range(params['period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return 2 * params['period'] + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params or 'threshold' not in params or 'exit_threshold' not in params:
             raise ValueError(
@@ -68,11 +79,7 @@ class ADX(BaseIndicatorStrategy):
         plus_dm[plus_dm < 0] = 0
         minus_dm[minus_dm > 0] = 0
 
-        tr1 = high - low
-        tr2 = (high - close.shift()).abs()
-        tr3 = (low - close.shift()).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(period, min_periods=period).mean()
+        atr = average_true_range(high, low, close, period)
 
         plus_di = 100 * (plus_dm.rolling(period, min_periods=period).sum() / atr)
         minus_di = 100 * (abs(minus_dm.rolling(period, min_periods=period).sum()) / atr)
@@ -91,3 +98,40 @@ class ADX(BaseIndicatorStrategy):
                                                ).shift(1, fill_value=False).astype(int),
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        threshold = params['threshold']
+        exit_threshold = params['exit_threshold']
+        suffix = df_col_suffix or ""
+
+        previous_high, previous_low = Lag(), Lag()
+        true_range = TrueRange()
+        atr_average = RollingMean(period)
+        plus_dm_sum, minus_dm_sum = RollingSum(period), RollingSum(period)
+        adx_average = RollingMean(period)
+        signals = [SignalLag() for _ in range(4)]
+
+        def update(bar):
+            high, low, close = bar['high'], bar['low'], bar['close']
+            plus_dm = high - previous_high.update(high)
+            minus_dm = low - previous_low.update(low)
+            if plus_dm < 0:
+                plus_dm = 0.0
+            if minus_dm > 0:
+                minus_dm = 0.0
+
+            atr = atr_average.update(true_range.update(high, low, close))
+            plus_di = 100 * divide(plus_dm_sum.update(plus_dm), atr)
+            minus_di = 100 * divide(abs(minus_dm_sum.update(minus_dm)), atr)
+            dx = 100 * divide(abs(plus_di - minus_di), plus_di + minus_di)
+            adx = adx_average.update(dx)
+            return {
+                f'ADX{suffix}': adx,
+                f'ADX_LONG_SIGNAL{suffix}': signals[0].update(adx > threshold and plus_di > minus_di),
+                f'ADX_SHORT_SIGNAL{suffix}': signals[1].update(adx > threshold and minus_di > plus_di),
+                f'ADX_LONG_EXIT_SIGNAL{suffix}': signals[2].update(adx < exit_threshold and plus_di > minus_di),
+                f'ADX_SHORT_EXIT_SIGNAL{suffix}': signals[3].update(adx < exit_threshold and minus_di > plus_di),
+            }
+
+        return update
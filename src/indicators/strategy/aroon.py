@@ -1,6 +1,8 @@
-import numpy as np
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import bars_since_max, bars_since_min
+from src.indicators.streaming import RollingMax, RollingMin, SignalLag
 
 
 class Aroon(BaseIndicatorStrategy):
@@ -38,6 +40,15 @@ class Aroon(BaseIndicatorStrategy):
             if combo['period'] > 1
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.bars_since_max(graph.column('high'), params['period'] + 1),
+                graph.bars_since_min(graph.column('low'), params['period'] + 1)]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['period'] + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params:
             raise ValueError(
@@ -48,13 +59,9 @@ class Aroon(BaseIndicatorStrategy):
         suffix = df_col_suffix or ""
 
         # Aroon Up: % of time since highest high in last 'period' bars
-        aroon_up = df['high'].rolling(window=period + 1).apply(
-            lambda x: float(np.argmax(x[::-1])) / period * 100, raw=True
-        )
+        aroon_up = bars_since_max(df['high'], period + 1) / period * 100
         # Aroon Down: % of time since lowest low in last 'period' bars
-        aroon_down = df['low'].rolling(window=period + 1).apply(
-            lambda x: float(np.argmin(x[::-1])) / period * 100, raw=True
-        )
+        aroon_down = bars_since_min(df['low'], period + 1) / period * 100
 
         new_cols = {
             f'AROON_UP{suffix}': aroon_up,
@@ -63,3 +70,24 @@ class Aroon(BaseIndicatorStrategy):
             f'AROON_SHORT_SIGNAL{suffix}': (aroon_down > 70).shift(1, fill_value=False).astype(int),
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        suffix = df_col_suffix or ""
+
+        high_max, low_min = RollingMax(period + 1), RollingMin(period + 1)
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            high_max.update(bar['high'])
+            low_min.update(bar['low'])
+            aroon_up = high_max.bars_since() / period * 100
+            aroon_down = low_min.bars_since() / period * 100
+            return {
+                f'AROON_UP{suffix}': aroon_up,
+                f'AROON_DOWN{suffix}': aroon_down,
+                f'AROON_LONG_SIGNAL{suffix}': long_signal.update(aroon_up > 70),
+                f'AROON_SHORT_SIGNAL{suffix}': short_signal.update(aroon_down > 70),
+            }
+
+        return update
@@ -1,6 +1,10 @@
 import pandas as pd
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.kernels import RollingMedian
+from src.indicators.primitives import average_true_range, rolling_median
+from src.indicators.streaming import RollingMean, SignalLag, TrueRange
 
 
 class ATR(BaseIndicatorStrategy):
@@ -41,6 +45,14 @@ class ATR(BaseIndicatorStrategy):
             if combo['period'] > 1 and combo['spike_mult'] > 1.0
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.rolling_median(graph.average_true_range(params['period']), params['period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return 2 * params['period'] + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params or 'spike_mult' not in params:
             raise ValueError(
@@ -51,15 +63,10 @@ class ATR(BaseIndicatorStrategy):
         spike_mult = params['spike_mult']
         suffix = df_col_suffix or ""
 
-        tr1 = df['high'] - df['low']
-        tr2 = (df['high'] - df['close'].shift()).abs()
-        tr3 = (df['low'] - df['close'].shift()).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-        atr = tr.rolling(window=period, min_periods=period).mean()
+        atr = average_true_range(df['high'], df['low'], df['close'], period)
 
         # Optional: Volatility spike signal
-        median_atr = atr.rolling(window=period, min_periods=period).median()
+        median_atr = rolling_median(atr, period)
         spike = atr > (median_atr * spike_mult)
 
         new_cols = {
@@ -67,3 +74,24 @@ class ATR(BaseIndicatorStrategy):
             f'ATR_SPIKE_SIGNAL{suffix}': spike.shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        spike_mult = params['spike_mult']
+        suffix = df_col_suffix or ""
+
+        true_range = TrueRange()
+        atr_average = RollingMean(period)
+        atr_median = RollingMedian(period)
+        spike_signal = SignalLag()
+
+        def update(bar):
+            atr = atr_average.update(true_range.update(bar['high'], bar['low'], bar['close']))
+            median_atr = atr_median.update(atr)
+            spike = atr > (median_atr * spike_mult)
+            return {
+                f'ATR{suffix}': atr,
+                f'ATR_SPIKE_SIGNAL{suffix}': spike_signal.update(spike)
+            }
+
+        return update
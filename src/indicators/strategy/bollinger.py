@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import sma, rolling_std
+from src.indicators.streaming import Crossover, RollingMean, RollingStd, SignalLag
 
 
 class Bollinger(BaseIndicatorStrategy):
@@ -41,6 +44,15 @@ class Bollinger(BaseIndicatorStrategy):
             if combo['period'] > 1 and combo['stddev'] > 0
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.sma(graph.column('close'), params['period']),
+                graph.rolling_std(graph.column('close'), params['period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['period'] + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params or 'stddev' not in params:
             raise ValueError(
@@ -51,8 +63,8 @@ class Bollinger(BaseIndicatorStrategy):
         stddev = params['stddev']
         suffix = df_col_suffix or ""
 
-        ma = df['close'].rolling(window=period, min_periods=period).mean()
-        std = df['close'].rolling(window=period, min_periods=period).std()
+        ma = sma(df['close'], period)
+        std = rolling_std(df['close'], period)
 
         upper = ma + (stddev * std)
         lower = ma - (stddev * std)
@@ -67,3 +79,30 @@ class Bollinger(BaseIndicatorStrategy):
             f'BOLLINGER_SHORT_SIGNAL{suffix}': cross_down.shift(1, fill_value=False).astype(int),
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        stddev = params['stddev']
+        suffix = df_col_suffix or ""
+
+        ma_average = RollingMean(period)
+        std_window = RollingStd(period)
+        upper_crossover, lower_crossover = Crossover(), Crossover()
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            close = bar['close']
+            ma = ma_average.update(close)
+            std = std_window.update(close)
+            upper = ma + (stddev * std)
+            lower = ma - (stddev * std)
+            cross_up = upper_crossover.update(close, upper)[0]
+            cross_down = lower_crossover.update(close, lower)[1]
+            return {
+                f'BOLLINGER_UPPER{suffix}': upper,
+                f'BOLLINGER_LOWER{suffix}': lower,
+                f'BOLLINGER_LONG_SIGNAL{suffix}': long_signal.update(cross_up),
+                f'BOLLINGER_SHORT_SIGNAL{suffix}': short_signal.update(cross_down),
+            }
+
+        return update
@@ -1,6 +1,7 @@
-import numpy as np
 from src.commons.constants.constants import IndicatorName
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import rolling_mean_abs_deviation
+from src.indicators.streaming import RollingMean, RollingMeanAbsDeviation, SignalLag, divide
 
 
 class CCI(BaseIndicatorStrategy):
@@ -46,6 +47,10 @@ class CCI(BaseIndicatorStrategy):
             if combo['period'] > 1 and combo['entry'] < combo['exit']
         ]
 
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['period'] + 1
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params or 'entry' not in params or 'exit' not in params:
             raise ValueError(
@@ -59,7 +64,7 @@ class CCI(BaseIndicatorStrategy):
 
         tp = (df['high'] + df['low'] + df['close']) / 3
         ma = tp.rolling(period, min_periods=period).mean()
-        md = tp.rolling(period, min_periods=period).apply(lambda x: np.mean(np.abs(x - np.mean(x))))
+        md = rolling_mean_abs_deviation(tp, period)
         cci = (tp - ma) / (0.015 * md)
 
         new_cols = {
@@ -68,3 +73,26 @@ class CCI(BaseIndicatorStrategy):
             f'CCI_SHORT_SIGNAL{suffix}': (cci > exit_val).shift(1, fill_value=False).astype(int),
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        entry_val = params['entry']
+        exit_val = params['exit']
+        suffix = df_col_suffix or ""
+
+        tp_average = RollingMean(period)
+        tp_deviation = RollingMeanAbsDeviation(period)
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            tp = (bar['high'] + bar['low'] + bar['close']) / 3
+            ma = tp_average.update(tp)
+            md = tp_deviation.update(tp)
+            cci = divide(tp - ma, 0.015 * md)
+            return {
+                f'CCI{suffix}': cci,
+                f'CCI_LONG_SIGNAL{suffix}': long_signal.update(cci < entry_val),
+                f'CCI_SHORT_SIGNAL{suffix}': short_signal.update(cci > exit_val),
+            }
+
+        return update
@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import rolling_sum
+from src.indicators.streaming import RollingSum, SignalLag, divide, replace_zero
 
 
 class ChaikinMF(BaseIndicatorStrategy):
@@ -35,6 +38,14 @@ class ChaikinMF(BaseIndicatorStrategy):
             if combo['period'] > 1
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.rolling_sum(graph.column('volume'), params['period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['period'] + 1
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params:
             raise ValueError(
@@ -52,7 +63,7 @@ class ChaikinMF(BaseIndicatorStrategy):
         # Avoid division by zero
         denominator = (high - low).replace(0, 1e-9)
         mfv = ((2 * close - low - high) / denominator * volume).fillna(0)
-        cmf = mfv.rolling(period, min_periods=period).sum() / volume.rolling(period, min_periods=period).sum()
+        cmf = rolling_sum(mfv, period) / rolling_sum(volume, period)
 
         new_cols = {
             f'CMF{suffix}': cmf,
@@ -60,3 +71,27 @@ class ChaikinMF(BaseIndicatorStrategy):
             f'CHAIKIN_MF_SHORT_SIGNAL{suffix}': (cmf < 0).shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        suffix = df_col_suffix or ""
+
+        mfv_sum, volume_sum = RollingSum(period), RollingSum(period)
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            high, low, close, volume = bar['high'], bar['low'], bar['close'], bar['volume']
+
+            # Avoid division by zero
+            denominator = replace_zero(high - low, 1e-9)
+            mfv = divide(2 * close - low - high, denominator) * volume
+            if mfv != mfv:
+                mfv = 0.0
+            cmf = divide(mfv_sum.update(mfv), volume_sum.update(volume))
+            return {
+                f'CMF{suffix}': cmf,
+                f'CHAIKIN_MF_LONG_SIGNAL{suffix}': long_signal.update(cmf > 0),
+                f'CHAIKIN_MF_SHORT_SIGNAL{suffix}': short_signal.update(cmf < 0)
+            }
+
+        return update
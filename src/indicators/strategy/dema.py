@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
-from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators import primitive_graph as graph
+from src.indicators.base_indicator_strategy import BaseIndicatorStrategy, ema_warmup_bars
+from src.indicators.primitives import ema
+from src.indicators.streaming import Crossover, ExponentialMean, SignalLag
 
 
 class DEMA(BaseIndicatorStrategy):
@@ -35,6 +38,14 @@ class DEMA(BaseIndicatorStrategy):
             if combo['period'] > 1
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.ema(graph.ema(graph.column('close'), params['period']), params['period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return 2 * ema_warmup_bars(params['period']) + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params:
             raise ValueError(
@@ -44,8 +55,8 @@ class DEMA(BaseIndicatorStrategy):
         period = params['period']
         suffix = df_col_suffix or ""
 
-        ema1 = df['close'].ewm(span=period, adjust=False, min_periods=period).mean()
-        ema2 = ema1.ewm(span=period, adjust=False, min_periods=period).mean()
+        ema1 = ema(df['close'], period)
+        ema2 = ema(ema1, period)
         dema = 2 * ema1 - ema2
 
         cross_up = (df['close'] > dema) & (df['close'].shift(1) <= dema.shift(1))
@@ -57,3 +68,24 @@ class DEMA(BaseIndicatorStrategy):
             f'DEMA_SHORT_SIGNAL{suffix}': cross_down.shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        suffix = df_col_suffix or ""
+
+        ema1_stream, ema2_stream = ExponentialMean(period), ExponentialMean(period)
+        crossover = Crossover()
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            ema1 = ema1_stream.update(bar['close'])
+            ema2 = ema2_stream.update(ema1)
+            dema = 2 * ema1 - ema2
+            cross_up, cross_down = crossover.update(bar['close'], dema)
+            return {
+                f'DEMA{suffix}': dema,
+                f'DEMA_LONG_SIGNAL{suffix}': long_signal.update(cross_up),
+                f'DEMA_SHORT_SIGNAL{suffix}': short_signal.update(cross_down)
+            }
+
+        return update
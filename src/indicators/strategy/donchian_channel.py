@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import rolling_max, rolling_min
+from src.indicators.streaming import Lag, RollingMax, RollingMin, SignalLag
 
 
 class Donchian(BaseIndicatorStrategy):
@@ -35,6 +38,15 @@ class Donchian(BaseIndicatorStrategy):
             if combo['period'] > 1
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.rolling_max(graph.column('high'), params['period']),
+                graph.rolling_min(graph.column('low'), params['period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['period'] + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params:
             raise ValueError(f"{self.name} param 'period' is required in backtest-config.yaml/indicator-config.yaml")
@@ -42,8 +54,8 @@ class Donchian(BaseIndicatorStrategy):
         period = params['period']
         suffix = df_col_suffix or ""
 
-        dc_high = df['high'].rolling(window=period, min_periods=period).max()
-        dc_low = df['low'].rolling(window=period, min_periods=period).min()
+        dc_high = rolling_max(df['high'], period)
+        dc_low = rolling_min(df['low'], period)
 
         cross_up = (df['close'] > dc_high.shift(1))
         cross_down = (df['close'] < dc_low.shift(1))
@@ -55,3 +67,25 @@ class Donchian(BaseIndicatorStrategy):
             f'DONCHIAN_SHORT_SIGNAL{suffix}': cross_down.shift(1, fill_value=False).astype(int),
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        suffix = df_col_suffix or ""
+
+        high_max, low_min = RollingMax(period), RollingMin(period)
+        previous_high, previous_low = Lag(), Lag()
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            dc_high = high_max.update(bar['high'])
+            dc_low = low_min.update(bar['low'])
+            cross_up = bar['close'] > previous_high.update(dc_high)
+            cross_down = bar['close'] < previous_low.update(dc_low)
+            return {
+                f'DONCHIAN_HIGH{suffix}': dc_high,
+                f'DONCHIAN_LOW{suffix}': dc_low,
+                f'DONCHIAN_LONG_SIGNAL{suffix}': long_signal.update(cross_up),
+                f'DONCHIAN_SHORT_SIGNAL{suffix}': short_signal.update(cross_down),
+            }
+
+        return update
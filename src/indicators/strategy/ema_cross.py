@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
-from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators import primitive_graph as graph
+from src.indicators.base_indicator_strategy import BaseIndicatorStrategy, ema_warmup_bars
+from src.indicators.primitives import ema
+from src.indicators.streaming import Crossover, ExponentialMean, SignalLag
 
 
 class EMACross(BaseIndicatorStrategy):
@@ -41,6 +44,14 @@ class EMACross(BaseIndicatorStrategy):
             0 < combo['fast'] < combo['slow'] != combo['fast'] and combo['slow'] > 0
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.ema(graph.column('close'), params['fast']), graph.ema(graph.column('close'), params['slow'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return ema_warmup_bars(max(params['fast'], params['slow'])) + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         """
         Adds lookahead-safe EMA cross signals to df:
@@ -58,8 +69,8 @@ class EMACross(BaseIndicatorStrategy):
         slow = params['slow']
         suffix = df_col_suffix or ""
 
-        ema_fast = df['close'].ewm(span=fast, adjust=False, min_periods=fast).mean()
-        ema_slow = df['close'].ewm(span=slow, adjust=False, min_periods=slow).mean()
+        ema_fast = ema(df['close'], fast)
+        ema_slow = ema(df['close'], slow)
 
         # Detect crossovers only, not just above/below
         cross_up = (ema_fast > ema_slow) & (ema_fast.shift(1) <= ema_slow.shift(1))
@@ -73,3 +84,26 @@ class EMACross(BaseIndicatorStrategy):
             f'EMA_CROSS_SHORT_SIGNAL{suffix}': cross_down.shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        fast = params['fast']
+        slow = params['slow']
+        suffix = df_col_suffix or ""
+
+        ema_fast = ExponentialMean(fast)
+        ema_slow = ExponentialMean(slow)
+        crossover = Crossover()
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            fast_value = ema_fast.update(bar['close'])
+            slow_value = ema_slow.update(bar['close'])
+            cross_up, cross_down = crossover.update(fast_value, slow_value)
+            return {
+                f'EMA_FAST{suffix}': fast_value,
+                f'EMA_SLOW{suffix}': slow_value,
+                f'EMA_CROSS_LONG_SIGNAL{suffix}': long_signal.update(cross_up),
+                f'EMA_CROSS_SHORT_SIGNAL{suffix}': short_signal.update(cross_down)
+            }
+
+        return update
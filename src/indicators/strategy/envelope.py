@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import sma
+from src.indicators.streaming import RollingMean, SignalLag
 
 
 class Envelope(BaseIndicatorStrategy):
@@ -39,6 +42,14 @@ class Envelope(BaseIndicatorStrategy):
             if combo['period'] > 1 and combo['percent'] > 0
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.sma(graph.column('close'), params['period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['period'] + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params or 'percent' not in params:
             raise ValueError(
@@ -49,7 +60,7 @@ class Envelope(BaseIndicatorStrategy):
         percent = params['percent']
         suffix = df_col_suffix or ""
 
-        ma = df['close'].rolling(window=period, min_periods=period).mean()
+        ma = sma(df['close'], period)
         upper = ma * (1 + percent)
         lower = ma * (1 - percent)
         cross_up = (df['close'] > upper)
@@ -62,3 +73,24 @@ class Envelope(BaseIndicatorStrategy):
             f'ENVELOPE_SHORT_SIGNAL{suffix}': cross_down.shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        percent = params['percent']
+        suffix = df_col_suffix or ""
+
+        close_average = RollingMean(period)
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            ma = close_average.update(bar['close'])
+            upper = ma * (1 + percent)
+            lower = ma * (1 - percent)
+            return {
+                f'ENVELOPE_UPPER{suffix}': upper,
+                f'ENVELOPE_LOWER{suffix}': lower,
+                f'ENVELOPE_LONG_SIGNAL{suffix}': long_signal.update(bar['close'] > upper),
+                f'ENVELOPE_SHORT_SIGNAL{suffix}': short_signal.update(bar['close'] < lower)
+            }
+
+        return update
@@ -1,6 +1,9 @@
 import numpy as np
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import sma
+from src.indicators.streaming import Crossover, RollingMean, SignalLag
 
 
 class HullMA(BaseIndicatorStrategy):
@@ -36,6 +39,15 @@ class HullMA(BaseIndicatorStrategy):
             if combo['period'] > 1
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        period = params['period']
+        return [graph.sma(graph.column('close'), max(1, period // 2)), graph.sma(graph.column('close'), period)]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['period'] + max(1, int(np.sqrt(params['period']))) + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params:
             raise ValueError(
@@ -49,8 +61,8 @@ class HullMA(BaseIndicatorStrategy):
         half_period = max(1, period // 2)
         sqrt_period = max(1, int(np.sqrt(period)))
 
-        wma_half = df['close'].rolling(window=half_period, min_periods=half_period).mean()
-        wma_full = df['close'].rolling(window=period, min_periods=period).mean()
+        wma_half = sma(df['close'], half_period)
+        wma_full = sma(df['close'], period)
 
         hull = 2 * wma_half - wma_full
         hull_ma = hull.rolling(window=sqrt_period, min_periods=sqrt_period).mean()
@@ -64,3 +76,26 @@ class HullMA(BaseIndicatorStrategy):
             f'HULL_MA_SHORT_SIGNAL{suffix}': cross_down.shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        suffix = df_col_suffix or ""
+
+        half_period = max(1, period // 2)
+        sqrt_period = max(1, int(np.sqrt(period)))
+        half_average, full_average = RollingMean(half_period), RollingMean(period)
+        hull_average = RollingMean(sqrt_period)
+        crossover = Crossover()
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            hull = 2 * half_average.update(bar['close']) - full_average.update(bar['close'])
+            hull_ma = hull_average.update(hull)
+            cross_up, cross_down = crossover.update(bar['close'], hull_ma)
+            return {
+                f'HULL_MA{suffix}': hull_ma,
+                f'HULL_MA_LONG_SIGNAL{suffix}': long_signal.update(cross_up),
+                f'HULL_MA_SHORT_SIGNAL{suffix}': short_signal.update(cross_down)
+            }
+
+        return update
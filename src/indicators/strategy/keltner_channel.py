@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
-from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators import primitive_graph as graph
+from src.indicators.base_indicator_strategy import BaseIndicatorStrategy, ema_warmup_bars
+from src.indicators.primitives import ema, sma, price_range
+from src.indicators.streaming import ExponentialMean, RollingMean, SignalLag
 
 
 class Keltner(BaseIndicatorStrategy):
@@ -39,6 +42,14 @@ class Keltner(BaseIndicatorStrategy):
             if combo['period'] > 1 and combo['multiplier'] > 0
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.ema(graph.column('close'), params['period']), graph.sma(graph.price_range(), params['period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return ema_warmup_bars(params['period']) + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params or 'multiplier' not in params:
             raise ValueError(
@@ -49,10 +60,10 @@ class Keltner(BaseIndicatorStrategy):
         atr_mult = params['multiplier']
         suffix = df_col_suffix or ""
 
-        ema = df['close'].ewm(span=period, adjust=False, min_periods=period).mean()
-        atr = (df['high'] - df['low']).rolling(window=period, min_periods=period).mean()
-        upper = ema + atr_mult * atr
-        lower = ema - atr_mult * atr
+        ema_mid = ema(df['close'], period)
+        atr = sma(price_range(df['high'], df['low']), period)
+        upper = ema_mid + atr_mult * atr
+        lower = ema_mid - atr_mult * atr
 
         cross_up = (df['close'] > upper)
         cross_down = (df['close'] < lower)
@@ -64,3 +75,26 @@ class Keltner(BaseIndicatorStrategy):
             f'KELTNER_SHORT_SIGNAL{suffix}': cross_down.shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        atr_mult = params['multiplier']
+        suffix = df_col_suffix or ""
+
+        close_ema = ExponentialMean(period)
+        range_average = RollingMean(period)
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            ema_mid = close_ema.update(bar['close'])
+            atr = range_average.update(bar['high'] - bar['low'])
+            upper = ema_mid + atr_mult * atr
+            lower = ema_mid - atr_mult * atr
+            return {
+                f'KELTNER_UPPER{suffix}': upper,
+                f'KELTNER_LOWER{suffix}': lower,
+                f'KELTNER_LONG_SIGNAL{suffix}': long_signal.update(bar['close'] > upper),
+                f'KELTNER_SHORT_SIGNAL{suffix}': short_signal.update(bar['close'] < lower)
+            }
+
+        return update
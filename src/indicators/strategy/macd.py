@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
-from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators import primitive_graph as graph
+from src.indicators.base_indicator_strategy import BaseIndicatorStrategy, ema_warmup_bars
+from src.indicators.primitives import ema
+from src.indicators.streaming import Crossover, ExponentialMean, SignalLag
 
 
 class MACD(BaseIndicatorStrategy):
@@ -46,6 +49,14 @@ class MACD(BaseIndicatorStrategy):
                and combo['signal'] > 0
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.ema(graph.column('close'), params['fast']), graph.ema(graph.column('close'), params['slow'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return ema_warmup_bars(max(params['fast'], params['slow'])) + ema_warmup_bars(params['signal']) + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'fast' not in params or 'slow' not in params or 'signal' not in params:
             raise ValueError(
@@ -57,8 +68,8 @@ class MACD(BaseIndicatorStrategy):
         signal = params['signal']
         suffix = df_col_suffix or ""
 
-        ema_fast = df['close'].ewm(span=fast, adjust=False, min_periods=fast).mean()
-        ema_slow = df['close'].ewm(span=slow, adjust=False, min_periods=slow).mean()
+        ema_fast = ema(df['close'], fast)
+        ema_slow = ema(df['close'], slow)
         macd = ema_fast - ema_slow
         macd_signal = macd.ewm(span=signal, adjust=False, min_periods=signal).mean()
 
@@ -74,3 +85,32 @@ class MACD(BaseIndicatorStrategy):
             f'MACD_SHORT_SIGNAL{suffix}': cross_down.shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        fast = params['fast']
+        slow = params['slow']
+        signal = params['signal']
+        suffix = df_col_suffix or ""
+
+        ema_fast = ExponentialMean(fast)
+        ema_slow = ExponentialMean(slow)
+        ema_signal = ExponentialMean(signal)
+        crossover = Crossover()
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            fast_value = ema_fast.update(bar['close'])
+            slow_value = ema_slow.update(bar['close'])
+            macd = fast_value - slow_value
+            macd_signal = ema_signal.update(macd)
+            cross_up, cross_down = crossover.update(macd, macd_signal)
+            return {
+                f'EMA_FAST{suffix}': fast_value,
+                f'EMA_SLOW{suffix}': slow_value,
+                f'MACD{suffix}': macd,
+                f'MACD_SIGNAL{suffix}': macd_signal,
+                f'MACD_LONG_SIGNAL{suffix}': long_signal.update(cross_up),
+                f'MACD_SHORT_SIGNAL{suffix}': short_signal.update(cross_down)
+            }
+
+        return update
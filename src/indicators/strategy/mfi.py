@@ -1,7 +1,9 @@
+import math
 import numpy as np
-import pandas as pd
 from src.commons.constants.constants import IndicatorName
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import down_flow, rolling_sum, up_flow
+from src.indicators.streaming import Lag, RollingSum, SignalLag, divide, replace_zero
 
 
 class MFI(BaseIndicatorStrategy):
@@ -37,6 +39,10 @@ class MFI(BaseIndicatorStrategy):
             if combo['period'] > 1
         ]
 
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['period'] + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params:
             raise ValueError(
@@ -48,14 +54,12 @@ class MFI(BaseIndicatorStrategy):
 
         tp = (df['high'] + df['low'] + df['close']) / 3
         mf = tp * df['volume']
-        pos_mf = np.where(tp > tp.shift(1), mf, 0)
-        neg_mf = np.where(tp < tp.shift(1), mf, 0)
-        pos_mf = pd.Series(pos_mf, index=df.index)
-        neg_mf = pd.Series(neg_mf, index=df.index)
+        pos_mf = up_flow(tp, mf)
+        neg_mf = down_flow(tp, mf)
 
         # Avoid division by zero in Money Flow Ratio
-        mfr_denominator = neg_mf.rolling(period, min_periods=period).sum().replace(0, np.nan)
-        mfr = pos_mf.rolling(period, min_periods=period).sum() / mfr_denominator
+        mfr_denominator = rolling_sum(neg_mf, period).replace(0, np.nan)
+        mfr = rolling_sum(pos_mf, period) / mfr_denominator
         mfi = 100 - 100 / (1 + mfr)
 
         new_cols = {
@@ -64,3 +68,29 @@ class MFI(BaseIndicatorStrategy):
             f'MFI_SHORT_SIGNAL{suffix}': (mfi > 80).shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        suffix = df_col_suffix or ""
+
+        previous_tp = Lag()
+        pos_mf_sum, neg_mf_sum = RollingSum(period), RollingSum(period)
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            tp = (bar['high'] + bar['low'] + bar['close']) / 3
+            mf = tp * bar['volume']
+            last_tp = previous_tp.update(tp)
+            pos_mf = pos_mf_sum.update(mf if tp > last_tp else 0)
+            neg_mf = neg_mf_sum.update(mf if tp < last_tp else 0)
+
+            # Avoid division by zero in Money Flow Ratio
+            mfr = divide(pos_mf, replace_zero(neg_mf, math.nan))
+            mfi = 100 - divide(100, 1 + mfr)
+            return {
+                f'MFI{suffix}': mfi,
+                f'MFI_LONG_SIGNAL{suffix}': long_signal.update(mfi < 20),
+                f'MFI_SHORT_SIGNAL{suffix}': short_signal.update(mfi > 80)
+            }
+
+        return update
@@ -1,5 +1,6 @@
 from src.commons.constants.constants import IndicatorName
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.streaming import Lag, SignalLag
 
 
 class Momentum(BaseIndicatorStrategy):
@@ -35,6 +36,10 @@ class Momentum(BaseIndicatorStrategy):
             if combo['period'] > 0
         ]
 
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['period'] + 1
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params:
             raise ValueError(
@@ -52,3 +57,20 @@ class Momentum(BaseIndicatorStrategy):
             f'MOMENTUM_SHORT_SIGNAL{suffix}': (momentum < 0).shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        suffix = df_col_suffix or ""
+
+        previous_close = Lag(period)
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            momentum = bar['close'] - previous_close.update(bar['close'])
+            return {
+                f'MOMENTUM{suffix}': momentum,
+                f'MOMENTUM_LONG_SIGNAL{suffix}': long_signal.update(momentum > 0),
+                f'MOMENTUM_SHORT_SIGNAL{suffix}': short_signal.update(momentum < 0)
+            }
+
+        return update
@@ -1,6 +1,8 @@
-import pandas as pd
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import cumulative_signed_flow, sma
+from src.indicators.streaming import Lag, RollingMean, SignalLag
 
 
 class OBV(BaseIndicatorStrategy):
@@ -37,6 +39,15 @@ class OBV(BaseIndicatorStrategy):
             if combo['ma_period'] > 1
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        obv = graph.cumulative_signed_flow(graph.column('close'), graph.column('volume'))
+        return [graph.sma(obv, params['ma_period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return None  # OBV is a running total from the first bar
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'ma_period' not in params:
             raise ValueError(
@@ -46,17 +57,8 @@ class OBV(BaseIndicatorStrategy):
         ma_period = params['ma_period']
         suffix = df_col_suffix or ""
 
-        obv = [0]
-        for i in range(1, len(df)):
-            if df['close'].iloc[i] > df['close'].iloc[i - 1]:
-                obv.append(obv[-1] + df['volume'].iloc[i])
-            elif df['close'].iloc[i] < df['close'].iloc[i - 1]:
-                obv.append(obv[-1] - df['volume'].iloc[i])
-            else:
-                obv.append(obv[-1])
-
-        obv_series = pd.Series(obv, index=df.index)
-        obv_ma = obv_series.rolling(window=ma_period, min_periods=ma_period).mean()
+        obv_series = cumulative_signed_flow(df['close'], df['volume'])
+        obv_ma = sma(obv_series, ma_period)
 
         new_cols = {
             f'OBV{suffix}': obv_series,
@@ -65,3 +67,28 @@ class OBV(BaseIndicatorStrategy):
             f'OBV_SHORT_SIGNAL{suffix}': (obv_series < obv_ma).shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        ma_period = params['ma_period']
+        suffix = df_col_suffix or ""
+
+        previous_close = Lag()
+        obv_average = RollingMean(ma_period)
+        long_signal, short_signal = SignalLag(), SignalLag()
+        state = dict(obv=0)
+
+        def update(bar):
+            close, volume = bar['close'], bar['volume']
+            last_close = previous_close.update(close)
+            # signed_flow: up_flow - down_flow
+            state['obv'] += (volume if close > last_close else 0) - (volume if close < last_close else 0)
+            obv = state['obv']
+            obv_ma = obv_average.update(obv)
+            return {
+                f'OBV{suffix}': obv,
+                f'OBV_SIGNAL_MA{suffix}': obv_ma,
+                f'OBV_LONG_SIGNAL{suffix}': long_signal.update(obv > obv_ma),
+                f'OBV_SHORT_SIGNAL{suffix}': short_signal.update(obv < obv_ma)
+            }
+
+        return update
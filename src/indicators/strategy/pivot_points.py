@@ -1,5 +1,6 @@
 from src.commons.constants.constants import IndicatorName
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.streaming import Lag, RollingMean, SignalLag
 
 
 class Pivot(BaseIndicatorStrategy):
@@ -35,6 +36,10 @@ class Pivot(BaseIndicatorStrategy):
             if combo['ma_period'] >= 1
         ]
 
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['ma_period'] + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'ma_period' not in params:
             raise ValueError(
@@ -58,3 +63,23 @@ class Pivot(BaseIndicatorStrategy):
             f'PIVOT_SHORT_SIGNAL{suffix}': (df['close'] < signal_series).shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        ma_period = params['ma_period']
+        suffix = df_col_suffix or ""
+
+        previous_high, previous_low, previous_close = Lag(), Lag(), Lag()
+        pivot_average = RollingMean(ma_period) if ma_period > 1 else None
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            pivot = (previous_high.update(bar['high']) + previous_low.update(bar['low']) +
+                     previous_close.update(bar['close'])) / 3
+            signal_value = pivot_average.update(pivot) if pivot_average else pivot
+            return {
+                f'PIVOT{suffix}': signal_value,
+                f'PIVOT_LONG_SIGNAL{suffix}': long_signal.update(bar['close'] > signal_value),
+                f'PIVOT_SHORT_SIGNAL{suffix}': short_signal.update(bar['close'] < signal_value)
+            }
+
+        return update
@@ -1,6 +1,8 @@
 import pandas as pd
 from src.commons.constants.constants import IndicatorName
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.kernels import psar_kernel
+from src.indicators.streaming import Crossover, SignalLag
 
 
 class PSAR(BaseIndicatorStrategy):
@@ -40,6 +42,10 @@ class PSAR(BaseIndicatorStrategy):
             if 0 < combo['af'] <= combo['max_af']
         ]
 
+    @classmethod
+    def warmup_bars(cls, params):
+        return None  # the SAR recursion carries its trend state from the first bar
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'af' not in params or 'max_af' not in params:
             raise ValueError(
@@ -50,44 +56,7 @@ class PSAR(BaseIndicatorStrategy):
         max_af = params['max_af']
         suffix = df_col_suffix or ""
 
-        high = df['high'].values
-        low = df['low'].values
-        close = df['close'].values
-
-        psar = [low[0]]
-        uptrend = True
-        ep = high[0]
-        curr_af = af
-
-        for i in range(1, len(df)):
-            prev_psar = psar[-1]
-
-            if uptrend:
-                psar_i = prev_psar + curr_af * (ep - prev_psar)
-                # Check for reversal
-                if low[i] < psar_i:
-                    uptrend = False
-                    psar_i = ep
-                    ep = low[i]
-                    curr_af = af
-                else:
-                    if high[i] > ep:
-                        ep = high[i]
-                        curr_af = min(curr_af + af, max_af)
-            else:
-                psar_i = prev_psar + curr_af * (ep - prev_psar)
-                if high[i] > psar_i:
-                    uptrend = True
-                    psar_i = ep
-                    ep = high[i]
-                    curr_af = af
-                else:
-                    if low[i] < ep:
-                        ep = low[i]
-                        curr_af = min(curr_af + af, max_af)
-            psar.append(psar_i)
-
-        psar_series = pd.Series(psar, index=df.index)
+        psar_series = pd.Series(psar_kernel(df['high'].tolist(), df['low'].tolist(), af, max_af), index=df.index)
         cross_up = (df['close'] > psar_series) & (df['close'].shift(1) <= psar_series.shift(1))
         cross_down = (df['close'] < psar_series) & (df['close'].shift(1) >= psar_series.shift(1))
 
@@ -97,3 +66,45 @@ class PSAR(BaseIndicatorStrategy):
             f'PSAR_SHORT_SIGNAL{suffix}': cross_down.shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        af = params['af']
+        max_af = params['max_af']
+        suffix = df_col_suffix or ""
+
+        crossover = Crossover()
+        long_signal, short_signal = SignalLag(), SignalLag()
+        # psar_kernel state, one bar at a time
+        state = dict(psar=None, uptrend=True, ep=None, af=af)
+
+        def update(bar):
+            high, low = bar['high'], bar['low']
+            if state['psar'] is None:
+                state.update(psar=low, ep=high)
+            else:
+                prev_psar, ep = state['psar'], state['ep']
+                psar_i = prev_psar + state['af'] * (ep - prev_psar)
+                if state['uptrend']:
+                    # Check for reversal
+                    if low < psar_i:
+                        state.update(uptrend=False, ep=low, af=af)
+                        psar_i = ep
+                    elif high > ep:
+                        state.update(ep=high, af=min(state['af'] + af, max_af))
+                else:
+                    if high > psar_i:
+                        state.update(uptrend=True, ep=high, af=af)
+                        psar_i = ep
+                    elif low < ep:
+                        state.update(ep=low, af=min(state['af'] + af, max_af))
+                state['psar'] = psar_i
+
+            psar = state['psar']
+            cross_up, cross_down = crossover.update(bar['close'], psar)
+            return {
+                f'PSAR{suffix}': psar,
+                f'PSAR_LONG_SIGNAL{suffix}': long_signal.update(cross_up),
+                f'PSAR_SHORT_SIGNAL{suffix}': short_signal.update(cross_down)
+            }
+
+        return update
@@ -1,5 +1,6 @@
 from src.commons.constants.constants import IndicatorName
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.streaming import Lag, SignalLag, divide
 
 
 class ROC(BaseIndicatorStrategy):
@@ -39,6 +40,10 @@ class ROC(BaseIndicatorStrategy):
             if combo['period'] > 0 and combo['threshold'] >= 0
         ]
 
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['period'] + 1
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params or 'threshold' not in params:
             raise ValueError(
@@ -57,3 +62,21 @@ class ROC(BaseIndicatorStrategy):
             f'ROC_SHORT_SIGNAL{suffix}': (roc < -threshold).shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        threshold = params['threshold']
+        suffix = df_col_suffix or ""
+
+        previous_close = Lag(period)
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            roc = (divide(bar['close'], previous_close.update(bar['close'])) - 1) * 100
+            return {
+                f'ROC{suffix}': roc,
+                f'ROC_LONG_SIGNAL{suffix}': long_signal.update(roc > threshold),
+                f'ROC_SHORT_SIGNAL{suffix}': short_signal.update(roc < -threshold)
+            }
+
+        return update
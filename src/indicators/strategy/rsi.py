@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
-from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators import primitive_graph as graph
+from src.indicators.base_indicator_strategy import BaseIndicatorStrategy, ema_warmup_bars
+from src.indicators.primitives import down_moves, ema, sma, up_moves
+from src.indicators.streaming import ExponentialMean, Lag, RollingMean, SignalLag, clip_lower, clip_upper, divide
 
 
 class RSI(BaseIndicatorStrategy):
@@ -52,6 +55,18 @@ class RSI(BaseIndicatorStrategy):
                and combo['mode'] in ['simple', 'exponential']
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        average = graph.ema if params.get('mode', 'simple') == 'exponential' else graph.sma
+        return [average(graph.up_moves(graph.column('close')), params['period']),
+                average(graph.down_moves(graph.column('close')), params['period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        if params.get('mode', 'simple') == 'exponential':
+            return ema_warmup_bars(params['period']) + 2
+        return params['period'] + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params or 'overbought' not in params or 'oversold' not in params:
             raise ValueError(
@@ -64,13 +79,12 @@ class RSI(BaseIndicatorStrategy):
         mode = params.get('mode', 'simple')
         suffix = df_col_suffix or ""
 
-        delta = df['close'].diff()
         if mode == 'simple':
-            gain = delta.clip(lower=0).rolling(window=period, min_periods=period).mean()
-            loss = -delta.clip(upper=0).rolling(window=period, min_periods=period).mean()
+            gain = sma(up_moves(df['close']), period)
+            loss = -sma(down_moves(df['close']), period)
         elif mode == 'exponential':
-            gain = delta.clip(lower=0).ewm(span=period, adjust=False, min_periods=period).mean()
-            loss = -delta.clip(upper=0).ewm(span=period, adjust=False, min_periods=period).mean()
+            gain = ema(up_moves(df['close']), period)
+            loss = -ema(down_moves(df['close']), period)
         else:
             raise ValueError(f"Unknown mode '{mode}' for RSI")
 
@@ -85,3 +99,34 @@ class RSI(BaseIndicatorStrategy):
                                           ).shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        overbought = params['overbought']
+        oversold = params['oversold']
+        mode = params.get('mode', 'simple')
+        suffix = df_col_suffix or ""
+
+        if mode == 'simple':
+            average = RollingMean
+        elif mode == 'exponential':
+            average = ExponentialMean
+        else:
+            raise ValueError(f"Unknown mode '{mode}' for RSI")
+        gain_average, loss_average = average(period), average(period)
+        previous_close, previous_rsi = Lag(), Lag()
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            delta = bar['close'] - previous_close.update(bar['close'])
+            gain = gain_average.update(clip_lower(delta, 0.0))
+            loss = -loss_average.update(clip_upper(delta, 0.0))
+            rsi = 100 - divide(100, 1 + divide(gain, loss))
+            last_rsi = previous_rsi.update(rsi)
+            return {
+                f'RSI{suffix}': rsi,
+                f'RSI_LONG_SIGNAL{suffix}': long_signal.update(rsi < oversold and last_rsi >= oversold),
+                f'RSI_SHORT_SIGNAL{suffix}': short_signal.update(rsi > overbought and last_rsi <= overbought)
+            }
+
+        return update
@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import sma
+from src.indicators.streaming import Crossover, RollingMean, SignalLag
 
 
 class SMACross(BaseIndicatorStrategy):
@@ -40,6 +43,14 @@ class SMACross(BaseIndicatorStrategy):
             if 0 < combo['fast'] < combo['slow'] != combo['fast'] and combo['slow'] > 0
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.sma(graph.column('close'), params['fast']), graph.sma(graph.column('close'), params['slow'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return max(params['fast'], params['slow']) + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'fast' not in params or 'slow' not in params:
             raise ValueError(
@@ -50,8 +61,8 @@ class SMACross(BaseIndicatorStrategy):
         slow = params['slow']
         suffix = df_col_suffix or ""
 
-        sma_fast = df['close'].rolling(window=fast, min_periods=fast).mean()
-        sma_slow = df['close'].rolling(window=slow, min_periods=slow).mean()
+        sma_fast = sma(df['close'], fast)
+        sma_slow = sma(df['close'], slow)
 
         # Detect crossovers only, not just above/below
         cross_up = (sma_fast > sma_slow) & (sma_fast.shift(1) <= sma_slow.shift(1))
@@ -65,3 +76,26 @@ class SMACross(BaseIndicatorStrategy):
             f'SMA_CROSS_SHORT_SIGNAL{suffix}': cross_down.shift(1, fill_value=False).astype(int),
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        fast = params['fast']
+        slow = params['slow']
+        suffix = df_col_suffix or ""
+
+        sma_fast = RollingMean(fast)
+        sma_slow = RollingMean(slow)
+        crossover = Crossover()
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            fast_value = sma_fast.update(bar['close'])
+            slow_value = sma_slow.update(bar['close'])
+            cross_up, cross_down = crossover.update(fast_value, slow_value)
+            return {
+                f'SMA_FAST{suffix}': fast_value,
+                f'SMA_SLOW{suffix}': slow_value,
+                f'SMA_CROSS_LONG_SIGNAL{suffix}': long_signal.update(cross_up),
+                f'SMA_CROSS_SHORT_SIGNAL{suffix}': short_signal.update(cross_down),
+            }
+
+        return update
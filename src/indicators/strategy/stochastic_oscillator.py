@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import rolling_max, rolling_min
+from src.indicators.streaming import RollingMax, RollingMean, RollingMin, SignalLag, divide, replace_zero
 
 
 class Stochastic(BaseIndicatorStrategy):
@@ -47,6 +50,15 @@ class Stochastic(BaseIndicatorStrategy):
             if combo['k_period'] > 1 and combo['d_period'] > 0 and combo['overbought'] > combo['oversold']
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.rolling_max(graph.column('high'), params['k_period']),
+                graph.rolling_min(graph.column('low'), params['k_period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['k_period'] + params['d_period'] + 1
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'k_period' not in params or 'd_period' not in params or 'overbought' not in params or 'oversold' not in params:
             raise ValueError(
@@ -59,8 +71,8 @@ class Stochastic(BaseIndicatorStrategy):
         oversold = params['oversold']
         suffix = df_col_suffix or ""
 
-        high_roll = df['high'].rolling(window=k_period, min_periods=k_period).max()
-        low_roll = df['low'].rolling(window=k_period, min_periods=k_period).min()
+        high_roll = rolling_max(df['high'], k_period)
+        low_roll = rolling_min(df['low'], k_period)
         denominator = (high_roll - low_roll).replace(0, 1e-9)  # Avoid division by zero
 
         k = 100 * ((df['close'] - low_roll) / denominator)
@@ -73,3 +85,29 @@ class Stochastic(BaseIndicatorStrategy):
             f'STOCHASTIC_SHORT_SIGNAL{suffix}': (k > overbought).shift(1, fill_value=False).astype(int),
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        k_period = params['k_period']
+        d_period = params['d_period']
+        overbought = params['overbought']
+        oversold = params['oversold']
+        suffix = df_col_suffix or ""
+
+        high_max, low_min = RollingMax(k_period), RollingMin(k_period)
+        k_average = RollingMean(d_period)
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            high_roll = high_max.update(bar['high'])
+            low_roll = low_min.update(bar['low'])
+            denominator = replace_zero(high_roll - low_roll, 1e-9)  # Avoid division by zero
+            k = 100 * divide(bar['close'] - low_roll, denominator)
+            d = k_average.update(k)
+            return {
+                f'STOCH_K{suffix}': k,
+                f'STOCH_D{suffix}': d,
+                f'STOCHASTIC_LONG_SIGNAL{suffix}': long_signal.update(k < oversold),
+                f'STOCHASTIC_SHORT_SIGNAL{suffix}': short_signal.update(k > overbought),
+            }
+
+        return update
@@ -1,5 +1,7 @@
 from src.commons.constants.constants import IndicatorName
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.streaming import Lag, RollingMax, RollingMean, RollingMin, SignalLag, clip_lower, clip_upper, \
+    divide, replace_zero
 
 
 class StochRSI(BaseIndicatorStrategy):
@@ -36,6 +38,10 @@ class StochRSI(BaseIndicatorStrategy):
             if combo['period'] > 1
         ]
 
+    @classmethod
+    def warmup_bars(cls, params):
+        return 2 * params['period'] + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params:
             raise ValueError(
@@ -64,3 +70,30 @@ class StochRSI(BaseIndicatorStrategy):
             f'STOCH_RSI_SHORT_SIGNAL{suffix}': (stoch_rsi > 0.8).shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        suffix = df_col_suffix or ""
+
+        previous_close = Lag()
+        gain_average, loss_average = RollingMean(period), RollingMean(period)
+        rsi_min, rsi_max = RollingMin(period), RollingMax(period)
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            delta = bar['close'] - previous_close.update(bar['close'])
+            gain = gain_average.update(clip_lower(delta, 0.0))
+            loss = -loss_average.update(clip_upper(delta, 0.0))
+            rsi = 100 - divide(100, 1 + divide(gain, loss))
+
+            min_rsi = rsi_min.update(rsi)
+            max_rsi = rsi_max.update(rsi)
+            denominator = replace_zero(max_rsi - min_rsi, 1e-9)  # avoid division by zero
+            stoch_rsi = divide(rsi - min_rsi, denominator)
+            return {
+                f'STOCH_RSI{suffix}': stoch_rsi,
+                f'STOCH_RSI_LONG_SIGNAL{suffix}': long_signal.update(stoch_rsi < 0.2),
+                f'STOCH_RSI_SHORT_SIGNAL{suffix}': short_signal.update(stoch_rsi > 0.8)
+            }
+
+        return update
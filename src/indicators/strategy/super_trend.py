@@ -1,6 +1,11 @@
+import math
 import pandas as pd
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.kernels import supertrend_kernel
+from src.indicators.primitives import average_true_range
+from src.indicators.streaming import Crossover, RollingMean, SignalLag, TrueRange
 
 
 class SuperTrend(BaseIndicatorStrategy):
@@ -41,6 +46,14 @@ class SuperTrend(BaseIndicatorStrategy):
             if combo['period'] > 1 and combo['multiplier'] > 0
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.average_true_range(params['period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return None  # the final bands and trend state carry over from the first bar
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params or 'multiplier' not in params:
             raise ValueError(
@@ -54,37 +67,14 @@ class SuperTrend(BaseIndicatorStrategy):
         high = df['high']
         low = df['low']
         close = df['close']
-        tr1 = high - low
-        tr2 = (high - close.shift()).abs()
-        tr3 = (low - close.shift()).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(period, min_periods=period).mean()
+        atr = average_true_range(high, low, close, period)
         hl2 = (high + low) / 2
         basic_ub = hl2 + (multiplier * atr)
         basic_lb = hl2 - (multiplier * atr)
-        final_ub = basic_ub.copy()
-        final_lb = basic_lb.copy()
-
-        for i in range(1, len(df)):
-            if close.iloc[i - 1] > final_ub.iloc[i - 1]:
-                final_ub.iloc[i] = basic_ub.iloc[i]
-            else:
-                final_ub.iloc[i] = min(basic_ub.iloc[i], final_ub.iloc[i - 1])
-            if close.iloc[i - 1] < final_lb.iloc[i - 1]:
-                final_lb.iloc[i] = basic_lb.iloc[i]
-            else:
-                final_lb.iloc[i] = max(basic_lb.iloc[i], final_lb.iloc[i - 1])
-
-        super_trend = pd.Series(index=df.index, dtype="float64")
-        in_uptrend = True
-        for i in range(period, len(df)):
-            if in_uptrend:
-                if close.iloc[i] < final_ub.iloc[i]:
-                    in_uptrend = False
-            else:
-                if close.iloc[i] > final_lb.iloc[i]:
-                    in_uptrend = True
-            super_trend.iloc[i] = final_lb.iloc[i] if in_uptrend else final_ub.iloc[i]
+        super_trend = pd.Series(
+            supertrend_kernel(close.tolist(), basic_ub.tolist(), basic_lb.tolist(), period),
+            index=df.index, dtype="float64",
+        )
 
         cross_up = (close > super_trend) & (close.shift(1) <= super_trend.shift(1))
         cross_down = (close < super_trend) & (close.shift(1) >= super_trend.shift(1))
@@ -95,3 +85,48 @@ class SuperTrend(BaseIndicatorStrategy):
             f'SUPER_TREND_SHORT_SIGNAL{suffix}': cross_down.shift(1, fill_value=False).astype(int),
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        multiplier = params['multiplier']
+        suffix = df_col_suffix or ""
+
+        true_range = TrueRange()
+        atr_average = RollingMean(period)
+        crossover = Crossover()
+        long_signal, short_signal = SignalLag(), SignalLag()
+        # Band recursion of supertrend_kernel, one bar at a time
+        state = dict(index=-1, close=math.nan, final_ub=math.nan, final_lb=math.nan, in_uptrend=True)
+
+        def update(bar):
+            high, low, close = bar['high'], bar['low'], bar['close']
+            atr = atr_average.update(true_range.update(high, low, close))
+            hl2 = (high + low) / 2
+            final_ub = hl2 + (multiplier * atr)
+            final_lb = hl2 - (multiplier * atr)
+            state['index'] += 1
+            if state['index'] > 0:
+                if not state['close'] > state['final_ub']:
+                    final_ub = min(final_ub, state['final_ub'])
+                if not state['close'] < state['final_lb']:
+                    final_lb = max(final_lb, state['final_lb'])
+
+            super_trend = math.nan
+            if state['index'] >= period:
+                if state['in_uptrend']:
+                    if close < final_ub:
+                        state['in_uptrend'] = False
+                else:
+                    if close > final_lb:
+                        state['in_uptrend'] = True
+                super_trend = final_lb if state['in_uptrend'] else final_ub
+            state.update(close=close, final_ub=final_ub, final_lb=final_lb)
+
+            cross_up, cross_down = crossover.update(close, super_trend)
+            return {
+                f'SUPERTREND{suffix}': super_trend,
+                f'SUPER_TREND_LONG_SIGNAL{suffix}': long_signal.update(cross_up),
+                f'SUPER_TREND_SHORT_SIGNAL{suffix}': short_signal.update(cross_down),
+            }
+
+        return update
@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
-from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators import primitive_graph as graph
+from src.indicators.base_indicator_strategy import BaseIndicatorStrategy, ema_warmup_bars
+from src.indicators.primitives import ema
+from src.indicators.streaming import Crossover, ExponentialMean, SignalLag
 
 
 class TEMA(BaseIndicatorStrategy):
@@ -35,6 +38,15 @@ class TEMA(BaseIndicatorStrategy):
             if combo['period'] > 1
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        period = params['period']
+        return [graph.ema(graph.ema(graph.ema(graph.column('close'), period), period), period)]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return 3 * ema_warmup_bars(params['period']) + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params:
             raise ValueError(
@@ -44,9 +56,9 @@ class TEMA(BaseIndicatorStrategy):
         period = params['period']
         suffix = df_col_suffix or ""
 
-        ema1 = df['close'].ewm(span=period, adjust=False, min_periods=period).mean()
-        ema2 = ema1.ewm(span=period, adjust=False, min_periods=period).mean()
-        ema3 = ema2.ewm(span=period, adjust=False, min_periods=period).mean()
+        ema1 = ema(df['close'], period)
+        ema2 = ema(ema1, period)
+        ema3 = ema(ema2, period)
         tema = 3 * (ema1 - ema2) + ema3
 
         cross_up = (df['close'] > tema) & (df['close'].shift(1) <= tema.shift(1))
@@ -58,3 +70,25 @@ class TEMA(BaseIndicatorStrategy):
             f'TEMA_SHORT_SIGNAL{suffix}': cross_down.shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        suffix = df_col_suffix or ""
+
+        ema1_stream, ema2_stream, ema3_stream = [ExponentialMean(period) for _ in range(3)]
+        crossover = Crossover()
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            ema1 = ema1_stream.update(bar['close'])
+            ema2 = ema2_stream.update(ema1)
+            ema3 = ema3_stream.update(ema2)
+            tema = 3 * (ema1 - ema2) + ema3
+            cross_up, cross_down = crossover.update(bar['close'], tema)
+            return {
+                f'TEMA{suffix}': tema,
+                f'TEMA_LONG_SIGNAL{suffix}': long_signal.update(cross_up),
+                f'TEMA_SHORT_SIGNAL{suffix}': short_signal.update(cross_down)
+            }
+
+        return update
@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
-from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators import primitive_graph as graph
+from src.indicators.base_indicator_strategy import BaseIndicatorStrategy, ema_warmup_bars
+from src.indicators.primitives import ema
+from src.indicators.streaming import ExponentialMean, Lag, SignalLag, divide
 
 
 class TRIX(BaseIndicatorStrategy):
@@ -36,6 +39,15 @@ class TRIX(BaseIndicatorStrategy):
             if combo['period'] > 1
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        period = params['period']
+        return [graph.ema(graph.ema(graph.ema(graph.column('close'), period), period), period)]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return 3 * ema_warmup_bars(params['period']) + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params:
             raise ValueError(
@@ -45,9 +57,9 @@ class TRIX(BaseIndicatorStrategy):
         period = params['period']
         suffix = df_col_suffix or ""
 
-        ema1 = df['close'].ewm(span=period, adjust=False, min_periods=period).mean()
-        ema2 = ema1.ewm(span=period, adjust=False, min_periods=period).mean()
-        ema3 = ema2.ewm(span=period, adjust=False, min_periods=period).mean()
+        ema1 = ema(df['close'], period)
+        ema2 = ema(ema1, period)
+        ema3 = ema(ema2, period)
         trix = ema3.pct_change() * 100
 
         new_cols = {
@@ -56,3 +68,22 @@ class TRIX(BaseIndicatorStrategy):
             f'TRIX_SHORT_SIGNAL{suffix}': (trix < 0).shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        suffix = df_col_suffix or ""
+
+        ema1_stream, ema2_stream, ema3_stream = [ExponentialMean(period) for _ in range(3)]
+        previous_ema3 = Lag()
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            ema3 = ema3_stream.update(ema2_stream.update(ema1_stream.update(bar['close'])))
+            trix = (divide(ema3, previous_ema3.update(ema3)) - 1) * 100
+            return {
+                f'TRIX{suffix}': trix,
+                f'TRIX_LONG_SIGNAL{suffix}': long_signal.update(trix > 0),
+                f'TRIX_SHORT_SIGNAL{suffix}': short_signal.update(trix < 0)
+            }
+
+        return update
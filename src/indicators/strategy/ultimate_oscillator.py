@@ -1,6 +1,7 @@
 import pandas as pd
 from src.commons.constants.constants import IndicatorName
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.streaming import Lag, RollingSum, SignalLag, divide, nanmax, nanmin
 
 
 class UltimateOsc(BaseIndicatorStrategy):
@@ -45,6 +46,10 @@ class UltimateOsc(BaseIndicatorStrategy):
             if 1 < combo['period_short'] < combo['period_medium'] < combo['period_long']
         ]
 
+    @classmethod
+    def warmup_bars(cls, params):
+        return max(params['period_short'], params['period_medium'], params['period_long']) + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         for key in ['period_short', 'period_medium', 'period_long']:
             if key not in params:
@@ -79,3 +84,29 @@ class UltimateOsc(BaseIndicatorStrategy):
             f'ULTIMATE_OSC_SHORT_SIGNAL{suffix}': (uo < 30).shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        periods = [params['period_short'], params['period_medium'], params['period_long']]
+        suffix = df_col_suffix or ""
+
+        previous_close = Lag()
+        bp_sums = [RollingSum(period) for period in periods]
+        tr_sums = [RollingSum(period) for period in periods]
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            high, low, close = bar['high'], bar['low'], bar['close']
+            prev_close = previous_close.update(close)
+            bp = close - nanmin(low, prev_close)
+            tr = nanmax(high, prev_close) - nanmin(low, prev_close)
+            avg_short, avg_medium, avg_long = [
+                divide(bp_sum.update(bp), tr_sum.update(tr)) for bp_sum, tr_sum in zip(bp_sums, tr_sums)]
+
+            uo = 100 * ((4 * avg_short) + (2 * avg_medium) + avg_long) / 7
+            return {
+                f'ULTIMATE_OSC{suffix}': uo,
+                f'ULTIMATE_OSC_LONG_SIGNAL{suffix}': long_signal.update(uo > 70),
+                f'ULTIMATE_OSC_SHORT_SIGNAL{suffix}': short_signal.update(uo < 30)
+            }
+
+        return update
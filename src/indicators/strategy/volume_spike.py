@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import sma
+from src.indicators.streaming import RollingMean, SignalLag
 
 
 class VolumeSpike(BaseIndicatorStrategy):
@@ -38,6 +41,14 @@ class VolumeSpike(BaseIndicatorStrategy):
             if combo['period'] > 1 and combo['spike_mult'] > 1.0
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.sma(graph.column('volume'), params['period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['period'] + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params or 'spike_mult' not in params:
             raise ValueError(
@@ -48,7 +59,7 @@ class VolumeSpike(BaseIndicatorStrategy):
         spike_mult = params['spike_mult']
         suffix = df_col_suffix or ""
 
-        vol_ma = df['volume'].rolling(period, min_periods=period).mean()
+        vol_ma = sma(df['volume'], period)
         spike = df['volume'] > (vol_ma * spike_mult)
 
         new_cols = {
@@ -57,3 +68,23 @@ class VolumeSpike(BaseIndicatorStrategy):
             f'VOLUME_SPIKE_SHORT_SIGNAL{suffix}': spike.shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        spike_mult = params['spike_mult']
+        suffix = df_col_suffix or ""
+
+        volume_average = RollingMean(period)
+        spike_signal = SignalLag()
+
+        def update(bar):
+            vol_ma = volume_average.update(bar['volume'])
+            spike = bar['volume'] > (vol_ma * spike_mult)
+            lagged_spike = spike_signal.update(spike)
+            return {
+                f'VOLUME_SPIKE{suffix}': int(spike),
+                f'VOLUME_SPIKE_LONG_SIGNAL{suffix}': lagged_spike,
+                f'VOLUME_SPIKE_SHORT_SIGNAL{suffix}': lagged_spike
+            }
+
+        return update
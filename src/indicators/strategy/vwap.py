@@ -1,5 +1,7 @@
+import math
 from src.commons.constants.constants import IndicatorName
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.streaming import RollingSum, SignalLag, divide
 
 
 class VWAP(BaseIndicatorStrategy):
@@ -35,6 +37,12 @@ class VWAP(BaseIndicatorStrategy):
             if combo['period'] >= 0
         ]
 
+    @classmethod
+    def warmup_bars(cls, params):
+        if params['period'] == 0:
+            return None  # cumulative VWAP runs from the first bar
+        return params['period'] + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params:
             raise ValueError(
@@ -62,3 +70,33 @@ class VWAP(BaseIndicatorStrategy):
             f'VWAP_SHORT_SIGNAL{suffix}': cross_down.shift(1, fill_value=False).astype(int),
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        suffix = df_col_suffix or ""
+
+        vp_sum, volume_sum = RollingSum(period), RollingSum(period)
+        totals = dict(volume=0, vp=0.0)  # cumsum skips NaN values but leaves NaN at their bars
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            close, volume = bar['close'], bar['volume']
+            if period == 0:
+                if volume == volume:
+                    totals['volume'] += volume
+                vp = close * volume
+                if vp == vp:
+                    totals['vp'] += vp
+                cum_vol = totals['volume'] if volume == volume else math.nan
+                cum_vp = totals['vp'] if vp == vp else math.nan
+                vwap = divide(cum_vp, cum_vol)
+            else:
+                vwap = divide(vp_sum.update(close * volume), volume_sum.update(volume))
+
+            return {
+                f'VWAP{suffix}': vwap,
+                f'VWAP_LONG_SIGNAL{suffix}': long_signal.update(close > vwap),
+                f'VWAP_SHORT_SIGNAL{suffix}': short_signal.update(close < vwap),
+            }
+
+        return update
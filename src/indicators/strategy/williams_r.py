@@ -1,5 +1,8 @@
 from src.commons.constants.constants import IndicatorName
+from src.indicators import primitive_graph as graph
 from src.indicators.base_indicator_strategy import BaseIndicatorStrategy
+from src.indicators.primitives import rolling_max, rolling_min
+from src.indicators.streaming import RollingMax, RollingMin, SignalLag, divide, replace_zero
 
 
 class WilliamsR(BaseIndicatorStrategy):
@@ -43,6 +46,15 @@ class WilliamsR(BaseIndicatorStrategy):
             if combo['period'] > 1 and combo['overbought'] > combo['oversold']
         ]
 
+    @classmethod
+    def primitive_nodes(cls, params):
+        return [graph.rolling_max(graph.column('high'), params['period']),
+                graph.rolling_min(graph.column('low'), params['period'])]
+
+    @classmethod
+    def warmup_bars(cls, params):
+        return params['period'] + 2
+
     def compute_signals(self, df, params, df_col_suffix=None):
         if 'period' not in params or 'overbought' not in params or 'oversold' not in params:
             raise ValueError(
@@ -54,8 +66,8 @@ class WilliamsR(BaseIndicatorStrategy):
         oversold = params['oversold']
         suffix = df_col_suffix or ""
 
-        high_roll = df['high'].rolling(window=period, min_periods=period).max()
-        low_roll = df['low'].rolling(window=period, min_periods=period).min()
+        high_roll = rolling_max(df['high'], period)
+        low_roll = rolling_min(df['low'], period)
         denominator = (high_roll - low_roll).replace(0, 1e-9)  # avoid division by zero
         wr = -100 * ((high_roll - df['close']) / denominator)
 
@@ -65,3 +77,25 @@ class WilliamsR(BaseIndicatorStrategy):
             f'WILLIAMS_R_SHORT_SIGNAL{suffix}': (wr > overbought).shift(1, fill_value=False).astype(int)
         }
         return new_cols
+
+    def create_stream(self, params, df_col_suffix=None):
+        period = params['period']
+        overbought = params['overbought']
+        oversold = params['oversold']
+        suffix = df_col_suffix or ""
+
+        high_max, low_min = RollingMax(period), RollingMin(period)
+        long_signal, short_signal = SignalLag(), SignalLag()
+
+        def update(bar):
+            high_roll = high_max.update(bar['high'])
+            low_roll = low_min.update(bar['low'])
+            denominator = replace_zero(high_roll - low_roll, 1e-9)  # avoid division by zero
+            wr = -100 * divide(high_roll - bar['close'], denominator)
+            return {
+                f'WILLIAMSR{suffix}': wr,
+                f'WILLIAMS_R_LONG_SIGNAL{suffix}': long_signal.update(wr < oversold),
+                f'WILLIAMS_R_SHORT_SIGNAL{suffix}': short_signal.update(wr > overbought)
+            }
+
+        return update
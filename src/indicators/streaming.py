@@ -0,0 +1,381 @@
+"""
+Incremental counterparts of the pandas operations the indicators are built from, for streaming one bar at a time.
+Each one keeps only the state its window needs, so a live update costs the same however long the history is, and
+mirrors pandas' own algorithm step by step (Kahan sums, Welford variance, ewm weights, inf treated as missing, ...)
+so a stream reproduces compute_signals exactly.
+"""
+import math
+from collections import deque
+
+import numpy as np
+
+BAR_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+INV_COND_TOL = np.finfo(np.float64).eps * 1e3  # pandas' roll_var catastrophic-cancellation threshold
+
+
+def iter_bars(df):
+    """Yields the rows of df as {field: value} dicts of plain Python values, for feeding a stream."""
+    fields = [field for field in BAR_FIELDS if field in df.columns]
+    for row in zip(*(df[field].tolist() for field in fields)):
+        yield dict(zip(fields, row))
+
+
+def missing_as_nan(value):
+    """Window input as pandas sees it: float64, with +/-inf treated as missing."""
+    value = float(value)
+    return value if -math.inf < value < math.inf else math.nan
+
+
+def divide(numerator, denominator):
+    """Float division with numpy semantics: x / 0 is +/-inf and 0 / 0 is NaN instead of raising."""
+    numerator, denominator = float(numerator), float(denominator)
+    if denominator == 0:
+        if numerator != numerator or numerator == 0:
+            return math.nan
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+    return numerator / denominator
+
+
+def nanmax(*values):
+    """Row-wise DataFrame.max(axis=1): the largest non-NaN value, NaN if all are NaN."""
+    present = [value for value in values if value == value]
+    return max(present) if present else math.nan
+
+
+def nanmin(*values):
+    present = [value for value in values if value == value]
+    return min(present) if present else math.nan
+
+
+def replace_zero(value, replacement):
+    """Series.replace(0, replacement) for one value."""
+    return replacement if value == 0 else value
+
+
+def clip_lower(value, lower):
+    return lower if value < lower else value
+
+
+def clip_upper(value, upper):
+    return upper if value > upper else value
+
+
+def zsqrt(value):
+    """Square root that maps negative variances to 0, like pandas' zsqrt."""
+    if value < 0:
+        return 0.0
+    return math.sqrt(value) if value == value else math.nan
+
+
+class Lag:
+    """Series.shift(periods): the value fed `periods` updates ago, `fill` until there is one."""
+
+    def __init__(self, periods=1, fill=math.nan):
+        self.periods = periods
+        self.fill = fill
+        self.history = deque(maxlen=periods)
+
+    def update(self, value):
+        if self.periods == 0:
+            return value
+        lagged = self.history[0] if len(self.history) == self.periods else self.fill
+        self.history.append(value)
+        return lagged
+
+
+class SignalLag:
+    """signal.shift(1, fill_value=False).astype(int): the previous bar's flag as 0/1."""
+
+    def __init__(self):
+        self.previous = False
+
+    def update(self, flag):
+        lagged = int(self.previous)
+        self.previous = bool(flag)
+        return lagged
+
+
+class Crossover:
+    """(a > b) & (a.shift(1) <= b.shift(1)) and its mirror (a < b) & (a.shift(1) >= b.shift(1))."""
+
+    def __init__(self):
+        self.previous_a = math.nan
+        self.previous_b = math.nan
+
+    def update(self, a, b):
+        cross_up = a > b and self.previous_a <= self.previous_b
+        cross_down = a < b and self.previous_a >= self.previous_b
+        self.previous_a, self.previous_b = a, b
+        return cross_up, cross_down
+
+
+class RollingSum:
+    """rolling(window, min_periods=window).sum(), replaying pandas' roll_sum Kahan add/remove steps."""
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self._setup()
+
+    def update(self, value):
+        value = missing_as_nan(value)
+        self.values.append(value)
+        if self.window == 1 and len(self.values) > 1:
+            self.values.popleft()
+        if len(self.values) == 1:
+            # First bar, or a one-bar window: pandas starts each such window from scratch
+            self._setup()
+            self._add(value)
+        else:
+            if len(self.values) > self.window:
+                self._remove(self.values.popleft())
+            self._add(value)
+        return self._result()
+
+    def _setup(self):
+        self.nobs = 0
+        self.neg_ct = 0
+        self.sum_x = 0.0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.num_consecutive_same_value = 0
+        self.prev_value = self.values[0] if self.values else math.nan
+
+    def _add(self, value):
+        if value != value:
+            return
+        self.nobs += 1
+        y = value - self.compensation_add
+        t = self.sum_x + y
+        self.compensation_add = t - self.sum_x - y
+        self.sum_x = t
+        if math.copysign(1.0, value) < 0:
+            self.neg_ct += 1
+        if value == self.prev_value:
+            self.num_consecutive_same_value += 1
+        else:
+            self.num_consecutive_same_value = 1
+        self.prev_value = value
+
+    def _remove(self, value):
+        if value != value:
+            return
+        self.nobs -= 1
+        y = - value - self.compensation_remove
+        t = self.sum_x + y
+        self.compensation_remove = t - self.sum_x - y
+        self.sum_x = t
+        if math.copysign(1.0, value) < 0:
+            self.neg_ct -= 1
+
+    def _result(self):
+        if self.nobs < self.window:
+            return math.nan
+        if self.num_consecutive_same_value >= self.nobs:
+            return self.prev_value * self.nobs
+        return self.sum_x
+
+
+class RollingMean(RollingSum):
+    """rolling(window, min_periods=window).mean(), replaying pandas' roll_mean."""
+
+    def _result(self):
+        if self.nobs < self.window or self.nobs <= 0:
+            return math.nan
+        result = self.sum_x / self.nobs
+        if self.num_consecutive_same_value >= self.nobs:
+            return self.prev_value
+        if self.neg_ct == 0 and result < 0:
+            return 0.0  # all positive
+        if self.neg_ct == self.nobs and result > 0:
+            return 0.0  # all negative
+        return result
+
+
+class RollingStd:
+    """rolling(window, min_periods=window).std(), replaying pandas' Welford roll_var (ddof=1) and zsqrt."""
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self._recompute()
+
+    def update(self, value):
+        value = missing_as_nan(value)
+        self.values.append(value)
+        if self.window == 1 and len(self.values) > 1:
+            self.values.popleft()
+        requires_recompute = len(self.values) == 1
+        if not requires_recompute:
+            if len(self.values) > self.window:
+                self._remove(self.values.popleft())
+            self._add(value)
+        if requires_recompute or self.numerically_unstable:
+            self._recompute()
+
+        if self.nobs >= self.window and self.nobs > 1:
+            return zsqrt(self.ssqdm_x / (self.nobs - 1.0))
+        return math.nan
+
+    def _recompute(self):
+        self.nobs = 0.0
+        self.mean_x = 0.0
+        self.ssqdm_x = 0.0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.numerically_unstable = False
+        for value in self.values:
+            self._add(value)
+        self.numerically_unstable = False
+
+    def _add(self, value):
+        if value != value:
+            return
+        prev_m2 = self.ssqdm_x
+        self.nobs += 1
+        prev_mean = self.mean_x - self.compensation_add
+        y = value - self.compensation_add
+        t = y - self.mean_x
+        self.compensation_add = t + self.mean_x - y
+        self.mean_x = self.mean_x + t / self.nobs
+        self.ssqdm_x = self.ssqdm_x + (value - prev_mean) * (value - self.mean_x)
+        if prev_m2 * INV_COND_TOL > self.ssqdm_x:
+            self.numerically_unstable = True
+
+    def _remove(self, value):
+        if value != value:
+            return
+        prev_m2 = self.ssqdm_x
+        self.nobs -= 1
+        if self.nobs:
+            prev_mean = self.mean_x - self.compensation_remove
+            y = value - self.compensation_remove
+            t = y - self.mean_x
+            self.compensation_remove = t + self.mean_x - y
+            self.mean_x = self.mean_x - t / self.nobs
+            self.ssqdm_x = self.ssqdm_x - (value - prev_mean) * (value - self.mean_x)
+            if prev_m2 * INV_COND_TOL > self.ssqdm_x:
+                self.numerically_unstable = True
+        else:
+            self.mean_x = 0.0
+            self.ssqdm_x = 0.0
+            self.numerically_unstable = False
+
+
+class RollingExtreme:
+    """
+    rolling(window, min_periods=window).max() (is_max) / .min() with a monotonic deque. Also tracks how many bars
+    ago the extreme was (ties resolve to the latest bar) for Aroon.
+    """
+
+    def __init__(self, window, is_max):
+        self.window = window
+        self.is_max = is_max
+        self.candidates = deque()  # (bar index, value)
+        self.index = -1
+        self.last_nan = -window
+
+    def update(self, value):
+        self.index += 1
+        value = missing_as_nan(value)
+        if value != value:
+            self.last_nan = self.index
+            self.candidates.clear()
+            return math.nan
+        if self.is_max:
+            while self.candidates and self.candidates[-1][1] <= value:
+                self.candidates.pop()
+        else:
+            while self.candidates and self.candidates[-1][1] >= value:
+                self.candidates.pop()
+        self.candidates.append((self.index, value))
+        if self.candidates[0][0] <= self.index - self.window:
+            self.candidates.popleft()
+        if self.index >= self.window - 1 and self.index - self.last_nan >= self.window:
+            return self.candidates[0][1]
+        return math.nan
+
+    def bars_since(self):
+        """Bars since the extreme of the current window, NaN whenever update() returned NaN."""
+        if self.index >= self.window - 1 and self.index - self.last_nan >= self.window:
+            return float(self.index - self.candidates[0][0])
+        return math.nan
+
+
+class RollingMax(RollingExtreme):
+    def __init__(self, window):
+        super().__init__(window, True)
+
+
+class RollingMin(RollingExtreme):
+    def __init__(self, window):
+        super().__init__(window, False)
+
+
+class RollingMeanAbsDeviation:
+    """primitives.rolling_mean_abs_deviation for the latest window, with the same numpy reductions (O(window))."""
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.index = -1
+        self.last_nan = -window
+
+    def update(self, value):
+        self.index += 1
+        value = missing_as_nan(value)
+        self.values.append(value)
+        if value != value:
+            self.last_nan = self.index
+        if self.index < self.window - 1 or self.index - self.last_nan < self.window:
+            return math.nan
+        window_values = np.array(self.values)
+        mean = window_values.sum() / self.window
+        return float(np.abs(window_values - mean).sum() / self.window)
+
+
+class ExponentialMean:
+    """ewm(span=span, adjust=False, min_periods=span).mean(), replaying pandas' ewm weights including NaN gaps."""
+
+    def __init__(self, span):
+        self.com = (span - 1) / 2.0
+        alpha = 1. / (1. + self.com)
+        self.old_wt_factor = 1. - alpha
+        self.new_wt = alpha
+        self.min_periods = max(int(span), 1)
+        self.weighted = None
+        self.old_wt = 1.
+        self.nobs = 0
+
+    def update(self, value):
+        value = missing_as_nan(value)
+        is_observation = value == value
+        if self.weighted is None:
+            self.weighted = value
+            self.nobs = int(is_observation)
+        else:
+            self.nobs += is_observation
+            if self.weighted == self.weighted:
+                self.old_wt *= self.old_wt_factor
+                if is_observation:
+                    if self.weighted != value:
+                        if self.com == 1:
+                            self.new_wt = 1. - self.old_wt
+                        self.weighted = self.old_wt * self.weighted + self.new_wt * value
+                        self.weighted /= (self.old_wt + self.new_wt)
+                    self.old_wt = 1.
+            elif is_observation:
+                self.weighted = value
+        return self.weighted if self.nobs >= self.min_periods else math.nan
+
+
+class TrueRange:
+    """primitives.true_range for the latest bar."""
+
+    def __init__(self):
+        self.previous_close = math.nan
+
+    def update(self, high, low, close):
+        true_range = nanmax(high - low, abs(high - self.previous_close), abs(low - self.previous_close))
+        self.previous_close = close
+        return true_range
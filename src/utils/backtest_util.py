@@ -1,7 +1,12 @@
 import itertools
+import os
 
 from src.commons.constants.constants import IndicatorName
 
+# simulation_params that can be swept as <key>_list in risk-grid mode
+RISK_PARAM_KEYS = ('stop_loss_pct', 'trailing_stop_loss_pct', 'target_profit_pct', 'hold_min_bars', 'hold_max_bars',
+                   'slippage_pct')
+
 
 def construct_strategy_param_grid(strategy):
     """
@@ -42,3 +47,22 @@ def construct_strategy_param_grid(strategy):
 def construct_strategy_hyperparam_str(strategy_params):
     """Create a string like 8-21, 14-70-30, etc. from params dict, excluding 'name'."""
     return "-".join(str(strategy_params[k]) for k in sorted(strategy_params) if k != "name")
+
+
+def construct_risk_param_grid(simulation_params, simulation_kwargs):
+    """
+    Risk-grid mode: if simulation_params has a <key>_list for any RISK_PARAM_KEYS, returns every combination of the
+    risk params as a list of dicts, the others fixed at their simulation_kwargs value. Returns [] otherwise.
+    """
+    if not any(f"{key}_list" in simulation_params for key in RISK_PARAM_KEYS):
+        return []
+    param_lists = [simulation_params.get(f"{key}_list", [simulation_kwargs[key]]) for key in RISK_PARAM_KEYS]
+    return [dict(zip(RISK_PARAM_KEYS, values)) for values in itertools.product(*param_lists)]
+
+
+def construct_risk_filename(filename, risk_params):
+    """Suffixes a per-strategy filename with the risk params, e.g. X_5m_RSI_14-70-30_risk-120-2-....csv."""
+    if not risk_params:
+        return filename
+    base, extension = os.path.splitext(filename)
+    return f"{base}_risk-{construct_strategy_hyperparam_str(risk_params)}{extension}"
@@ -1,7 +1,99 @@
+import time
+
+import numpy as np
+
 from src.commons.constants.constants import OrderSide, Exchange, Segment
-from src.utils.file_util import read_config
+from src.utils.file_util import read_config, CONFIG_WATCH_INTERVAL_SEC
 
 BROKERAGE_CFG = "config/brokerage-config.yml"
+ROUND_TIE_TOL = 1e-6  # totals re-rounds with round() every fill whose value in paise is this close to a half-paisa
+
+# (segment, exchange) -> (brokerage config it was compiled from, time.monotonic() of the last check, FeeSchedule)
+_fee_schedules = {}
+
+
+class FeeSchedule:
+    """
+    Charges of one (segment, exchange) compiled out of the brokerage config into plain per-side rates and caps.
+    `total` reproduces calculate_brokerage(...)['total'] exactly: same terms, same order of operations, same round().
+    `totals` prices whole arrays of fills in one NumPy pass, with the same results as `total`.
+    """
+
+    def __init__(self, brokerage_cfg, segment, exchange):
+        seg = brokerage_cfg['segments'][segment]
+        self.segment = segment
+        self.exchange = exchange
+        self.flat_brokerage = segment == Segment.FNO_OPTION.name
+        self.brokerage_percent = seg['brokerage_percent']
+        self.brokerage_cap = seg['brokerage_cap']
+        self.stt_percent_buy = seg.get('stt_percent_buy', 0)
+        self.stt_percent_sell = seg.get('stt_percent_sell', 0)
+        self.txn_percent = seg["txn_percent_nse"] if exchange.upper() == Exchange.NSE.name else seg["txn_percent_bse"]
+        self.stamp_percent_buy = seg['stamp_percent_buy']
+        self.sebi_percent = seg['sebi_per_crore'] / 1e7
+        self.gst_percent = brokerage_cfg['gst_percent']
+
+    def total(self, side, price, qty):
+        """Scalar fast path, identical to calculate_brokerage(segment, side, price, qty, exchange)['total']."""
+        turnover = price * qty
+        if self.flat_brokerage:
+            raw_brokerage = self.brokerage_cap
+        else:
+            raw_brokerage = min(turnover * self.brokerage_percent, self.brokerage_cap)
+        if side == OrderSide.BUY.name:
+            stt = turnover * self.stt_percent_buy
+            stamp = turnover * self.stamp_percent_buy
+        else:
+            stt = turnover * self.stt_percent_sell
+            stamp = 0
+        txn = turnover * self.txn_percent
+        sebi = turnover * self.sebi_percent
+        gst = (raw_brokerage + txn + sebi) * self.gst_percent
+        return round(raw_brokerage + stt + txn + sebi + stamp + gst, 2)
+
+    def totals(self, is_buy, prices, qtys):
+        """
+        Batch version of `total` over arrays of fills (is_buy is a bool array); returns a float64 array equal to
+        `total` fill by fill. The unrounded sums are bit-identical to the scalar path. np.round (x * 100, rint, / 100)
+        can disagree with round() only when x * 100 lies within float error of a half-paisa, so those few fills are
+        re-rounded with round() itself.
+        """
+        is_buy = np.asarray(is_buy, dtype=bool)
+        turnover = np.asarray(prices, dtype=np.float64) * np.asarray(qtys, dtype=np.float64)
+        if self.flat_brokerage:
+            raw_brokerage = np.full(turnover.shape, float(self.brokerage_cap))
+        else:
+            raw_brokerage = np.minimum(turnover * self.brokerage_percent, self.brokerage_cap)
+        stt = turnover * np.where(is_buy, self.stt_percent_buy, self.stt_percent_sell)
+        stamp = np.where(is_buy, turnover * self.stamp_percent_buy, 0.0)
+        txn = turnover * self.txn_percent
+        sebi = turnover * self.sebi_percent
+        gst = (raw_brokerage + txn + sebi) * self.gst_percent
+        unrounded = raw_brokerage + stt + txn + sebi + stamp + gst
+
+        rounded = np.round(unrounded, 2)
+        paise = unrounded * 100
+        for i in np.flatnonzero(np.abs(paise - np.floor(paise) - 0.5) < ROUND_TIE_TOL).tolist():
+            rounded[i] = round(unrounded[i].item(), 2)
+        return rounded
+
+
+def get_fee_schedule(segment, exchange):
+    """
+    FeeSchedule for (segment, exchange), compiled from BROKERAGE_CFG once per config version. At most every
+    CONFIG_WATCH_INTERVAL_SEC it asks read_config, which hands back the same frozen config until the file's mtime or
+    size changes; a new one makes the schedule recompile. Lookups in between are a dict hit, with no watcher thread.
+    """
+    now = time.monotonic()
+    cached = _fee_schedules.get((segment, exchange))
+    if cached is None or now - cached[1] >= CONFIG_WATCH_INTERVAL_SEC:
+        brokerage_cfg = read_config(BROKERAGE_CFG)
+        if cached is None or cached[0] is not brokerage_cfg:
+            cached = (brokerage_cfg, now, FeeSchedule(brokerage_cfg, segment, exchange))
+        else:
+            cached = (brokerage_cfg, now, cached[2])
+        _fee_schedules[(segment, exchange)] = cached
+    return cached[2]
 
 
 def calculate_brokerage(segment, side, price, qty, exchange):
@@ -1,18 +1,114 @@
+import hashlib
+import io
+import json
 import os
 import re
+import shutil
+import threading
+import time
+from functools import lru_cache
+from types import MappingProxyType
+
+import pandas as pd
 import yaml
 
 HISTORICAL_DATA_DIR = "data/historical"
 FEATURE_DATA_DIR = "data/feature"
 BASE_DIR = "data/simulation_results"
+BACKTEST_CACHE_DIR = "data/backtest_cache"
+FEATURE_STORE_DIR = "data/feature_store"
 TRADES_DIR = "trades"
 FEATURES_DIR = "features"
 PLOTS_DIR = "plots"
+CONFIG_WATCH_INTERVAL_SEC = 2
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Process-wide parsed configs: abs path -> (st_mtime_ns, st_size, frozen config)
+_config_cache = {}
+_config_lock = threading.Lock()
+# abs path -> [callback(config)] notified when the file changes on disk
+_config_subscribers = {}
+_config_watcher = None
+
+
+def freeze_config(value):
+    """Read-only view of a parsed YAML document: mappings become MappingProxyType and lists become tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze_config(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_config(item) for item in value)
+    return value
+
+
+def thaw_config(value):
+    """Mutable deep copy of a frozen config, for callers that need to edit or pickle it."""
+    if isinstance(value, (MappingProxyType, dict)):
+        return {key: thaw_config(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_config(item) for item in value]
+    return value
 
 
 def read_config(file_path):
-    with open(file_path, "r") as file:
-        return yaml.safe_load(file)
+    """
+    Returns the parsed YAML at file_path as a frozen (read-only) view. Parsed files are cached per process and only
+    re-read when their mtime or size changes; subscribers of the path are notified when that happens.
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    with _config_lock:
+        cached = _config_cache.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        with open(path, "r") as file:
+            config = freeze_config(yaml.safe_load(file))
+        _config_cache[path] = (stat.st_mtime_ns, stat.st_size, config)
+        callbacks = list(_config_subscribers.get(path, [])) if cached is not None else []
+
+    for callback in callbacks:
+        try:
+            callback(config)
+        except Exception as e:
+            print(f"❌ Config reload callback failed for {path}: {e}")
+    return config
+
+
+def subscribe_config_reload(file_path, callback):
+    """
+    Calls callback(config) with the new frozen config whenever file_path changes on disk. A single daemon thread
+    checks the mtime/size of every subscribed file each CONFIG_WATCH_INTERVAL_SEC, so subscribers do not poll.
+    """
+    global _config_watcher
+    path = os.path.abspath(file_path)
+    read_config(path)  # Prime the cache so the first change is detected against the current contents
+    with _config_lock:
+        _config_subscribers.setdefault(path, []).append(callback)
+        if _config_watcher is None:
+            _config_watcher = threading.Thread(target=_watch_configs, name="config-watcher", daemon=True)
+            _config_watcher.start()
+
+
+def unsubscribe_config_reload(file_path, callback):
+    path = os.path.abspath(file_path)
+    with _config_lock:
+        callbacks = _config_subscribers.get(path, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
+            _config_subscribers.pop(path, None)
+
+
+def _watch_configs():
+    while True:
+        time.sleep(CONFIG_WATCH_INTERVAL_SEC)
+        with _config_lock:
+            paths = list(_config_subscribers)
+        for path in paths:
+            try:
+                read_config(path)
+            except (OSError, yaml.YAMLError) as e:
+                # Keep serving the last good config while the file is missing or half-written
+                print(f"⚠️ Could not reload config {path}: {e}")
 
 
 def get_next_simulation_dir():
@@ -49,3 +145,126 @@ def get_plots_dir(sim_dir):
 def save_df_to_csv(df, path):
     os.makedirs(os.path.dirname(path), exist_ok=True)
     df.to_csv(path, index=False)
+
+
+def save_df_to_csv_atomic(df, path):
+    """Writes the CSV next to its destination and renames it into place, so readers never see a partial file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def append_df_to_csv_atomic(df, path):
+    """
+    Appends df's rows (no header) to the CSV at path without ever leaving a half-written row in it: the rows go to a
+    copy next to it, which is fsynced and renamed into place. Costs one file copy instead of rewriting every row.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        shutil.copyfile(path, tmp_path)
+        with open(tmp_path, "a", newline="") as file:
+            df.to_csv(file, header=False, index=False)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_csv_tail(path, n_rows, chunk_size=1 << 16):
+    """
+    Header plus the last n_rows rows of a CSV as a DataFrame, read by seeking back from the end of the file so the
+    cost does not grow with its length. Assumes one row per line (no quoted newlines), as save_df_to_csv writes.
+    """
+    with open(path, "rb") as file:
+        header = file.readline()
+        body_start = file.tell()
+        end = file.seek(0, os.SEEK_END)
+        start = end
+        tail = b""
+        while start > body_start and tail.count(b"\n") <= n_rows:
+            start = max(body_start, start - chunk_size)
+            chunk_size *= 2
+            file.seek(start)
+            tail = file.read(end - start)
+    lines = tail.splitlines(keepends=True)
+    if start > body_start:
+        lines = lines[1:]  # Partial first line
+    return pd.read_csv(io.BytesIO(header + b"".join(lines[-n_rows:] if n_rows > 0 else [])))
+
+
+def read_json(path, default=None):
+    if not os.path.exists(path):
+        return default
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def write_json_atomic(data, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w") as file:
+            json.dump(data, file, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def compute_file_hash(path, chunk_size=1 << 20, size=None):
+    """Hash of the file's content, or of only its first `size` bytes (to check a file was only appended to)."""
+    digest = hashlib.blake2b(digest_size=16)
+    remaining = os.path.getsize(path) if size is None else size
+    with open(path, "rb") as file:
+        while remaining > 0:
+            chunk = file.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+def compute_config_hash(config):
+    """Hash of a (frozen) config's content, independent of key order and formatting."""
+    return hashlib.blake2b(json.dumps(thaw_config(config), sort_keys=True, default=str).encode(),
+                           digest_size=16).hexdigest()
+
+
+def compute_dataframe_digest(df):
+    """Hash of a DataFrame's content: column names, dtypes (including tz), values and index."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([[str(col), str(df[col].dtype)] for col in df.columns]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def compute_source_fingerprint(*paths):
+    """
+    Hash of the Python sources at paths (files or package dirs, relative to the project root), computed once per
+    process. Cache keys include it, so editing the code that produced a stored result invalidates that result.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        full_path = os.path.join(PROJECT_ROOT, path)
+        if os.path.isfile(full_path):
+            file_paths = [full_path]
+        else:
+            file_paths = sorted(os.path.join(dir_path, name) for dir_path, _, names in os.walk(full_path)
+                                for name in names if name.endswith(".py"))
+        for file_path in file_paths:
+            digest.update(os.path.relpath(file_path, PROJECT_ROOT).replace(os.sep, "/").encode())
+            with open(file_path, "rb") as file:
+                digest.update(file.read())
+    return digest.hexdigest()
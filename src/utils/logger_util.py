@@ -7,18 +7,22 @@ def log_backtest_run_header(trading_symbol, interval, params):
     print(f"\n========== Backtest: {trading_symbol} {interval} {params['name']} {hyperparam_str} ==========")
 
 
+def log_backtest_batch_header(trading_symbol, interval, strategy_name, n_combos):
+    print(f"\n========== Backtest: {trading_symbol} {interval} {strategy_name} x{n_combos} (batched) ==========")
+
+
 def log_backtest_trade(event, trade, idx):
     # Print ENTRY/EXIT, with all params if present in trade
     pass
     # if event == TradeEvent.ENTRY.name:
     #     print(
-    #         f"🟢 [{trade['direction']}] Entry idx {idx} | {trade['entry_time']} @ {trade['entry_price']:.2f} | Qty={trade['qty']}")
+    #         f"🟢 [{trade.direction}] Entry idx {idx} | {trade.entry_time} @ {trade.entry_price:.2f} | Qty={trade.qty}")
     # else:
     #     print(
-    #         f"🔴 [{trade['direction']}] Exit idx {idx} | {trade['exit_time']} @ {trade['exit_price']:.2f} | "
-    #         f"P&L={trade.get('pnl', 0):.2f} | GrossPnL={trade.get('gross_pnl', 0):.2f} | "
-    #         f"Fee(Buy/Sell): {trade.get('fee_buy', 0):.2f}/{trade.get('fee_sell', 0):.2f} | "
-    #         f"Total Fee: {trade.get('total_fee', 0):.2f} | Reason: {trade['exit_reason']}"
+    #         f"🔴 [{trade.direction}] Exit idx {idx} | {trade.exit_time} @ {trade.exit_price:.2f} | "
+    #         f"P&L={trade.pnl:.2f} | GrossPnL={trade.gross_pnl:.2f} | "
+    #         f"Fee(Buy/Sell): {trade.fee_buy:.2f}/{trade.fee_sell:.2f} | "
+    #         f"Total Fee: {trade.total_fee:.2f} | Reason: {trade.exit_reason}"
     #     )
 
 
@@ -24,10 +24,10 @@ def generate_simulation_results(equity_curve, initial_capital, interval, split_d
 
 def compute_backtest_metrics(trades, equity_curve, initial_capital, df):
     # --- Core Returns ---
-    gross_pnl = sum([t.get('gross_pnl', 0) for t in trades])
-    total_fees = sum([t.get('total_fee', 0) for t in trades])
-    net_pnl = sum([t.get('pnl', 0) for t in trades])  # or gross_pnl - total_fees
-    final_equity = equity_curve[-1]['equity'] if equity_curve else initial_capital
+    gross_pnl = sum([t.gross_pnl for t in trades])
+    total_fees = sum([t.total_fee for t in trades])
+    net_pnl = sum([t.pnl for t in trades])  # or gross_pnl - total_fees
+    final_equity = equity_curve.final_equity if equity_curve else initial_capital
     equity_final = final_equity
     total_return = (final_equity - initial_capital) / initial_capital * 100
 
@@ -37,8 +37,8 @@ def compute_backtest_metrics(trades, equity_curve, initial_capital, df):
     cagr = ((final_equity / initial_capital) ** (1 / years)) - 1 if years > 0 else 0
 
     # --- Equity Series ---
-    eq_series = pd.Series([x['equity'] for x in equity_curve])
-    eq_curve = pd.DataFrame(equity_curve)
+    eq_series = pd.Series(equity_curve.equity)
+    eq_curve = equity_curve.to_frame()
     eq_curve['date'] = pd.to_datetime(eq_curve['date'])
     eq_curve.set_index('date', inplace=True)
     daily_eq = eq_curve['equity'].resample('1D').last().ffill()
@@ -64,22 +64,22 @@ def compute_backtest_metrics(trades, equity_curve, initial_capital, df):
     monthly_return_table = monthly_returns.to_dict()
 
     # --- Trades Metrics ---
-    wins = [t for t in trades if t['pnl'] > 0]
-    losses = [t for t in trades if t['pnl'] < 0]
+    wins = [t for t in trades if t.pnl > 0]
+    losses = [t for t in trades if t.pnl < 0]
     num_trades = len(trades)
     win_rate = len(wins) / num_trades * 100 if num_trades else 0
-    profit_factor = (sum([t['pnl'] for t in wins]) / abs(sum([t['pnl'] for t in losses]))) if losses else 0
-    avg_win = np.mean([t['pnl'] for t in wins]) if wins else 0
-    avg_loss = np.mean([t['pnl'] for t in losses]) if losses else 0
+    profit_factor = (sum([t.pnl for t in wins]) / abs(sum([t.pnl for t in losses]))) if losses else 0
+    avg_win = np.mean([t.pnl for t in wins]) if wins else 0
+    avg_loss = np.mean([t.pnl for t in losses]) if losses else 0
     expectancy = ((win_rate / 100) * avg_win + (1 - win_rate / 100) * avg_loss) if num_trades else 0
-    best_trade = max([t['pnl'] for t in trades], default=0)
-    worst_trade = min([t['pnl'] for t in trades], default=0)
-    median_trade = np.median([t['pnl'] for t in trades]) if trades else 0
+    best_trade = max([t.pnl for t in trades], default=0)
+    worst_trade = min([t.pnl for t in trades], default=0)
+    median_trade = np.median([t.pnl for t in trades]) if trades else 0
 
     # --- Holding Period Analysis ---
     holding_periods = [
-        (t['exit_time'] - t['entry_time']).total_seconds() / 60  # in minutes
-        for t in trades if t['exit_time'] and t['entry_time']
+        (t.exit_time - t.entry_time).total_seconds() / 60  # in minutes
+        for t in trades if t.exit_time and t.entry_time
     ]
     avg_holding = np.mean(holding_periods) if holding_periods else 0
     median_holding = np.median(holding_periods) if holding_periods else 0
@@ -87,8 +87,8 @@ def compute_backtest_metrics(trades, equity_curve, initial_capital, df):
     # --- Exposure: percent of bars in market ---
     bars_with_pos = 0
     for t in trades:
-        if t['entry_time'] and t['exit_time']:
-            bars = (t['exit_time'] - t['entry_time']).total_seconds() / (
+        if t.entry_time and t.exit_time:
+            bars = (t.exit_time - t.entry_time).total_seconds() / (
                 (df['date'].iloc[1] - df['date'].iloc[0]).total_seconds())
             bars_with_pos += bars if bars > 0 else 1
     exposure = (bars_with_pos / len(df)) * 100 if len(df) else 0
@@ -98,13 +98,13 @@ def compute_backtest_metrics(trades, equity_curve, initial_capital, df):
     curr = None
     streak = 0
     for t in trades:
-        if t['pnl'] > 0:
+        if t.pnl > 0:
             if curr == 'win':
                 streak += 1
             else:
                 streak = 1
                 curr = 'win'
-        elif t['pnl'] < 0:
+        elif t.pnl < 0:
             if curr == 'loss':
                 streak += 1
             else: